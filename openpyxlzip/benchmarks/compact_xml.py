@@ -0,0 +1,53 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+"""
+Save time and part sizes with and without compact XML for a workbook with
+many charts and drawings.
+
+    python -m openpyxlzip.benchmarks.compact_xml [sheets] [charts per sheet]
+"""
+from io import BytesIO
+from time import perf_counter
+from zipfile import ZipFile
+import sys
+
+from openpyxlzip import Workbook
+from openpyxlzip.chart import BarChart, LineChart, Reference
+
+
+def make_workbook(sheets, charts):
+    wb = Workbook()
+    wb.remove(wb.active)
+    for idx in range(sheets):
+        ws = wb.create_sheet()
+        for row in range(1, 101):
+            ws.append([row, row * 2, row * 3])
+        data = Reference(ws, min_col=1, min_row=1, max_col=3, max_row=100)
+        for n in range(charts):
+            chart = (BarChart if n % 2 else LineChart)()
+            chart.add_data(data)
+            ws.add_chart(chart, "E{0}".format(1 + n * 15))
+    return wb
+
+
+def save(sheets, charts, compact_xml):
+    wb = make_workbook(sheets, charts)
+    out = BytesIO()
+    start = perf_counter()
+    wb.save(out, compact_xml=compact_xml)
+    elapsed = perf_counter() - start
+    archive = ZipFile(out)
+    parts = sum(info.file_size for info in archive.infolist())
+    return elapsed, parts, len(out.getvalue())
+
+
+def main(sheets=20, charts=10):
+    print("Sheets: {0}, charts per sheet: {1}".format(sheets, charts))
+    for compact_xml in (False, True):
+        elapsed, parts, size = save(sheets, charts, compact_xml)
+        print("    compact_xml={0!s:<5}: {1:6.2f}s  parts {2:>10,d} bytes  zip {3:>9,d} bytes".format(
+            compact_xml, elapsed, parts, size))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,44 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+"""
+Cold start cost of importing the library and of the first schema lookup.
+
+Each run uses a fresh interpreter so that nothing is cached in memory.
+
+    python -m openpyxlzip.benchmarks.import_time [runs]
+"""
+import subprocess
+import sys
+
+
+IMPORT = "import openpyxlzip"
+LOOKUP = "from openpyxlzip.xml.schema import get_table; get_table('ROOT_ELEMS')"
+ALL_TABLES = "from openpyxlzip.xml.schema import get_table; get_table('ALL_DEFINITIONS')"
+
+
+def timed(statement, runs):
+    code = """
+from time import perf_counter
+start = perf_counter()
+{0}
+print(perf_counter() - start)
+""".format(statement)
+    times = []
+    for _ in range(runs):
+        out = subprocess.check_output([sys.executable, "-c", code])
+        times.append(float(out))
+    return min(times)
+
+
+def main(runs=10):
+    print("Runs: {0}, best of".format(runs))
+    for label, statement in [
+        ("import", IMPORT),
+        ("import + ROOT_ELEMS", "\n".join([IMPORT, LOOKUP])),
+        ("import + ALL_DEFINITIONS", "\n".join([IMPORT, ALL_TABLES])),
+        ]:
+        print("    {0:<26}: {1:6.3f}s".format(label, timed(statement, runs)))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
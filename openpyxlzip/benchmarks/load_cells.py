@@ -0,0 +1,73 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+"""
+Cells per second when loading a worksheet in normal and read-only mode,
+when reading only values and when only parsing the XML of the worksheet.
+
+    python -m openpyxlzip.benchmarks.load_cells [rows] [columns] [repeat]
+"""
+from io import BytesIO
+from time import perf_counter
+from zipfile import ZipFile
+import sys
+
+from openpyxlzip import Workbook, load_workbook
+from openpyxlzip.xml.functions import iterparse
+
+
+def make_workbook(rows, columns):
+    wb = Workbook()
+    ws = wb.active
+    for row in range(rows):
+        ws.append([row * col if col % 2 else "text" for col in range(columns)])
+    out = BytesIO()
+    wb.save(out, shared_strings=True)
+    return out
+
+
+def full_load(src):
+    wb = load_workbook(src)
+    return len(wb.active._cells)
+
+
+def read_only_load(src):
+    wb = load_workbook(src, read_only=True)
+    return sum(len(row) for row in wb.active.iter_rows())
+
+
+def values_only_load(src):
+    wb = load_workbook(src, read_only=True)
+    return sum(len(row) for row in wb.active.values)
+
+
+def xml_only(src):
+    archive = ZipFile(src)
+    cells = 0
+    with archive.open("xl/worksheets/sheet1.xml") as sheet:
+        for _, element in iterparse(sheet):
+            if element.tag.endswith("}c"):
+                cells += 1
+    return cells
+
+
+def main(rows=20000, columns=10, repeat=3):
+    src = make_workbook(rows, columns)
+    print("Rows: {0}, columns: {1}".format(rows, columns))
+    loads = [
+        ("full", full_load),
+        ("read-only", read_only_load),
+        ("values", values_only_load),
+        ("xml only", xml_only),
+    ]
+    for label, load in loads:
+        best = None
+        for _ in range(repeat):
+            start = perf_counter()
+            cells = load(src)
+            elapsed = perf_counter() - start
+            best = min(best or elapsed, elapsed)
+        print("    {0:<10}: {1:10,.0f} cells/s".format(label, cells / best))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
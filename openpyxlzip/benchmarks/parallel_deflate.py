@@ -0,0 +1,63 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+"""
+Time of compressing a large worksheet part with zlib and in blocks in a
+pool of threads. Rows have 50 columns, a tenth of them text.
+
+    python -m openpyxlzip.benchmarks.parallel_deflate [rows] [threads]
+"""
+from io import BytesIO
+from time import perf_counter
+import os
+import random
+import sys
+import zlib
+
+from openpyxlzip.packaging.deflate import parallel_deflate
+from openpyxlzip.utils import get_column_letter
+
+COLUMNS = 50
+
+
+def make_part(rows):
+    rng = random.Random(0)
+    letters = [get_column_letter(idx) for idx in range(1, COLUMNS + 1)]
+    out = BytesIO()
+    out.write(b'<worksheet><sheetData>')
+    for row in range(1, rows + 1):
+        cells = []
+        for idx, letter in enumerate(letters):
+            if idx % 10 == 0:
+                cells.append('<c r="{0}{1}" t="inlineStr"><is><t>text {2}</t></is></c>'.format(
+                    letter, row, rng.randint(0, 1000)))
+            else:
+                cells.append('<c r="{0}{1}" t="n"><v>{2}</v></c>'.format(
+                    letter, row, rng.random()))
+        out.write('<row r="{0}">{1}</row>'.format(row, "".join(cells)).encode())
+    out.write(b'</sheetData></worksheet>')
+    return out.getvalue()
+
+
+def serial(data):
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    return len(compressor.compress(data) + compressor.flush())
+
+
+def parallel(data, threads):
+    return sum(len(chunk) for chunk, crc, size in parallel_deflate(BytesIO(data), threads=threads))
+
+
+def main(rows=20000, threads=None):
+    threads = threads or os.cpu_count() or 1
+    data = make_part(rows)
+    print("Part: {0} rows, {1:.1f} MB, {2} threads".format(rows, len(data) / 2**20, threads))
+    for label, compress in [("zlib", serial),
+                            ("parallel", lambda data: parallel(data, threads))]:
+        start = perf_counter()
+        size = compress(data)
+        elapsed = perf_counter() - start
+        print("    {0:<9}: {1:6.2f}s, {2:6.1f} MB/s, {3:.1f} MB".format(
+            label, elapsed, len(data) / 2**20 / elapsed, size / 2**20))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
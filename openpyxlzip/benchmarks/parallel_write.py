@@ -0,0 +1,36 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+"""
+Save time of a multi-sheet workbook with worksheet rows written serially
+and in parallel.
+
+    python -m openpyxlzip.benchmarks.parallel_write [sheets] [rows] [workers]
+"""
+from io import BytesIO
+from time import perf_counter
+import sys
+
+from openpyxlzip import Workbook
+
+
+def make_workbook(sheets, rows):
+    wb = Workbook()
+    wb.remove(wb.active)
+    for idx in range(sheets):
+        ws = wb.create_sheet()
+        for row in range(rows):
+            ws.append([row, "text {0}".format(row), row * 0.5] + [row] * 7)
+    return wb
+
+
+def main(sheets=30, rows=5000, workers=4):
+    print("Sheets: {0}, rows per sheet: {1}".format(sheets, rows))
+    for label, count in [("serial", None), ("workers={0}".format(workers), workers)]:
+        wb = make_workbook(sheets, rows)
+        start = perf_counter()
+        wb.save(BytesIO(), workers=count)
+        print("    {0:<10}: {1:6.2f}s".format(label, perf_counter() - start))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
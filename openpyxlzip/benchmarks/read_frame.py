@@ -0,0 +1,57 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+"""
+Time and peak memory of reading a read-only worksheet into a DataFrame from
+`ws.values` and with `to_dataframe()`.
+
+    python -m openpyxlzip.benchmarks.read_frame [rows]
+"""
+from datetime import datetime, timedelta
+from io import BytesIO
+from time import perf_counter
+import sys
+import tracemalloc
+
+from pandas import DataFrame
+
+from openpyxlzip import Workbook, load_workbook
+from openpyxlzip.utils.dataframe import to_dataframe
+
+
+def make_workbook(rows):
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["id", "amount", "when", "category", "label"])
+    start = datetime(2020, 1, 1)
+    for row in range(rows):
+        ws.append([row, row * 0.25, start + timedelta(minutes=row),
+                   "cat {0}".format(row % 10), "label {0}".format(row % 1000)])
+    out = BytesIO()
+    wb.save(out, shared_strings=True)
+    return out
+
+
+def from_values(ws):
+    rows = ws.values
+    header = next(rows)
+    return DataFrame(list(rows), columns=header)
+
+
+def main(rows=100000):
+    src = make_workbook(rows)
+    print("Rows: {0}".format(rows))
+    for label, read in [("ws.values", from_values), ("to_dataframe", to_dataframe)]:
+        ws = load_workbook(src, read_only=True).active
+        start = perf_counter()
+        read(ws)
+        elapsed = perf_counter() - start
+        # memory is traced separately as tracing slows everything down
+        ws = load_workbook(src, read_only=True).active
+        tracemalloc.start()
+        read(ws)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print("    {0:<13}: {1:6.2f}s, peak {2:6.1f} MB".format(label, elapsed, peak / 2**20))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,47 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+"""
+Time of scattered cell lookups in a read-only worksheet with and without
+the row index.
+
+    python -m openpyxlzip.benchmarks.read_only_lookup [rows] [lookups]
+"""
+from io import BytesIO
+from random import Random
+from time import perf_counter
+import sys
+
+from openpyxlzip import Workbook, load_workbook
+
+
+def make_workbook(rows):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    for row in range(rows):
+        ws.append([row, "text {0}".format(row), row * 0.5])
+    out = BytesIO()
+    wb.save(out)
+    return out
+
+
+def main(rows=200000, lookups=20):
+    src = make_workbook(rows)
+    rng = Random(1)
+    targets = [rng.randint(1, rows) for _ in range(lookups)]
+    print("Rows: {0}, lookups: {1}".format(rows, lookups))
+    for label, use_index in [("no index", False), ("row index", True)]:
+        ws = load_workbook(src, read_only=True).active
+        ws.use_row_index = use_index
+        start = perf_counter()
+        ws.cell(row=rows, column=1)
+        first = perf_counter() - start
+        start = perf_counter()
+        for row in targets:
+            ws.cell(row=row, column=2)
+        per_lookup = (perf_counter() - start) / lookups
+        print("    {0:<10}: first {1:6.3f}s, then {2:8.4f}s per lookup".format(
+            label, first, per_lookup))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,38 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+"""
+Formulae tokenized per second by the scanning tokenizer.
+
+    python -m openpyxlzip.benchmarks.tokenize [formulae]
+"""
+from time import perf_counter
+import sys
+
+from openpyxlzip.formula.tokenizer import Tokenizer
+
+FORMULAE = [
+    "=SUM(B{0}:B{1})",
+    "=IF(A{0}>0,VLOOKUP(A{0},'Price list'!$A$2:$F$500,3,FALSE),\"\")",
+    "=Sheet2!C{0}*(1+$B$1)-D{0}/100",
+    "=IFERROR(INDEX(Data!$B:$B,MATCH($A{0},Data!$A:$A,0)),#N/A)",
+    "=SUMPRODUCT((Table1[Region]=\"North\")*(Table1[Sales]>{1}))",
+    "=ROUND(AVERAGE(C{0}:H{0}),2)&\" units\"",
+]
+
+
+def make_formulae(count):
+    return [FORMULAE[idx % len(FORMULAE)].format(idx + 2, idx + 100)
+            for idx in range(count)]
+
+
+def main(count=100000):
+    formulae = make_formulae(count)
+    print("Formulae: {0}".format(count))
+    start = perf_counter()
+    for formula in formulae:
+        Tokenizer(formula)
+    elapsed = perf_counter() - start
+    print("    {0:6.2f}s, {1:9.0f} formulae/s".format(elapsed, count / elapsed))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
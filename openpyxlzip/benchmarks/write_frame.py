@@ -0,0 +1,61 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+"""
+Time of writing a DataFrame to a write-only worksheet row by row from
+`dataframe_to_rows()` and with `ws.write_frame()`.
+
+    python -m openpyxlzip.benchmarks.write_frame [rows] [columns]
+"""
+from io import BytesIO
+from time import perf_counter
+import sys
+
+import numpy
+from pandas import DataFrame, date_range
+
+from openpyxlzip import Workbook
+from openpyxlzip.utils.dataframe import dataframe_to_rows
+
+
+def make_frame(rows, columns):
+    rng = numpy.random.default_rng(0)
+    data = {}
+    for idx in range(columns):
+        kind = idx % 4
+        if kind == 0:
+            values = rng.random(rows) * 1000
+        elif kind == 1:
+            values = rng.integers(0, 10**6, rows)
+        elif kind == 2:
+            values = date_range("2020-01-01", periods=rows, freq="min")
+        else:
+            values = numpy.array(["label {0}".format(v) for v in rng.integers(0, 100, rows)],
+                                 dtype=object)
+        data["col{0}".format(idx)] = values
+    return DataFrame(data)
+
+
+def from_rows(ws, df):
+    for row in dataframe_to_rows(df, index=False):
+        ws.append(row)
+
+
+def from_frame(ws, df):
+    ws.write_frame(df, index=False)
+
+
+def main(rows=20000, columns=20):
+    df = make_frame(rows, columns)
+    print("Cells: {0} x {1}".format(rows, columns))
+    for label, write in [("append", from_rows), ("write_frame", from_frame)]:
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        start = perf_counter()
+        write(ws, df)
+        wb.save(BytesIO())
+        elapsed = perf_counter() - start
+        print("    {0:<12}: {1:6.2f}s, {2:9.0f} cells/s".format(
+            label, elapsed, rows * columns / elapsed))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
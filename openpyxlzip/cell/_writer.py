@@ -7,22 +7,29 @@ from openpyxlzip.utils.datetime import to_excel, days_to_time
 from datetime import timedelta
 
 
-def _set_attributes(cell, styled=None):
+def _set_attributes(cell, styled=None, shared_strings=None):
     """
     Set coordinate and datatype
+
+    If a shared string table is passed, strings are added to it and the
+    index is returned as the value instead of writing them inline.
     """
     coordinate = cell.coordinate
     attrs = {'r': coordinate}
     if styled:
         attrs['s'] = f"{cell.style_id}"
 
+    value = cell._value
+
     if cell.data_type == "s":
-        attrs['t'] = "inlineStr"
+        if shared_strings is not None and value:
+            attrs['t'] = "s"
+            value = shared_strings.add(value)
+        else:
+            attrs['t'] = "inlineStr"
     elif cell.data_type != 'f':
         attrs['t'] = cell.data_type
 
-    value = cell._value
-
     if cell.data_type == "d":
         if cell.parent.parent.iso_dates:
             if isinstance(value, timedelta):
@@ -38,9 +45,9 @@ def _set_attributes(cell, styled=None):
     return value, attrs
 
 
-def etree_write_cell(xf, worksheet, cell, styled=None):
+def etree_write_cell(xf, worksheet, cell, styled=None, shared_strings=None):
 
-    value, attributes = _set_attributes(cell, styled)
+    value, attributes = _set_attributes(cell, styled, shared_strings)
 
     el = Element("c", attributes)
     if value is None or value == "":
@@ -54,7 +61,7 @@ def etree_write_cell(xf, worksheet, cell, styled=None):
             formula.text = value[1:]
             value = None
 
-    if cell.data_type == 's':
+    if attributes.get('t') == "inlineStr":
         inline_string = SubElement(el, 'is')
         text = SubElement(inline_string, 't')
         text.text = value
@@ -69,8 +76,8 @@ def etree_write_cell(xf, worksheet, cell, styled=None):
     xf.write(el)
 
 
-def lxml_write_cell(xf, worksheet, cell, styled=False):
-    value, attributes = _set_attributes(cell, styled)
+def lxml_write_cell(xf, worksheet, cell, styled=False, shared_strings=None):
+    value, attributes = _set_attributes(cell, styled, shared_strings)
 
     if value == '' or value is None:
         with xf.element("c", attributes):
@@ -84,7 +91,7 @@ def lxml_write_cell(xf, worksheet, cell, styled=False):
                     xf.write(value[1:])
                     value = None
 
-        if cell.data_type == 's':
+        if attributes.get('t') == "inlineStr":
             with xf.element("is"):
                 attrs = {}
                 if value != value.strip():
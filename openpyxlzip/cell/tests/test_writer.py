@@ -174,3 +174,28 @@ def test_whitespace(worksheet, write_cell_implementation):
     xml = out.getvalue()
     diff = compare_xml(xml, expected)
     assert diff is None, diff
+
+
+@pytest.mark.parametrize("value, expected",
+                         [
+                             ("Hello", """<c t="s" r="A1"><v>1</v></c>"""),
+                             ("World", """<c t="s" r="A1"><v>0</v></c>"""),
+                             ("", """<c r="A1" t="inlineStr"></c>"""),
+                             (5, """<c t="n" r="A1"><v>5</v></c>"""),
+                         ])
+def test_write_shared_string(worksheet, write_cell_implementation, value, expected):
+    from openpyxlzip.utils.indexed_list import IndexedList
+    write_cell = write_cell_implementation
+
+    ws = worksheet
+    cell = ws['A1']
+    cell.value = value
+    shared_strings = IndexedList(["World"])
+
+    out = BytesIO()
+    with xmlfile(out) as xf:
+        write_cell(xf, ws, cell, cell.has_style, shared_strings)
+
+    xml = out.getvalue()
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
@@ -124,3 +124,30 @@ def test_no_deprecation_reason():
         @deprecated
         def fn():
             return
+
+
+def test_zipfile_internals():
+    from io import BytesIO
+    from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED
+    from ..zipfile import RAW_WRITES, set_compresslevel
+    assert RAW_WRITES
+
+    out = BytesIO()
+    with ZipFile(out, "w", ZIP_DEFLATED) as archive:
+        info = ZipInfo("a.xml")
+        info.compress_type = ZIP_DEFLATED
+        set_compresslevel(info, 1)
+        with archive.open(info, "w") as dest:
+            dest.write(b"<a/>" * 100)
+    assert ZipFile(out).read("a.xml") == b"<a/>" * 100
+
+
+def test_create_archive(monkeypatch):
+    from .. import zipfile as compat
+    calls = []
+    monkeypatch.setattr(compat, "ZipFile", lambda *args, **kw: calls.append(kw))
+
+    compat.create_archive("a.xlsx")
+    compat.create_archive("a.xlsx", 1)
+    # compresslevel is only accepted from Python 3.7
+    assert calls == [{"allowZip64": True}, {"allowZip64": True, "compresslevel": 1}]
@@ -0,0 +1,116 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+"""
+The parts of zipfile that differ between versions of Python, and the
+private parts of zipfile.ZipFile that are used to read and write the
+compressed data of members directly. Nothing else uses them.
+
+The private parts are checked for once on import: where they are missing
+`RAW_WRITES` is False and members have to be written through the public
+interface.
+"""
+from contextlib import contextmanager
+from io import BytesIO
+import sys
+from zipfile import ZipFile, ZIP_DEFLATED
+
+WRITE_INTERNALS = (
+    "_lock",
+    "_writing",
+    "_seekable",
+    "_writecheck",
+    "_didModify",
+    "_allowZip64",
+    "start_dir",
+    "filelist",
+    "NameToInfo",
+)
+
+
+def _has_write_internals():
+    archive = ZipFile(BytesIO(), "w")
+    return all(hasattr(archive, name) for name in WRITE_INTERNALS)
+
+
+RAW_WRITES = sys.version_info >= (3, 6) and _has_write_internals()
+
+
+if sys.version_info >= (3, 13):
+
+    def set_compresslevel(info, level):
+        """
+        Set the level used to compress a member written with ZipFile.open()
+        """
+        info.compress_level = level
+
+elif sys.version_info >= (3, 7):
+
+    def set_compresslevel(info, level):
+        """
+        Set the level used to compress a member written with ZipFile.open()
+        """
+        info._compresslevel = level
+
+else:
+
+    def set_compresslevel(info, level):
+        """
+        Compression levels cannot be set before Python 3.7
+        """
+
+
+def create_archive(file, compresslevel=None):
+    """
+    Open a deflated archive for writing. The compression level can only be
+    passed from Python 3.7 so it is left out unless it is set.
+    """
+    kw = {}
+    if compresslevel is not None:
+        kw["compresslevel"] = compresslevel
+    return ZipFile(file, "w", ZIP_DEFLATED, allowZip64=True, **kw)
+
+
+def get_compresslevel(archive):
+    """
+    Return the compression level of an archive, None for the default
+    """
+    return getattr(archive, "compresslevel", None)
+
+
+def lock(archive):
+    """
+    Return the lock that guards the position of the archive's file
+    """
+    return archive._lock
+
+
+def is_seekable(archive):
+    return archive._seekable
+
+
+def allows_zip64(archive):
+    return archive._allowZip64
+
+
+@contextmanager
+def appending(archive, zinfo):
+    """
+    Add a member to an archive open for writing whose data is written
+    directly to the file that is returned. The member is recorded in the
+    central directory when the block is left.
+    """
+    if not RAW_WRITES:
+        raise NotImplementedError("Members cannot be written directly on this version of Python")
+    with archive._lock:
+        if archive._writing:
+            raise ValueError("Can't write to ZIP archive while an open writing handle exists")
+        fp = archive.fp
+        if archive._seekable:
+            fp.seek(archive.start_dir)
+        zinfo.header_offset = fp.tell()
+        archive._writecheck(zinfo)
+        archive._didModify = True
+        yield fp
+        archive.filelist.append(zinfo)
+        archive.NameToInfo[zinfo.filename] = zinfo
+        archive.start_dir = fp.tell()
@@ -28,7 +28,6 @@ from openpyxlzip.xml.constants import (
     X15AC_NS,
     MC_NS,
 )
-from openpyxlzip.xml.schema import ALL_DEFINITIONS, ROOT_ELEMS, ROOT_NAMESPACES, ALL_NAMESPACES_PREFIXES
 
 seq_types = (list, tuple)
 TOP_LEVEL_NSMAP_TYPES = set(["workbook", "worksheet", "table", "styleSheet", "datastoreItem", "externalLink", "wsDr", "coreProperties"])
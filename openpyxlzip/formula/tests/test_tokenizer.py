@@ -684,3 +684,27 @@ class TestToken(object):
                   for token in tok.items]
         assert result == tokens
         assert tok.render() == formula
+
+
+def test_golden_tokens(tokenizer, datadir):
+    """
+    Formulae from the test files, randomly generated valid formulae with
+    nested functions, arrays, structured references and numbers in
+    scientific notation, and a few malformed ones, with the tokens that the
+    character by character tokenizer produced before it was replaced by the
+    scanner
+    """
+    import json
+    datadir.chdir()
+    with open("tokens.json", encoding="utf-8") as src:
+        golden = json.load(src)
+
+    for formula, expected in golden:
+        try:
+            tok = tokenizer.Tokenizer(formula)
+        except Exception as e:
+            assert type(e).__name__ == expected, formula
+        else:
+            result = [[token.value, token.type, token.subtype]
+                      for token in tok.items]
+            assert result == expected, formula
@@ -237,3 +237,84 @@ class TestTranslator(object):
         trans = Translator("='Summary slices'!C3", "A1")
         result = trans.translate_formula(row_delta=2, col_delta=3)
         assert result == "='Summary slices'!F5"
+
+
+    @pytest.mark.parametrize("test_str", [
+        "Sheet1!A1:B$2",
+        "'Sh 1'!$1:3",
+        "a:$C",
+        "A1:name:C$3",
+        "named_range",
+        "Sheet1!named_range",
+        "XFD1048576",
+    ])
+    def test_compile_range(self, Translator, TranslatorError, test_str):
+        template = Translator.compile_range(test_str)
+        for rdelta, cdelta in [(0, 0), (3, 2), (-1, 0), (0, -1), (1, 1)]:
+            try:
+                value = Translator.translate_range(test_str, rdelta, cdelta)
+            except TranslatorError:
+                with pytest.raises(TranslatorError):
+                    Translator.expand(template, rdelta, cdelta)
+            else:
+                assert Translator.expand(template, rdelta, cdelta) == value
+
+
+    def test_compile(self, Translator):
+        trans = Translator("=SUM(A1:$B2)*C$1", "A1")
+        assert trans.compile() == [
+            (None, "=SUM("), ("col", 1), ("row", 1), (None, ":$B"), ("row", 2),
+            (None, ")*"), ("col", 3), (None, "$1"),
+        ]
+
+
+    def test_template_reused(self, Translator):
+        trans = Translator("=A1+$B1", "C1")
+        assert trans.translate_formula("C2") == "=A2+$B2"
+        template = trans.template
+        assert trans.translate_formula("D5") == "=B5+$B5"
+        assert trans.template is template
+
+
+    @staticmethod
+    def insert_two_at_3(first, last):
+        # rows or columns 3 and 4 inserted, 6 deleted
+        move = lambda idx: idx < 3 and idx or idx < 6 and idx + 2 or idx + 1
+        if first == last == 6:
+            return None
+        if last == 6:
+            last = 5
+        if first == 6:
+            first = 7
+        return move(first), move(last)
+
+
+    @pytest.mark.parametrize("test_str, rows, cols, value", [
+        ("A1", True, False, "A1"),
+        ("A3", True, False, "A5"),
+        ("$B$5", True, False, "$B$7"),
+        ("A1:A5", True, False, "A1:A7"),
+        ("A5:A1", True, False, "A7:A1"),
+        ("A3:B6", True, False, "A5:B7"),
+        ("A6", True, False, "#REF!"),
+        ("C1", False, True, "E1"),
+        ("F1:F3", False, True, "#REF!"),
+        ("B:F", False, True, "B:G"),
+        ("B:F", True, False, "B:F"),
+        ("3:$6", True, False, "5:$7"),
+        ("Sheet!A3", True, False, "Sheet!A5"),
+        ("'Sheet'!A6", True, False, "'Sheet'!#REF!"),
+        ("Other!A3", True, False, "Other!A3"),
+        ("named_range", True, False, "named_range"),
+        ("A3:named_range", True, False, "A3:named_range"),
+    ])
+    def test_remap_range(self, Translator, test_str, rows, cols, value):
+        move = self.insert_two_at_3
+        assert Translator.remap_range(test_str, rows and move or None,
+                                      cols and move or None, "Sheet") == value
+
+
+    def test_remap_formula(self, Translator):
+        formula = '=SUM(A1:A5)+VLOOKUP("A3",A6:B9,2)*$C$3'
+        value = Translator.remap_formula(formula, rows=self.insert_two_at_3)
+        assert value == '=SUM(A1:A7)+VLOOKUP("A3",A8:B10,2)*$C$5'
@@ -42,6 +42,21 @@ class Tokenizer(object):
                    "#NUM!", "#N/A", "#GETTING_DATA")
     TOKEN_ENDERS = ',;}) +-*/^&=><%'  # Each of these characters, marks the
                                        # end of an operand token
+    # Runs of characters that are only added to the current token
+    PLAIN_RE = re.compile(r"[^\"'\[# \n+\-*/^&=><%{()};,]+")
+    BRACKETS_RE = re.compile(r"[\[\]]")
+    CONSUMERS = (
+        ('"\'', '_parse_string'),
+        ('[', '_parse_brackets'),
+        ('#', '_parse_error'),
+        (' \n', '_parse_whitespace'),
+        ('+-*/^&=><%', '_parse_operator'),
+        ('{(', '_parse_opener'),
+        (')}', '_parse_closer'),
+        (';,', '_parse_separator'),
+    )
+    # maps chars to the specific parsing method
+    DISPATCHER = dict((char, name) for chars, name in CONSUMERS for char in chars)
 
     def __init__(self, formula):
         self.formula = formula
@@ -63,33 +78,23 @@ class Tokenizer(object):
         else:
             self.items.append(Token(self.formula, Token.LITERAL))
             return
-        consumers = (
-            ('"\'', self._parse_string),
-            ('[', self._parse_brackets),
-            ('#', self._parse_error),
-            (' ', self._parse_whitespace),
-            ('\n', self._parse_whitespace),
-            ('+-*/^&=><%', self._parse_operator),
-            ('{(', self._parse_opener),
-            (')}', self._parse_closer),
-            (';,', self._parse_separator),
-        )
-        dispatcher = {}  # maps chars to the specific parsing function
-        for chars, consumer in consumers:
-            dispatcher.update(dict.fromkeys(chars, consumer))
-        while self.offset < len(self.formula):
+        formula = self.formula
+        size = len(formula)
+        plain = self.PLAIN_RE.match
+        dispatcher = self.DISPATCHER
+        while self.offset < size:
+            # skip to the next interesting character
+            match = plain(formula, self.offset)
+            if match is not None:
+                self.token.extend(match.group())
+                self.offset = match.end()
+                continue
             if self.check_scientific_notation():  # May consume one character
                 continue
-            curr_char = self.formula[self.offset]
-            if curr_char in self.TOKEN_ENDERS:
+            curr_char = formula[self.offset]
+            if self.token and curr_char in self.TOKEN_ENDERS:
                 self.save_token()
-            if curr_char in dispatcher:
-                self.offset += dispatcher[curr_char]()
-            else:
-                # TODO: this can probably be sped up using a regex to get to
-                # the next interesting character
-                self.token.append(curr_char)
-                self.offset += 1
+            self.offset += getattr(self, dispatcher[curr_char])()
         self.save_token()
 
     def _parse_string(self):
@@ -109,7 +114,7 @@ class Tokenizer(object):
         delim = self.formula[self.offset]
         assert delim in ('"', "'")
         regex = self.STRING_REGEXES[delim]
-        match = regex.match(self.formula[self.offset:])
+        match = regex.match(self.formula, self.offset)
         if match is None:
             subtype = "string" if delim == '"' else 'link'
             raise TokenizerError(f"Reached end of formula while parsing {subtype} in {self.formula}")
@@ -129,18 +134,12 @@ class Tokenizer(object):
 
         """
         assert self.formula[self.offset] == '['
-        lefts = [(t.start(), 1) for t in
-                 re.finditer(r"\[", self.formula[self.offset:])]
-        rights = [(t.start(), -1) for t in
-                  re.finditer(r"\]", self.formula[self.offset:])]
-
         open_count = 0
-        for idx, open_close in sorted(lefts + rights):
-            open_count += open_close
+        for bracket in self.BRACKETS_RE.finditer(self.formula, self.offset):
+            open_count += bracket.group() == "[" and 1 or -1
             if open_count == 0:
-                outer_right = idx + 1
-                self.token.append(
-                    self.formula[self.offset:self.offset + outer_right])
+                outer_right = bracket.end() - self.offset
+                self.token.append(self.formula[self.offset:bracket.end()])
                 return outer_right
 
         raise TokenizerError(f"Encountered unmatched '[' in {self.formula}")
@@ -155,9 +154,8 @@ class Tokenizer(object):
         """
         self.assert_empty_token(can_follow='!')
         assert self.formula[self.offset] == '#'
-        subformula = self.formula[self.offset:]
         for err in self.ERROR_CODES:
-            if subformula.startswith(err):
+            if self.formula.startswith(err, self.offset):
                 self.items.append(Token.make_operand(''.join(self.token) + err))
                 del self.token[:]
                 return len(err)
@@ -172,7 +170,7 @@ class Tokenizer(object):
         """
         assert self.formula[self.offset] in (' ', '\n')
         self.items.append(Token(self.formula[self.offset], Token.WSPACE))
-        return self.WSPACE_RE.match(self.formula[self.offset:]).end()
+        return self.WSPACE_RE.match(self.formula, self.offset).end() - self.offset
 
     def _parse_operator(self):
         """
@@ -365,6 +363,8 @@ class Token(object):
     LOGICAL = 'LOGICAL'
     ERROR = 'ERROR'
     RANGE = 'RANGE'
+    # operands starting with these can only be references or names
+    REFERENCE_START = frozenset("$'_ABCDEFGHJKLMOPQRSTUVWXYZabcdefghjklmopqrstuvwxyz")
 
     def __repr__(self):
         return u"{0} {1} {2}:".format(self.type, self.subtype, self.value)
@@ -378,6 +378,8 @@ class Token(object):
             subtype = cls.ERROR
         elif value in ('TRUE', 'FALSE'):
             subtype = cls.LOGICAL
+        elif value[0] in cls.REFERENCE_START:
+            subtype = cls.RANGE
         else:
             try:
                 float(value)
@@ -425,7 +427,7 @@ class Token(object):
         assert self.type in (self.FUNC, self.ARRAY, self.PAREN)
         assert self.subtype == self.OPEN
         value = "}" if self.type == self.ARRAY else ")"
-        return self.make_subexp(value, func=self.type == self.FUNC)
+        return Token(value, self.type, self.CLOSE)
 
     # Separator tokens
     #
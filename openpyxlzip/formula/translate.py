@@ -15,6 +15,11 @@ from openpyxlzip.utils import (
     get_column_letter
 )
 
+# kinds of the relative references in a template
+ROW = "row"
+COL = "col"
+
+
 class TranslatorError(Exception):
     """
     Raised when a formula can't be translated across cells.
@@ -48,6 +53,7 @@ class Translator(object):
         # formulae stored in the workbook must be in A1 notation.
         self.row, self.col = coordinate_to_tuple(origin)
         self.tokenizer = Tokenizer(formula)
+        self.template = None
 
     def get_tokens(self):
         "Returns a list with the tokens comprising the formula."
@@ -133,6 +139,163 @@ class Translator(object):
         return (ws_part + cls.translate_col(match.group(1), cdelta)
                 + cls.translate_row(match.group(2), rdelta))
 
+    @classmethod
+    def remap_range(cls, range_str, rows=None, cols=None, sheet=None):
+        """
+        Move a reference with the rows and columns it refers to.
+
+        `rows` and `cols` are called with the first and last index of the
+        span of rows or columns of the reference and return the span they
+        have been moved to, or None if they have all been deleted, which
+        turns the reference into #REF!. Absolute references are moved too.
+        References qualified by the name of a worksheet other than `sheet`,
+        and named ranges, are returned unchanged.
+        """
+        ws_part, ref = cls.strip_ws_name(range_str)
+        if ws_part and ws_part[:-1].strip("'").replace("''", "'") != sheet:
+            return range_str
+
+        match = cls.ROW_RANGE_RE.match(ref)  # e.g. `3:4`
+        if match is not None:
+            ends = cls._remap_span(rows, match.groups(), int, str)
+            return ends and ws_part + ":".join(ends) or ws_part + "#REF!"
+        match = cls.COL_RANGE_RE.match(ref)  # e.g. `A:BC`
+        if match is not None:
+            ends = cls._remap_span(cols, match.groups(),
+                                   column_index_from_string, get_column_letter)
+            return ends and ws_part + ":".join(ends) or ws_part + "#REF!"
+
+        pieces = [cls.CELL_REF_RE.match(piece) for piece in ref.split(":")]
+        if len(pieces) > 2 or None in pieces:
+            return range_str # named ranges and chained references
+        col_ends = cls._remap_span(cols, [m.group(1) for m in pieces],
+                                   column_index_from_string, get_column_letter)
+        row_ends = cls._remap_span(rows, [m.group(2) for m in pieces], int, str)
+        if not (col_ends and row_ends):
+            return ws_part + "#REF!"
+        return ws_part + ":".join(c + r for c, r in zip(col_ends, row_ends))
+
+    @staticmethod
+    def _remap_span(move, ends, parse, format):
+        """
+        Move the ends of a span of rows or columns, keeping their `$` markers.
+        Returns None if the span has been deleted.
+        """
+        if move is None:
+            return ends
+        idx = [parse(end.lstrip("$")) for end in ends]
+        span = move(min(idx), max(idx))
+        if span is None:
+            return None
+        if idx[0] > idx[-1]:
+            span = span[::-1]
+        return [(end.startswith("$") and "$" or "") + format(value)
+                for end, value in zip(ends, (span[0], span[-1]))]
+
+    @classmethod
+    def remap_formula(cls, formula, rows=None, cols=None, sheet=None):
+        """
+        Update the references of a formula after rows or columns have been
+        inserted or deleted, as described for `remap_range()`
+        """
+        tokens = Tokenizer(formula).items
+        if not tokens or tokens[0].type == Token.LITERAL:
+            return formula
+        out = ["="]
+        for token in tokens:
+            if (token.type == Token.OPERAND
+                and token.subtype == Token.RANGE):
+                out.append(cls.remap_range(token.value, rows, cols, sheet))
+            else:
+                out.append(token.value)
+        return "".join(out)
+
+    @classmethod
+    def compile_range(cls, range_str):
+        """
+        Split a range reference like `translate_range()` into the parts of a
+        template. Text is kept as it is, relative rows are marked `ROW` and
+        relative columns `COL` with their indices.
+        """
+        ws_part, range_str = cls.strip_ws_name(range_str)
+        parts = [(None, ws_part)]
+        match = cls.ROW_RANGE_RE.match(range_str)
+        if match is not None:
+            parts.extend([cls._compile_row(match.group(1)), (None, ":"),
+                          cls._compile_row(match.group(2))])
+            return parts
+        match = cls.COL_RANGE_RE.match(range_str)
+        if match is not None:
+            parts.extend([cls._compile_col(match.group(1)), (None, ":"),
+                          cls._compile_col(match.group(2))])
+            return parts
+        if ':' in range_str:
+            for idx, piece in enumerate(range_str.split(':')):
+                if idx:
+                    parts.append((None, ":"))
+                parts.extend(cls.compile_range(piece))
+            return parts
+        match = cls.CELL_REF_RE.match(range_str)
+        if match is None:  # Must be a named range
+            return [(None, range_str)]
+        parts.extend([cls._compile_col(match.group(1)),
+                      cls._compile_row(match.group(2))])
+        return parts
+
+    @staticmethod
+    def _compile_row(row_str):
+        if row_str.startswith('$'):
+            return None, row_str
+        return ROW, int(row_str)
+
+    @staticmethod
+    def _compile_col(col_str):
+        if col_str.startswith('$'):
+            return None, col_str
+        return COL, column_index_from_string(col_str)
+
+    def compile(self):
+        """
+        Return the template of the formula, with the text between relative
+        references joined together
+        """
+        parts = [(None, '=')]
+        for token in self.get_tokens():
+            if (token.type == Token.OPERAND
+                and token.subtype == Token.RANGE):
+                parts.extend(self.compile_range(token.value))
+            else:
+                parts.append((None, token.value))
+
+        template = []
+        for kind, value in parts:
+            if kind is None and template and template[-1][0] is None:
+                template[-1] = (None, template[-1][1] + value)
+            else:
+                template.append((kind, value))
+        return template
+
+    @staticmethod
+    def expand(template, row_delta, col_delta):
+        """
+        Fill in the references of a template moved by the given offsets
+        """
+        out = []
+        for kind, value in template:
+            if kind is None:
+                out.append(value)
+            elif kind is ROW:
+                value += row_delta
+                if value <= 0:
+                    raise TranslatorError("Formula out of range")
+                out.append(str(value))
+            else:
+                try:
+                    out.append(get_column_letter(value + col_delta))
+                except ValueError:
+                    raise TranslatorError("Formula out of range")
+        return "".join(out)
+
     def translate_formula(self, dest=None, row_delta=0, col_delta=0):
         """
         Convert the formula into A1 notation, or as row and column coordinates
@@ -146,7 +309,6 @@ class Translator(object):
             return ""
         elif tokens[0].type == Token.LITERAL:
             return tokens[0].value
-        out = ['=']
         # per the spec:
         # A compliant producer or consumer considers a defined name in the
         # range A1-XFD1048576 to be an error. All other names outside this
@@ -156,11 +318,7 @@ class Translator(object):
             row, col = coordinate_to_tuple(dest)
             row_delta = row - self.row
             col_delta = col - self.col
-        for token in tokens:
-            if (token.type == Token.OPERAND
-                and token.subtype == Token.RANGE):
-                out.append(self.translate_range(token.value, row_delta,
-                                                col_delta))
-            else:
-                out.append(token.value)
-        return "".join(out)
+        # shared formulae are translated to every cell they are filled into
+        if self.template is None:
+            self.template = self.compile()
+        return self.expand(self.template, row_delta, col_delta)
@@ -0,0 +1,136 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+"""
+Compress large parts in independent blocks in a pool of threads.
+
+Each block is deflated on its own, primed with the last 32 KB of the block
+before it, and all but the last block end with a sync flush so that they
+end on a byte boundary. The blocks are then simply concatenated into a
+single raw DEFLATE stream. The CRC-32 of each block is calculated in the
+same thread and the checksums are combined afterwards. zlib releases the
+GIL while it works, so the blocks are compressed in parallel.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import os
+import zlib
+
+# size of the uncompressed blocks
+BLOCK_SIZE = 1024 * 1024
+# size of the window of DEFLATE
+WINDOW_SIZE = 32 * 1024
+# parts of at least this size are compressed in parallel
+PARALLEL_SIZE = 32 * 1024 * 1024
+
+
+def _times(matrix, vector):
+    """
+    Multiply a GF(2) matrix, given as a list of columns, with a vector
+    """
+    total = 0
+    idx = 0
+    while vector:
+        if vector & 1:
+            total ^= matrix[idx]
+        vector >>= 1
+        idx += 1
+    return total
+
+
+def _square(matrix):
+    return [_times(matrix, column) for column in matrix]
+
+
+def crc32_operator(length):
+    """
+    Return the matrix that advances a CRC-32 over `length` zero bytes
+    """
+    # a single zero bit
+    operator = [0xEDB88320] + [1 << n for n in range(31)]
+    for _ in range(3):
+        operator = _square(operator)
+
+    result = None
+    while length:
+        if length & 1:
+            if result is None:
+                result = operator
+            else:
+                result = [_times(operator, column) for column in result]
+        length >>= 1
+        if length:
+            operator = _square(operator)
+    return result
+
+
+def crc32_combine(crc1, crc2, length2, operator=None):
+    """
+    Return the CRC-32 of two pieces of data from their checksums and the
+    length of the second piece, like zlib's `crc32_combine()`
+    """
+    if not length2:
+        return crc1
+    if operator is None:
+        operator = crc32_operator(length2)
+    return _times(operator, crc1) ^ crc2
+
+
+def _deflate_block(level, data, dictionary, last):
+    if dictionary:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15, zdict=dictionary)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    flush = last and zlib.Z_FINISH or zlib.Z_SYNC_FLUSH
+    compressed = compressor.compress(data) + compressor.flush(flush)
+    return compressed, zlib.crc32(data), len(data)
+
+
+def _blocks(src, block_size):
+    """
+    Yield blocks read from `src` with the end of the block before each and
+    whether it is the last one
+    """
+    previous = b""
+    block = src.read(block_size)
+    while True:
+        following = src.read(block_size)
+        yield block, previous[-WINDOW_SIZE:], not following
+        if not following:
+            break
+        previous, block = block, following
+
+
+def parallel_deflate(src, level=None, block_size=BLOCK_SIZE, threads=None):
+    """
+    Read `src` to the end and yield it as raw DEFLATE data in chunks, each
+    with the CRC-32 and size of the uncompressed data so far
+    """
+    if level is None:
+        level = zlib.Z_DEFAULT_COMPRESSION
+    if threads is None:
+        threads = os.cpu_count() or 1
+    deflate = partial(_deflate_block, level)
+    operator = crc32_operator(block_size)
+    crc = 0
+    size = 0
+
+    with ThreadPoolExecutor(threads) as pool:
+        pending = []
+        blocks = _blocks(src, block_size)
+        while True:
+            # keep every thread busy without reading the whole part
+            for block, dictionary, last in blocks:
+                pending.append(pool.submit(deflate, block, dictionary, last))
+                if len(pending) >= 2 * threads:
+                    break
+            if not pending:
+                break
+
+            compressed, block_crc, length = pending.pop(0).result()
+            if length == block_size:
+                crc = crc32_combine(crc, block_crc, length, operator)
+            else:
+                crc = crc32_combine(crc, block_crc, length)
+            size += length
+            yield compressed, crc, size
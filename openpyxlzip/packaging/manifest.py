@@ -8,7 +8,6 @@ import os.path
 
 from openpyxlzip.descriptors.serialisable import Serialisable
 from openpyxlzip.descriptors import String, Sequence
-from openpyxlzip.xml import LXML
 from openpyxlzip.xml.functions import fromstring
 from openpyxlzip.xml.constants import (
     ARC_CORE,
@@ -38,7 +37,8 @@ from openpyxlzip.xml.constants import (
     CTRL,
     VBA,
 )
-from openpyxlzip.xml.functions import tostring
+from openpyxlzip.xml.functions import tostring_part
+from openpyxlzip.packaging.parts import PartIndex
 
 # initialise mime-types
 mimetypes = MimeTypes()
@@ -184,25 +184,25 @@ class Manifest(Serialisable):
         self.Override.append(ct)
 
 
-    def _write(self, archive, workbook):
+    def _write(self, archive, workbook, compact_xml=False, parts=None):
         """
-        Write manifest to the archive
+        Write manifest to the archive. `parts` is the index of the parts
+        already in the archive, if the writer keeps one.
         """
         self.append(workbook)
         self._write_vba(workbook)
-        self._register_mimetypes(filenames=archive.namelist())
-        if LXML:
-            archive.writestr(self.path, tostring(self.to_tree(), pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True))
-        else:
-            archive.writestr(self.path, tostring(self.to_tree()))
+        if parts is None:
+            parts = PartIndex(archive)
+        self._register_mimetypes(filenames=parts)
+        archive.writestr(self.path, tostring_part(self.to_tree(), compact_xml))
 
 
     def _register_mimetypes(self, filenames):
         """
         Make sure that the mime type for all file extensions is registered
         """
-        for fn in filenames:
-            ext = os.path.splitext(fn)[-1]
+        exts = dict.fromkeys(os.path.splitext(fn)[-1] for fn in filenames)
+        for ext in exts:
             if not ext:
                 continue
             mime = mimetypes.types_map[True][ext]
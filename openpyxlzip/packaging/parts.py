@@ -0,0 +1,265 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+"""
+Parts of a source package that are preserved unchanged when saving
+"""
+from copy import copy
+import struct
+import zlib
+from zipfile import (
+    ZipInfo,
+    ZIP_STORED,
+    ZIP_DEFLATED,
+    ZIP64_LIMIT,
+    BadZipFile,
+)
+
+from openpyxlzip.compat.zipfile import (
+    RAW_WRITES,
+    allows_zip64,
+    appending,
+    is_seekable,
+    lock,
+)
+
+LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+LOCAL_HEADER_SIGNATURE = b"PK\003\004"
+COMPRESSION_OPTION_FLAGS = 0x06
+DATA_DESCRIPTOR_FLAG = 0x08
+DATA_DESCRIPTOR_SIGNATURE = b"PK\007\010"
+CHUNK_SIZE = 64 * 1024
+
+
+class PartIndex(object):
+
+    """
+    Index of the parts in an archive.
+
+    The index keeps the order of the archive and supports constant time
+    membership tests. Parts written to the archive after the index was
+    created are added when it is next used, each of them only once, so a
+    single index can be kept for as long as the archive is open.
+    """
+
+    def __init__(self, archive):
+        self.archive = archive
+        self._names = {}
+        self._seen = 0
+
+
+    def _update(self):
+        infos = self.archive.infolist()
+        if len(infos) > self._seen:
+            for info in infos[self._seen:]:
+                self._names[info.filename] = None
+            self._seen = len(infos)
+
+
+    def __contains__(self, name):
+        self._update()
+        return name in self._names
+
+
+    def __iter__(self):
+        self._update()
+        return iter(list(self._names))
+
+
+    def __len__(self):
+        self._update()
+        return len(self._names)
+
+
+def data_offset(archive, info):
+    """
+    Return the position of the compressed data of a member in the archive
+    """
+    fp = archive.fp
+    with lock(archive):
+        fp.seek(info.header_offset)
+        header = fp.read(LOCAL_HEADER.size)
+    fields = LOCAL_HEADER.unpack(header)
+    if fields[0] != LOCAL_HEADER_SIGNATURE:
+        raise BadZipFile("Bad magic number for file header")
+    name_length, extra_length = fields[-2:]
+    return info.header_offset + LOCAL_HEADER.size + name_length + extra_length
+
+
+def read_raw(archive, info):
+    """
+    Return the compressed data of a member without decompressing it
+    """
+    start = data_offset(archive, info)
+    with lock(archive):
+        archive.fp.seek(start)
+        return archive.fp.read(info.compress_size)
+
+
+def iter_raw(archive, info, offset=0, chunk_size=CHUNK_SIZE):
+    """
+    Yield the compressed data of a member in chunks, starting at `offset`
+    """
+    start = data_offset(archive, info)
+    while offset < info.compress_size:
+        size = min(chunk_size, info.compress_size - offset)
+        with lock(archive):
+            archive.fp.seek(start + offset)
+            data = archive.fp.read(size)
+        if not data:
+            raise BadZipFile("Truncated data for member {0!r}".format(info.filename))
+        offset += len(data)
+        yield data
+
+
+def write_raw(archive, info, data, arcname=None):
+    """
+    Add already compressed member data to an archive open for writing
+    """
+    zinfo = ZipInfo(arcname or info.filename, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.flag_bits = info.flag_bits & COMPRESSION_OPTION_FLAGS
+    zinfo.external_attr = info.external_attr
+    zinfo.CRC = info.CRC
+    zinfo.compress_size = info.compress_size
+    zinfo.file_size = info.file_size
+    zip64 = zinfo.file_size > ZIP64_LIMIT or zinfo.compress_size > ZIP64_LIMIT
+
+    with appending(archive, zinfo) as fp:
+        fp.write(zinfo.FileHeader(zip64))
+        fp.write(data)
+
+
+def write_deflated(archive, zinfo, chunks):
+    """
+    Add member data that has been deflated elsewhere to an archive open for
+    writing. `chunks` yields the compressed data with the CRC-32 and size of
+    the uncompressed data so far. The local header is updated afterwards or
+    followed by a data descriptor if the archive cannot seek.
+    """
+    zinfo.compress_type = ZIP_DEFLATED
+    zinfo.CRC = zinfo.compress_size = 0
+    zip64 = allows_zip64(archive) and zinfo.file_size * 1.05 > ZIP64_LIMIT
+    seekable = is_seekable(archive)
+    if not seekable:
+        zinfo.flag_bits |= DATA_DESCRIPTOR_FLAG
+
+    with appending(archive, zinfo) as fp:
+        fp.write(zinfo.FileHeader(zip64))
+
+        for data, crc, size in chunks:
+            fp.write(data)
+            zinfo.compress_size += len(data)
+            zinfo.CRC = crc
+            zinfo.file_size = size
+
+        if not zip64 and max(zinfo.file_size, zinfo.compress_size) > ZIP64_LIMIT:
+            raise RuntimeError("File size too large for the local header")
+        if seekable:
+            end = fp.tell()
+            fp.seek(zinfo.header_offset)
+            fp.write(zinfo.FileHeader(zip64))
+            fp.seek(end)
+        else:
+            fmt = zip64 and "<4sLQQ" or "<4sLLL"
+            fp.write(struct.pack(fmt, DATA_DESCRIPTOR_SIGNATURE, zinfo.CRC,
+                                 zinfo.compress_size, zinfo.file_size))
+
+
+class PartStore:
+
+    """
+    Members of the source archive that need to be written back on save.
+
+    Parts are referenced by name and copied into the new archive with their
+    original compressed data. While the source archive is open nothing is
+    buffered; `detach()` keeps the compressed data in memory so that the
+    source can be closed.
+    """
+
+    def __init__(self, archive):
+        self.archive = archive
+        self._parts = {}
+        self._data = {}
+
+
+    def add(self, name):
+        if name not in self._parts:
+            self._parts[name] = self.archive.getinfo(name)
+
+
+    def __contains__(self, name):
+        return name in self._parts
+
+
+    def __iter__(self):
+        return iter(self._parts)
+
+
+    def namelist(self):
+        return list(self._parts)
+
+
+    @property
+    def closed(self):
+        return self.archive is None or self.archive.fp is None
+
+
+    def raw(self, name):
+        """
+        Return the ZipInfo and compressed data of a part
+        """
+        info = self._parts[name]
+        if name in self._data:
+            return info, self._data[name]
+        return info, read_raw(self.archive, info)
+
+
+    def read(self, name):
+        """
+        Return the uncompressed contents of a part
+        """
+        if name not in self._parts:
+            raise KeyError("There is no item named {0!r} in the part store".format(name))
+        if name not in self._data:
+            return self.archive.read(name)
+        info, data = self.raw(name)
+        if info.compress_type == ZIP_DEFLATED:
+            return zlib.decompress(data, -15)
+        return data
+
+
+    def detach(self):
+        """
+        Keep the compressed data of all parts so that the source archive can
+        be closed. Compression methods that cannot be decompressed here are
+        kept uncompressed.
+        """
+        if self.closed:
+            return
+        for name, info in self._parts.items():
+            if name in self._data:
+                continue
+            if info.compress_type in (ZIP_STORED, ZIP_DEFLATED):
+                self._data[name] = read_raw(self.archive, info)
+            else:
+                self._data[name] = self.archive.read(name)
+                info = copy(info)
+                info.compress_type = ZIP_STORED
+                info.compress_size = info.file_size
+                self._parts[name] = info
+        self.archive = None
+
+
+    def copy_to(self, archive, name, arcname=None):
+        """
+        Write a part to another archive without recompressing it
+        """
+        if not RAW_WRITES:
+            info = self._parts[name]
+            zinfo = ZipInfo(arcname or info.filename, info.date_time)
+            zinfo.compress_type = info.compress_type
+            zinfo.external_attr = info.external_attr
+            archive.writestr(zinfo, self.read(name))
+            return
+        info, data = self.raw(name)
+        write_raw(archive, info, data, arcname)
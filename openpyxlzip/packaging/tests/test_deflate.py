@@ -0,0 +1,46 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+import os
+import zlib
+from io import BytesIO
+
+import pytest
+
+
+@pytest.mark.parametrize("size1, size2",
+                         [
+                             (0, 0),
+                             (10, 0),
+                             (0, 10),
+                             (1000, 1),
+                             (3, 4099),
+                         ]
+                         )
+def test_crc32_combine(size1, size2):
+    from ..deflate import crc32_combine
+    first = os.urandom(size1)
+    second = os.urandom(size2)
+    crc = crc32_combine(zlib.crc32(first), zlib.crc32(second), size2)
+    assert crc == zlib.crc32(first + second)
+
+
+@pytest.mark.parametrize("size", [0, 100, 4096, 4097, 50000])
+def test_parallel_deflate(size):
+    from ..deflate import parallel_deflate
+    data = b"".join(b"<v>%d</v>" % (idx % 1000) for idx in range(size))
+    chunks = list(parallel_deflate(BytesIO(data), level=6, block_size=4096, threads=2))
+
+    compressed = b"".join(chunk for chunk, crc, length in chunks)
+    assert zlib.decompress(compressed, -15) == data
+    assert chunks[-1][1:] == (zlib.crc32(data), len(data))
+
+
+def test_window():
+    from ..deflate import parallel_deflate
+    # blocks repeat the one before them and are primed with it
+    block = os.urandom(4096)
+    data = block * 8
+    chunks = list(parallel_deflate(BytesIO(data), block_size=4096, threads=2))
+    compressed = b"".join(chunk for chunk, crc, length in chunks)
+    assert zlib.decompress(compressed, -15) == data
+    assert len(compressed) < 2 * len(block)
@@ -0,0 +1,162 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+import pytest
+from io import BytesIO
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED, ZIP_BZIP2
+
+
+@pytest.fixture
+def PartStore():
+    from ..parts import PartStore
+    return PartStore
+
+
+@pytest.fixture
+def source():
+    out = BytesIO()
+    with ZipFile(out, "w", ZIP_DEFLATED) as archive:
+        archive.writestr("xl/vbaProject.bin", b"\x00\x01" * 500)
+        archive.writestr("docProps/app.xml", b"<Properties/>", ZIP_STORED)
+        archive.writestr("docProps/custom.xml", b"<Properties/>" * 10, ZIP_BZIP2)
+    return ZipFile(out)
+
+
+class TestPartStore:
+
+    def test_add(self, PartStore, source):
+        parts = PartStore(source)
+        parts.add("xl/vbaProject.bin")
+        assert "xl/vbaProject.bin" in parts
+        assert parts.namelist() == ["xl/vbaProject.bin"]
+        assert parts.read("xl/vbaProject.bin") == b"\x00\x01" * 500
+
+
+    def test_read_unknown(self, PartStore, source):
+        parts = PartStore(source)
+        with pytest.raises(KeyError):
+            parts.read("xl/vbaProject.bin")
+
+
+    @pytest.mark.parametrize("name",
+                             ["xl/vbaProject.bin", "docProps/app.xml", "docProps/custom.xml"]
+                             )
+    def test_read_detached(self, PartStore, source, name):
+        parts = PartStore(source)
+        parts.add(name)
+        expected = source.read(name)
+        parts.detach()
+        source.close()
+        assert parts.closed
+        assert parts.read(name) == expected
+
+
+    @pytest.mark.parametrize("detach", [False, True])
+    @pytest.mark.parametrize("seekable", [True, False])
+    def test_copy_to(self, PartStore, source, detach, seekable):
+        parts = PartStore(source)
+        for name in source.namelist():
+            parts.add(name)
+        if detach:
+            parts.detach()
+
+        out = BytesIO()
+        stream = seekable and out or UnseekableStream()
+        with ZipFile(stream, "w", ZIP_DEFLATED) as archive:
+            archive.writestr("first.xml", b"<first/>")
+            for name in parts:
+                parts.copy_to(archive, name)
+            archive.writestr("last.xml", b"<last/>")
+
+        if not seekable:
+            out = stream.out
+        archive = ZipFile(out)
+        assert archive.testzip() is None
+        for name in source.namelist():
+            assert archive.read(name) == source.read(name)
+        info = archive.getinfo("xl/vbaProject.bin")
+        assert info.compress_size == source.getinfo("xl/vbaProject.bin").compress_size
+        assert archive.read("last.xml") == b"<last/>"
+
+
+    def test_copy_to_without_raw_writes(self, PartStore, source, monkeypatch):
+        from .. import parts as module
+        monkeypatch.setattr(module, "RAW_WRITES", False)
+        parts = PartStore(source)
+        for name in source.namelist():
+            parts.add(name)
+
+        out = BytesIO()
+        with ZipFile(out, "w", ZIP_DEFLATED) as archive:
+            for name in parts:
+                parts.copy_to(archive, name)
+
+        archive = ZipFile(out)
+        assert archive.testzip() is None
+        for name in source.namelist():
+            assert archive.read(name) == source.read(name)
+
+
+class TestPartIndex:
+
+    def test_ctor(self):
+        from ..parts import PartIndex
+        archive = ZipFile(BytesIO(), "w")
+        archive.writestr("b.xml", b"")
+        archive.writestr("a.xml", b"")
+        names = PartIndex(archive)
+
+        assert "a.xml" in names
+        assert "c.xml" not in names
+        assert list(names) == ["b.xml", "a.xml"]
+        assert len(names) == 2
+
+
+    def test_written_later(self):
+        from ..parts import PartIndex
+        archive = ZipFile(BytesIO(), "w")
+        archive.writestr("b.xml", b"")
+        names = PartIndex(archive)
+        assert "c.xml" not in names
+
+        archive.writestr("c.xml", b"")
+        with archive.open("a.xml", "w") as dst:
+            dst.write(b"")
+        assert "c.xml" in names
+        assert list(names) == ["b.xml", "c.xml", "a.xml"]
+
+
+class UnseekableStream:
+
+    def __init__(self):
+        self.out = BytesIO()
+
+    def write(self, data):
+        return self.out.write(data)
+
+    def flush(self):
+        pass
+
+
+@pytest.mark.parametrize("seekable", [True, False])
+def test_write_deflated(seekable):
+    from zipfile import ZipInfo
+    from ..deflate import parallel_deflate
+    from ..parts import write_deflated
+
+    data = b"".join(b'<row r="%d"><v>%d</v></row>' % (idx, idx * 7) for idx in range(20000))
+    out = BytesIO()
+    stream = seekable and out or UnseekableStream()
+    with ZipFile(stream, "w") as archive:
+        archive.writestr("a.xml", b"<a/>")
+        info = ZipInfo("b.xml")
+        info.file_size = len(data)
+        write_deflated(archive, info, parallel_deflate(BytesIO(data), block_size=64 * 1024))
+        archive.writestr("c.xml", b"<c/>")
+
+    if not seekable:
+        out = stream.out
+    archive = ZipFile(out)
+    assert archive.testzip() is None
+    assert archive.namelist() == ["a.xml", "b.xml", "c.xml"]
+    assert archive.read("b.xml") == data
+    assert archive.getinfo("b.xml").compress_type == ZIP_DEFLATED
@@ -16,7 +16,6 @@ from openpyxlzip.descriptors.sequence import NestedSequence
 from openpyxlzip.descriptors.nested import NestedString
 
 from openpyxlzip.xml.constants import SHEET_MAIN_NS
-from openpyxlzip.xml.schema import ROOT_ELEMS
 
 from openpyxlzip.workbook.defined_name import DefinedName, DefinedNameList
 from openpyxlzip.workbook.external_reference import ExternalReference
@@ -183,7 +182,8 @@ class WorkbookPackage(Serialisable):
 
     def to_tree(self, elem_type=None):
         root_tag = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}workbook"
-        root_type = ROOT_ELEMS[root_tag]
+        from openpyxlzip.xml.schema import get_table
+        root_type = get_table("ROOT_ELEMS")[root_tag]
         tree = super(WorkbookPackage, self).to_tree(elem_type=root_type)
         tree.set("xmlns", SHEET_MAIN_NS)
         return tree
@@ -1093,17 +1093,17 @@ class CacheDefinition(Serialisable):
         return self._path.format(self._id)
 
 
-    def _write(self, archive, manifest):
+    def _write(self, archive, manifest, compact_xml=False):
         """
         Add to zipfile and update manifest
         """
-        self._write_rels(archive, manifest)
+        self._write_rels(archive, manifest, compact_xml)
         xml = tostring(self.to_tree())
         archive.writestr(self.path[1:], xml)
         manifest.append(self)
 
 
-    def _write_rels(self, archive, manifest):
+    def _write_rels(self, archive, manifest, compact_xml=False):
         """
         Write the relevant child objects and add links
         """
@@ -1115,7 +1115,7 @@ class CacheDefinition(Serialisable):
         rels.append(r)
         self.id = r.id
         self.records._id = self._id
-        self.records._write(archive, manifest)
+        self.records._write(archive, manifest, compact_xml)
 
         path = get_rels_path(self.path)
         xml = tostring(rels.to_tree())
@@ -1,5 +1,8 @@
 # Copyright (c) 2010-2020 openpyxlzip
 
+from array import array
+from io import BytesIO
+
 from openpyxlzip.descriptors.serialisable import Serialisable
 from openpyxlzip.descriptors import (
     Typed,
@@ -16,9 +19,9 @@ from openpyxlzip.descriptors.nested import (
     NestedBool,
 )
 
-from openpyxlzip.xml import LXML
 from openpyxlzip.xml.constants import SHEET_MAIN_NS
-from openpyxlzip.xml.functions import tostring
+from openpyxlzip.xml.functions import tostring_part, fromstring, iterparse
+from openpyxlzip.utils.datetime import from_ISO8601
 
 from .fields import (
     Boolean,
@@ -99,17 +102,182 @@ class RecordList(Serialisable):
         return self._path.format(self._id)
 
 
-    def _write(self, archive, manifest):
+    def _write(self, archive, manifest, compact_xml=False):
         """
         Write to zipfile and update manifest
         """
-        if LXML:
-            xml = tostring(self.to_tree(), pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True)
-        else:
-            xml = tostring(self.to_tree())
+        xml = tostring_part(self.to_tree(), compact_xml)
         archive.writestr(self.path[1:], xml)
         manifest.append(self)
 
 
     def _write_rels(self, archive, manifest):
         pass
+
+
+RECORD_TAG = "{%s}r" % SHEET_MAIN_NS
+# fields that can be stored in typed arrays
+TYPECODES = {"x": "i", "n": "d"}
+
+
+def _field_value(node):
+    """
+    Convert a record field into a Python value.
+    Shared items (x) are returned as their index.
+    """
+    tag = node.tag.rsplit("}", 1)[-1]
+    value = node.get("v")
+    if tag == "x":
+        value = int(value or 0)
+    elif tag == "n":
+        value = float(value)
+    elif tag == "b":
+        value = value in ("1", "true")
+    elif tag == "d":
+        value = from_ISO8601(value)
+    elif tag == "m":
+        value = None
+    return tag, value
+
+
+def _record_field_value(field):
+    """
+    Convert a parsed record field into the same value as `_field_value`
+    """
+    tag = field.tagname
+    value = None
+    if tag != "m":
+        value = field.v
+    if tag == "x" and value is None:
+        value = 0
+    return tag, value
+
+
+class LazyRecordList:
+
+    """
+    Pivot cache records backed by the source part.
+
+    Records are not parsed on load. Unless `r` is accessed the original
+    XML is written back unchanged. `columns` decodes the records into one
+    column per cache field and `iter_records()` streams the values of each
+    record without creating `Record` objects. Once `r` has been accessed
+    both are taken from the parsed records instead, so that they follow
+    any changes made to them.
+    """
+
+    mime_type = RecordList.mime_type
+    rel_type = RecordList.rel_type
+    _id = 1
+    _path = RecordList._path
+
+    def __init__(self, src):
+        self._src = src
+        self._records = None
+        self._columns = None
+        self._count = None
+
+
+    @property
+    def path(self):
+        return self._path.format(self._id)
+
+
+    @property
+    def r(self):
+        """
+        Fully parsed records. Once accessed these will be serialised on save.
+        """
+        if self._records is None:
+            self._records = RecordList.from_tree(fromstring(self._src))
+            self._columns = None
+        return self._records.r
+
+
+    @property
+    def count(self):
+        if self._records is not None:
+            return self._records.count
+        if self._count is None:
+            count = 0
+            for _, node in iterparse(BytesIO(self._src)):
+                if node.tag == RECORD_TAG:
+                    count += 1
+                    node.clear()
+            self._count = count
+        return self._count
+
+
+    def _iter_fields(self):
+        if self._records is not None:
+            for record in self._records.r:
+                yield [_record_field_value(field) for field in record._fields]
+            return
+        for _, node in iterparse(BytesIO(self._src)):
+            if node.tag == RECORD_TAG:
+                yield [_field_value(child) for child in node]
+                node.clear()
+
+
+    def iter_records(self):
+        """
+        Yield a tuple of values for each record
+        """
+        for fields in self._iter_fields():
+            yield tuple(value for tag, value in fields)
+
+
+    @property
+    def columns(self):
+        """
+        Read-only columnar view of the records. Columns containing only
+        shared item indices are `array('i')`, only numbers `array('d')`, and
+        anything else a list of values.
+
+        The columns are cached until `r` is accessed, after which they are
+        decoded from the parsed records each time.
+        """
+        if self._records is not None:
+            return self._decode_columns()
+        if self._columns is None:
+            self._columns = self._decode_columns()
+        return self._columns
+
+
+    def _decode_columns(self):
+        columns = []
+        kinds = []
+        for fields in self._iter_fields():
+            for idx, (tag, value) in enumerate(fields):
+                if idx == len(columns):
+                    code = TYPECODES.get(tag)
+                    columns.append(array(code) if code else [])
+                    kinds.append(tag if code else None)
+                col = columns[idx]
+                if kinds[idx] is not None and kinds[idx] != tag:
+                    col = columns[idx] = list(col)
+                    kinds[idx] = None
+                col.append(value)
+        return columns
+
+
+    def to_tree(self, elem_type=None):
+        if self._records is not None:
+            return self._records.to_tree()
+        return fromstring(self._src)
+
+
+    def _write(self, archive, manifest, compact_xml=False):
+        """
+        Write to zipfile and update manifest
+        """
+        if self._records is not None:
+            self._records._id = self._id
+            self._records._write(archive, manifest, compact_xml)
+            return
+        archive.writestr(self.path[1:], self._src)
+        manifest.append(self)
+
+
+    def _write_rels(self, archive, manifest):
+        pass
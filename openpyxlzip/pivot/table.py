@@ -18,9 +18,9 @@ from openpyxlzip.descriptors import (
 from openpyxlzip.descriptors.excel import ExtensionList, Relation
 from openpyxlzip.descriptors.nested import NestedInteger
 from openpyxlzip.descriptors.sequence import NestedSequence
-from openpyxlzip.xml import LXML
 from openpyxlzip.xml.constants import SHEET_MAIN_NS
-from openpyxlzip.xml.functions import tostring
+from openpyxlzip.xml.functions import tostring_part
+from openpyxlzip.packaging.parts import PartIndex
 from openpyxlzip.packaging.relationship import (
     RelationshipList,
     Relationship,
@@ -1154,22 +1154,20 @@ class TableDefinition(Serialisable):
         return self._path.format(self._id)
 
 
-    def _write(self, archive, manifest):
+    def _write(self, archive, manifest, compact_xml=False, parts=None):
         """
         Add to zipfile and update manifest
         """
-        self._write_rels(archive, manifest)
-        if LXML:
-            xml = tostring(self.to_tree(), pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True)
-        else:
-            xml = tostring(self.to_tree())
+        self._write_rels(archive, manifest, compact_xml, parts)
+        xml = tostring_part(self.to_tree(), compact_xml)
         archive.writestr(self.path[1:], xml)
         manifest.append(self)
 
 
-    def _write_rels(self, archive, manifest):
+    def _write_rels(self, archive, manifest, compact_xml=False, parts=None):
         """
-        Write the relevant child objects and add links
+        Write the relevant child objects and add links. `parts` is the index
+        of the parts already in the archive, if the writer keeps one.
         """
         if self.cache is None:
             return
@@ -1178,12 +1176,11 @@ class TableDefinition(Serialisable):
         r = Relationship(Type=self.cache.rel_type, Target=self.cache.path)
         rels.append(r)
         self.id = r.id
-        if self.cache.path[1:] not in archive.namelist():
-            self.cache._write(archive, manifest)
+        if parts is None:
+            parts = PartIndex(archive)
+        if self.cache.path[1:] not in parts:
+            self.cache._write(archive, manifest, compact_xml)
 
         path = get_rels_path(self.path)
-        if LXML:
-            xml = tostring(rels.to_tree(), pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True)
-        else:
-            xml = tostring(rels.to_tree())
+        xml = tostring_part(rels.to_tree(), compact_xml)
         archive.writestr(path[1:], xml)
@@ -110,3 +110,101 @@ class TestRecordList:
 
         assert archive.namelist() == [records.path[1:]]
         assert manifest.find(records.mime_type)
+
+
+@pytest.fixture
+def LazyRecordList():
+    from ..record import LazyRecordList
+    return LazyRecordList
+
+
+class TestLazyRecordList:
+
+    def test_iter_records(self, LazyRecordList, datadir):
+        datadir.chdir()
+        with open("pivotCacheRecords.xml", "rb") as src:
+            records = LazyRecordList(src.read())
+        rows = list(records.iter_records())
+        assert len(rows) == 17
+        assert rows[0] == (1.0, 0, "2014-03-24", 0, 25.0, 0)
+        assert records._records is None
+
+
+    def test_columns(self, LazyRecordList, datadir):
+        from array import array
+        datadir.chdir()
+        with open("pivotCacheRecords.xml", "rb") as src:
+            records = LazyRecordList(src.read())
+        cols = records.columns
+        assert len(cols) == 6
+        assert isinstance(cols[0], array) and cols[0].typecode == "d"
+        assert isinstance(cols[1], array) and cols[1].typecode == "i"
+        assert list(cols[1]) == [row[1] for row in records.iter_records()]
+        assert cols[2] == ["2014-03-24"] * 17
+        assert records.count == 17
+
+
+    def test_count(self, LazyRecordList, datadir):
+        datadir.chdir()
+        with open("pivotCacheRecords.xml", "rb") as src:
+            records = LazyRecordList(src.read())
+        assert records.count == 17
+        assert records._columns is None
+        del records.r[1:]
+        assert records.count == 1
+
+
+    def test_follow_parsed(self, LazyRecordList, datadir):
+        datadir.chdir()
+        with open("pivotCacheRecords.xml", "rb") as src:
+            records = LazyRecordList(src.read())
+        rows = list(records.iter_records())
+        cols = records.columns
+        assert len(records.r) == 17
+        assert list(records.iter_records()) == rows
+        assert records.columns == cols
+
+        records.r[0]._fields[0].v = 2
+        del records.r[1:]
+        assert list(records.iter_records()) == [(2.0, 0, "2014-03-24", 0, 25.0, 0)]
+        assert records.columns[0].tolist() == [2.0]
+        assert records.count == 1
+
+
+    def test_mixed_column(self, LazyRecordList):
+        src = b"""
+        <pivotCacheRecords xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <r><n v="1"/></r>
+          <r><m/></r>
+        </pivotCacheRecords>
+        """
+        records = LazyRecordList(src)
+        assert records.columns == [[1.0, None]]
+
+
+    def test_write_untouched(self, LazyRecordList, datadir):
+        datadir.chdir()
+        with open("pivotCacheRecords.xml", "rb") as src:
+            xml = src.read()
+        records = LazyRecordList(xml)
+        records._id = 2
+        archive = ZipFile(BytesIO(), mode="w")
+        manifest = Manifest()
+        records._write(archive, manifest)
+
+        assert archive.read("xl/pivotCache/pivotCacheRecords2.xml") == xml
+        assert manifest.find(records.mime_type)
+
+
+    def test_write_parsed(self, LazyRecordList, datadir):
+        datadir.chdir()
+        with open("pivotCacheRecords.xml", "rb") as src:
+            records = LazyRecordList(src.read())
+        assert len(records.r) == 17
+        del records.r[1:]
+        archive = ZipFile(BytesIO(), mode="w")
+        records._write(archive, Manifest())
+
+        xml = archive.read(records.path[1:])
+        node = fromstring(xml)
+        assert node.get("count") == "1"
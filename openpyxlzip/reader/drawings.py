@@ -8,16 +8,19 @@ from warnings import warn
 from openpyxlzip.xml.functions import fromstring
 from openpyxlzip.xml.constants import IMAGE_NS
 from openpyxlzip.packaging.relationship import get_rel, get_rels_path, get_dependents
+from openpyxlzip.packaging.parts import PartIndex
 from openpyxlzip.drawing.spreadsheet_drawing import SpreadsheetDrawing
 from openpyxlzip.drawing.image import Image, PILImage
 from openpyxlzip.chart.chartspace import ChartSpace
 from openpyxlzip.chart.reader import read_chart
 
 
-def find_images(archive, path):
+def find_images(archive, path, valid_files=None):
     """
     Given the path to a drawing file extract charts and images
 
+    `valid_files` is the index of the parts in the archive, if there is one
+
     Ingore errors due to unsupported parts of DrawingML
     """
 
@@ -31,7 +34,9 @@ def find_images(archive, path):
 
     rels_path = get_rels_path(path)
     deps = []
-    if rels_path in archive.namelist():
+    if valid_files is None:
+        valid_files = PartIndex(archive)
+    if rels_path in valid_files:
         deps = get_dependents(archive, rels_path)
 
     charts = []
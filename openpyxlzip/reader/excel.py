@@ -4,9 +4,8 @@
 """Read an xlsx file into Python"""
 
 # Python stdlib imports
-from zipfile import ZipFile, ZIP_DEFLATED, BadZipfile
+from zipfile import ZipFile, BadZipfile
 from sys import exc_info
-from io import BytesIO
 import os.path
 import warnings
 from parse import parse
@@ -51,6 +50,7 @@ from openpyxlzip.styles.stylesheet import apply_stylesheet
 
 from openpyxlzip.packaging.core import DocumentProperties
 from openpyxlzip.packaging.manifest import Manifest, Override
+from openpyxlzip.packaging.parts import PartIndex, PartStore
 
 from openpyxlzip.packaging.relationship import (
     RelationshipList,
@@ -129,7 +129,7 @@ class ExcelReader:
     def __init__(self,  fn, read_only=False, keep_vba=KEEP_VBA,
                   data_only=False, keep_links=True):
         self.archive = _validate_archive(fn)
-        self.valid_files = self.archive.namelist()
+        self.valid_files = PartIndex(self.archive)
         self.read_only = read_only
         self.keep_vba = keep_vba
         self.data_only = data_only
@@ -160,17 +160,18 @@ class ExcelReader:
         wb._data_only = self.data_only
         wb._read_only = self.read_only
         wb.template = wb_part.ContentType in (XLTX, XLTM)
+        wb._parts = self.parts = PartStore(self.archive)
 
-        # If are going to preserve the vba then attach a copy of the archive to the
-        # workbook so that is available for the save.
+        # If are going to preserve the vba then keep all parts of the archive
+        # so that they are available for the save.
         if self.keep_vba:
-            wb.vba_archive = ZipFile(BytesIO(), 'a', ZIP_DEFLATED)
             for name in self.valid_files:
-                wb.vba_archive.writestr(name, self.archive.read(name))
+                self.parts.add(name)
+            wb.vba_archive = self.parts
 
         if ARC_APP in self.valid_files:
-            wb.app_archive = ZipFile(BytesIO(), 'a', ZIP_DEFLATED)
-            wb.app_archive.writestr(ARC_APP, self.archive.read(ARC_APP))
+            self.parts.add(ARC_APP)
+            wb.app_archive = self.parts
 
         if self.read_only:
             wb._archive = self.archive
@@ -183,8 +184,8 @@ class ExcelReader:
             src = fromstring(self.archive.read(ARC_CORE))
             self.wb.properties = DocumentProperties.from_tree(src)
         if ARC_CUSTOM in  self.valid_files:
-            self.wb.arc_custom = ZipFile(BytesIO(), 'a', ZIP_DEFLATED)
-            self.wb.arc_custom.writestr(ARC_CUSTOM, self.archive.read(ARC_CUSTOM))
+            self.parts.add(ARC_CUSTOM)
+            self.wb.arc_custom = self.parts
 
 
     def read_theme(self):
@@ -209,7 +210,8 @@ class ExcelReader:
 
         drawings = rels.find(SpreadsheetDrawing._rel_type)
         for rel in drawings:
-            drawing, charts, images = find_images(self.archive, rel.target)
+            drawing, charts, images = find_images(self.archive, rel.target,
+                                                  self.valid_files)
             if not hasattr(sheet, "drawings"):
                 sheet.drawings = {}
             sheet.drawings[rel.target] = drawing
@@ -277,7 +279,8 @@ class ExcelReader:
 
             drawings = rels.find(SpreadsheetDrawing._rel_type)
             for rel in drawings:
-                drawing, charts, images = find_images(self.archive, rel.target)
+                drawing, charts, images = find_images(self.archive, rel.target,
+                                                  self.valid_files)
                 if self.wb.drawings is None:
                     self.wb.drawings = {}
                 ws.drawings[rel.target] = drawing
@@ -289,23 +292,23 @@ class ExcelReader:
                 drawing_id = parse(PACKAGE_DRAWINGS + "/drawing{:d}.xml", rel.target)[0]
                 if self.wb._all_drawings is None:
                     self.wb._all_drawings = {}
-                self.wb._all_drawings[rel.target] = ZipFile(BytesIO(), 'a', ZIP_DEFLATED)
-                self.wb._all_drawings[rel.target].writestr(rel.target, self.archive.read(rel.target))
+                self.parts.add(rel.target)
+                self.wb._all_drawings[rel.target] = self.parts
                 sub_rels_path = get_rels_path(rel.target)
-                if sub_rels_path not in self.archive.namelist():
+                if sub_rels_path not in self.valid_files:
                     continue
                 sub_rels = get_dependents(self.archive, sub_rels_path)
                 if self.wb._all_drawings_rels is None:
                     self.wb._all_drawings_rels = {}
                 self.wb._all_drawings_rels[sub_rels_path] = sub_rels
                 for sub_rel in sub_rels.Relationship:
-                    if sub_rel.target in self.archive.namelist():
+                    if sub_rel.target in self.valid_files:
                         if self.wb._all_drawing_dependencies is None:
                             self.wb._all_drawing_dependencies = {}
                         if sub_rel.target in self.wb._all_drawing_dependencies:
                             continue
-                        self.wb._all_drawing_dependencies[sub_rel.target] = ZipFile(BytesIO(), 'a', ZIP_DEFLATED)
-                        self.wb._all_drawing_dependencies[sub_rel.target].writestr(sub_rel.target, self.archive.read(sub_rel.target))
+                        self.parts.add(sub_rel.target)
+                        self.wb._all_drawing_dependencies[sub_rel.target] = self.parts
 
 
             pivot_rel = rels.find(TableDefinition.rel_type)
@@ -326,8 +329,8 @@ class ExcelReader:
                 if self.wb._printer_settings is None:
                     self.wb._printer_settings = {}
                 printer_setting_id = parse(PACKAGE_PRINTER_SETTINGS + "/printerSettings{:d}.bin", full_filename)[0]
-                self.wb._printer_settings[printer_setting_id] = ZipFile(BytesIO(), 'a', ZIP_DEFLATED)
-                self.wb._printer_settings[printer_setting_id].writestr(full_filename, self.archive.read(full_filename))
+                self.parts.add(full_filename)
+                self.wb._printer_settings[printer_setting_id] = self.parts
 
 
     #MattJ added to handle custom XML when present
@@ -337,8 +340,8 @@ class ExcelReader:
             if full_filename.startswith(PACKAGE_CUSTOM_XML):
                 if self.wb._custom_xml is None:
                     self.wb._custom_xml = {}
-                self.wb._custom_xml[full_filename] = ZipFile(BytesIO(), 'a', ZIP_DEFLATED)
-                self.wb._custom_xml[full_filename].writestr(full_filename, self.archive.read(full_filename))
+                self.parts.add(full_filename)
+                self.wb._custom_xml[full_filename] = self.parts
 
     def read(self):
         self.read_manifest()
@@ -352,6 +355,7 @@ class ExcelReader:
         self.read_worksheets()
         self.parser.assign_names()
         if not self.read_only:
+            self.parts.detach()
             self.archive.close()
 
 
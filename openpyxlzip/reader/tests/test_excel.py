@@ -159,7 +159,7 @@ class TestExcelReader:
     def test_ctor(self, datadir):
         datadir.chdir()
         reader = ExcelReader("complex-styles.xlsx")
-        assert reader.valid_files == [
+        assert list(reader.valid_files) == [
             '[Content_Types].xml',
             '_rels/.rels',
             'xl/_rels/workbook.xml.rels',
@@ -131,6 +131,18 @@ class TestWorkbookParser:
         assert list(parser.pivot_caches) == [68]
 
 
+    def test_pivot_caches_parsed_once(self, datadir, WorkbookParser):
+        datadir.chdir()
+
+        archive = ZipFile("pivot.xlsx")
+        parser = WorkbookParser(archive, ARC_WORKBOOK)
+        parser.parse()
+        caches = parser.pivot_caches
+        archive.close()
+        assert parser.pivot_caches is caches
+        assert caches[68].records is not None
+
+
     def test_book_views(self, datadir, WorkbookParser):
         datadir.chdir()
         archive = ZipFile("bug137.xlsx")
@@ -19,7 +19,7 @@ from openpyxlzip.workbook.defined_name import (
 )
 from openpyxlzip.workbook.external_link.external import read_external_link
 from openpyxlzip.pivot.cache import CacheDefinition
-from openpyxlzip.pivot.record import RecordList
+from openpyxlzip.pivot.record import LazyRecordList
 
 from openpyxlzip.utils.datetime import CALENDAR_MAC_1904
 
@@ -27,6 +27,7 @@ from openpyxlzip.utils.datetime import CALENDAR_MAC_1904
 class WorkbookParser:
 
     _rels = None
+    _pivot_caches = None
 
     def __init__(self, archive, workbook_part_name, keep_links=True):
         self.archive = archive
@@ -119,12 +120,17 @@ class WorkbookParser:
     def pivot_caches(self):
         """
         Get PivotCache objects
+
+        Caches are parsed once, on first access, and shared by all pivot
+        tables that refer to them. Records are only parsed when used.
         """
-        d = {}
-        for c in self.caches:
-            cache = get_rel(self.archive, self.rels, id=c.id, cls=CacheDefinition)
-            if cache.deps:
-                records = get_rel(self.archive, cache.deps, cache.id, RecordList)
-                cache.records = records
-            d[c.cacheId]  = cache
-        return d
+        if self._pivot_caches is None:
+            d = {}
+            for c in self.caches:
+                cache = get_rel(self.archive, self.rels, id=c.id, cls=CacheDefinition)
+                if cache.deps:
+                    rel = cache.deps[cache.id]
+                    cache.records = LazyRecordList(self.archive.read(rel.target))
+                d[c.cacheId]  = cache
+            self._pivot_caches = d
+        return self._pivot_caches
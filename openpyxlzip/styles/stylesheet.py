@@ -176,8 +176,8 @@ class Stylesheet(Serialisable):
 
     def to_tree(self, tagname=None, idx=None, namespace=None, elem_type=None):
         root_tag = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}styleSheet"
-        from openpyxlzip.xml.schema import ROOT_ELEMS
-        root_type = ROOT_ELEMS[root_tag]
+        from openpyxlzip.xml.schema import get_table
+        root_type = get_table("ROOT_ELEMS")[root_tag]
         tree = super(Stylesheet, self).to_tree(tagname, idx, namespace, elem_type=root_type)
         tree.set("xmlns", SHEET_MAIN_NS)
         return tree
@@ -1,7 +1,20 @@
 # Copyright (c) 2010-2020 openpyxlzip
 
+from array import array
+import datetime
 import operator
 from itertools import accumulate
+from string import digits
+
+from openpyxlzip.compat.numbers import NUMERIC_TYPES
+from openpyxlzip.utils.cell import _COL_STRING_CACHE, get_column_letter, range_boundaries
+from openpyxlzip.utils.datetime import (
+    from_excel,
+    to_excel,
+    CALENDAR_MAC_1904,
+    MAC_EPOCH,
+    WINDOWS_EPOCH,
+)
 
 
 def dataframe_to_rows(df, index=True, header=True):
@@ -71,3 +84,369 @@ def expand_levels(levels, labels):
                 row.append(label[idx])
                 current = idx
         yield row
+
+
+# kinds of cell values in a column buffer
+EMPTY, NUMBER, DATE, STRING, OBJECT = range(5)
+NAN = float("nan")
+
+
+class ColumnBuffer(object):
+
+    """
+    Values of a single column kept in preallocated arrays while a sheet is
+    read. Numbers and dates are stored as floats (dates as serials), shared
+    strings as their index in the shared string table and any other values
+    in a dictionary by position.
+    """
+
+    def __init__(self, size):
+        self.values = array("d", [NAN]) * size
+        self.kinds = array("b", [EMPTY]) * size
+        self.objects = {}
+
+
+    def grow(self, size):
+        extra = size - len(self.values)
+        if extra > 0:
+            self.values.extend(array("d", [NAN]) * extra)
+            self.kinds.extend(array("b", [EMPTY]) * extra)
+
+
+    def add(self, pos, value, kind):
+        self.values[pos] = value
+        self.kinds[pos] = kind
+
+
+    def add_object(self, pos, value, epoch=None):
+        """
+        Add a Python value
+        """
+        if value is None:
+            return
+        if isinstance(value, NUMERIC_TYPES) and not isinstance(value, bool):
+            self.add(pos, value, NUMBER)
+        elif isinstance(value, (datetime.datetime, datetime.date)):
+            self.add(pos, to_excel(value, epoch), DATE)
+        else:
+            self.objects[pos] = value
+            self.kinds[pos] = OBJECT
+
+
+    def to_array(self, size, dtype=None, shared_strings=(), epoch=None):
+        """
+        Convert the column to an array. Unless a dtype is given, it is
+        inferred from the kinds of values in the column: float64 for numbers,
+        datetime64[ns] for dates and object for anything else.
+        Values that cannot be converted to the dtype are missing.
+        """
+        import numpy
+        values = numpy.frombuffer(self.values, numpy.float64)[:size]
+        kinds = numpy.frombuffer(self.kinds, numpy.int8)[:size]
+        present = set(numpy.unique(kinds).tolist()) - {EMPTY}
+
+        category = dtype == "category"
+        if dtype is None or category:
+            if present <= {NUMBER}:
+                dtype = numpy.float64
+            elif present == {DATE}:
+                dtype = "datetime64[ns]"
+            else:
+                dtype = object
+        dtype = numpy.dtype(dtype)
+
+        if dtype.kind == "f":
+            values = numpy.where((kinds == NUMBER) | (kinds == DATE), values, numpy.nan)
+            return values.astype(dtype)
+
+        if dtype.kind == "M":
+            dates = _serial_to_datetime64(values, epoch)
+            dates[(kinds != NUMBER) & (kinds != DATE)] = numpy.datetime64("NaT")
+            for pos, value in self.objects.items():
+                if isinstance(value, (datetime.datetime, datetime.date)):
+                    dates[pos] = numpy.datetime64(value)
+            return dates.astype(dtype)
+
+        if dtype.kind != "O":
+            raise ValueError("Unsupported dtype {0}".format(dtype))
+
+        if category and present == {STRING}:
+            return _strings_to_categorical(values, kinds, shared_strings)
+
+        result = numpy.full(size, None, dtype=object)
+        mask = kinds == NUMBER
+        result[mask] = values[mask].tolist()
+        mask = kinds == STRING
+        if mask.any():
+            strings = numpy.array(shared_strings, dtype=object)
+            result[mask] = strings[values[mask].astype(numpy.int64)]
+        for pos in numpy.flatnonzero(kinds == DATE).tolist():
+            result[pos] = from_excel(values[pos], epoch)
+        for pos, value in self.objects.items():
+            if pos < size:
+                result[pos] = value
+
+        if category:
+            from pandas import Categorical
+            return Categorical(result)
+        return result
+
+
+def _serial_to_datetime64(values, epoch=None):
+    """
+    Convert Excel serials to datetimes like `from_excel()`
+    """
+    import numpy
+    if epoch == CALENDAR_MAC_1904:
+        base = MAC_EPOCH
+    else:
+        base = WINDOWS_EPOCH
+        # dates before the fictitious 1900-02-29
+        values = numpy.where((values > 1) & (values < 60), values + 1, values)
+    micro = numpy.round(values * 86400e6)
+    micro = numpy.where(numpy.isnan(micro), 0, micro).astype("timedelta64[us]")
+    return (numpy.datetime64(base, "us") + micro).astype("datetime64[ns]")
+
+
+def _datetime64_to_serial(values, epoch=None):
+    """
+    Convert datetimes to Excel serials like `to_excel()`. NaT becomes NaN.
+    """
+    import numpy
+    if epoch == CALENDAR_MAC_1904:
+        base = MAC_EPOCH
+    else:
+        base = WINDOWS_EPOCH
+    values = values.astype("datetime64[us]")
+    micro = (values - numpy.datetime64(base, "us")).astype(numpy.int64)
+    days, micro = numpy.divmod(micro, 86400 * 10**6)
+    seconds, micro = numpy.divmod(micro, 10**6)
+    if epoch != CALENDAR_MAC_1904:
+        # dates before the fictitious 1900-02-29
+        days = numpy.where(days <= 60, days - 1, days)
+    serial = days + (seconds + micro / 10**6) / 86400
+    return numpy.where(numpy.isnat(values), NAN, serial)
+
+
+def _timedelta64_to_days(values):
+    """
+    Convert timedeltas to fractions of a day like `to_excel()`. NaT becomes NaN.
+    """
+    import numpy
+    values = values.astype("timedelta64[us]")
+    days = values.astype(numpy.int64) / 10**6 / 86400
+    return numpy.where(numpy.isnat(values), NAN, days)
+
+
+def _strings_to_categorical(values, kinds, shared_strings):
+    """
+    Use the indices of the shared strings as categorical codes
+    """
+    import numpy
+    from pandas import Categorical
+    mask = kinds == STRING
+    used, codes = numpy.unique(values[mask].astype(numpy.int64), return_inverse=True)
+    categories = [shared_strings[idx] for idx in used.tolist()]
+    if len(set(categories)) != len(categories):
+        # rich text can map several shared strings to the same text
+        strings = numpy.full(len(values), None, dtype=object)
+        strings[mask] = [categories[code] for code in codes]
+        return Categorical(strings)
+    all_codes = numpy.full(len(values), -1, dtype=numpy.int64)
+    all_codes[mask] = codes
+    return Categorical.from_codes(all_codes, categories)
+
+
+def _read_only_columns(ws, min_col, min_row, max_col, max_row, columns, size):
+    """
+    Parse the rows of a read-only worksheet directly into column buffers
+    """
+    from openpyxlzip.worksheet._reader import (
+        WorkSheetParser,
+        VALUE_TAG,
+        FORMULA_TAG,
+    )
+
+    wb = ws.parent
+    date_formats = wb._date_formats
+    src = ws._get_source(min_row)
+    parser = WorkSheetParser(src, ws._shared_strings, data_only=wb.data_only,
+                             epoch=wb.epoch, date_formats=date_formats)
+    formulae = not wb.data_only
+    last = min_row - 1
+
+    try:
+        for row in parser.iter_row_elements():
+            r = row.get("r")
+            row_idx = int(r) if r is not None else parser.row_counter + 1
+            if max_row is not None and row_idx > max_row:
+                break
+            if row_idx < min_row:
+                if formulae:
+                    # shared formulae are defined by the first cell that uses them
+                    parser.parse_row(row)
+                continue
+
+            parser.row_counter = row_idx
+            last = row_idx
+            pos = row_idx - min_row
+            if pos >= size:
+                size = max(size * 2, pos + 1)
+                for buf in columns.values():
+                    buf.grow(size)
+
+            for counter, element in enumerate(row, 1):
+                data_type = element.get("t", "n")
+                simple = data_type != "inlineStr" and data_type != "d"
+                value = None
+                for child in element:
+                    if child.tag == VALUE_TAG:
+                        value = child.text or None
+                    elif child.tag == FORMULA_TAG and formulae:
+                        simple = False
+
+                coordinate = element.get("r")
+                if coordinate:
+                    column = _COL_STRING_CACHE[coordinate.rstrip(digits).upper()]
+                else:
+                    column = counter
+                if column < min_col or (max_col is not None and column > max_col):
+                    if not simple:
+                        parser.col_counter = counter - 1
+                        parser.parse_cell(element)
+                    continue
+
+                buf = columns.get(column)
+                if buf is None:
+                    buf = columns[column] = ColumnBuffer(size)
+
+                if not simple:
+                    parser.col_counter = counter - 1
+                    buf.add_object(pos, parser.parse_cell(element)[2], wb.epoch)
+                elif value is None:
+                    continue
+                elif data_type == "n":
+                    buf.values[pos] = float(value)
+                    style_id = element.get("s")
+                    if style_id and int(style_id) in date_formats:
+                        buf.kinds[pos] = DATE
+                    else:
+                        buf.kinds[pos] = NUMBER
+                elif data_type == "s":
+                    buf.values[pos] = int(value)
+                    buf.kinds[pos] = STRING
+                elif data_type == "b":
+                    buf.add_object(pos, bool(int(value)))
+                else:
+                    buf.add_object(pos, value)
+    finally:
+        src.close()
+
+    return last - min_row + 1
+
+
+def _worksheet_columns(ws, min_col, min_row, max_col, max_row, columns, size):
+    """
+    Collect the values of a worksheet in column buffers
+    """
+    rows = ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col,
+                        max_col=max_col, values_only=True)
+    pos = -1
+    for pos, row in enumerate(rows):
+        if pos >= size:
+            size = max(size * 2, pos + 1)
+            for buf in columns.values():
+                buf.grow(size)
+        for column, value in enumerate(row, min_col):
+            if value is None:
+                continue
+            buf = columns.get(column)
+            if buf is None:
+                buf = columns[column] = ColumnBuffer(size)
+            buf.add_object(pos, value, ws.parent.epoch)
+    return pos + 1
+
+
+def _boundaries(ws, cell_range=None):
+    if cell_range is None:
+        min_col, min_row, max_col, max_row = None, None, None, None
+    elif isinstance(cell_range, str):
+        min_col, min_row, max_col, max_row = range_boundaries(cell_range)
+    else:
+        min_col, min_row, max_col, max_row = cell_range
+    return (min_col or ws.min_column, min_row or ws.min_row,
+            max_col or ws.max_column, max_row or ws.max_row)
+
+
+def read_columns(ws, cell_range=None, dtypes=None):
+    """
+    Read the values of a worksheet range into one numpy array per column.
+
+    Returns an ordered dictionary of arrays keyed by column letter. The
+    arrays are float64 for numbers, datetime64[ns] for dates and object for
+    strings and mixed values unless `dtypes` maps a column letter to
+    "float64", "datetime64[ns]", "object" or "category" (a pandas
+    Categorical). Read-only worksheets are parsed straight into the arrays
+    and shared strings are only looked up once the range has been read.
+    """
+    from openpyxlzip.worksheet._read_only import ReadOnlyWorksheet
+
+    min_col, min_row, max_col, max_row = _boundaries(ws, cell_range)
+    dtypes = dtypes or {}
+    size = 1024
+    if max_row is not None:
+        size = max(max_row - min_row + 1, 0)
+    columns = {}
+
+    if isinstance(ws, ReadOnlyWorksheet):
+        rows = _read_only_columns(ws, min_col, min_row, max_col, max_row, columns, size)
+        shared_strings = ws._shared_strings
+    else:
+        rows = _worksheet_columns(ws, min_col, min_row, max_col, max_row, columns, size)
+        shared_strings = ()
+    if max_row is not None:
+        rows = max_row - min_row + 1
+    if max_col is None:
+        max_col = max(columns, default=min_col - 1)
+
+    result = {}
+    for column in range(min_col, max_col + 1):
+        letter = get_column_letter(column)
+        buf = columns.get(column) or ColumnBuffer(rows)
+        buf.grow(rows)
+        result[letter] = buf.to_array(rows, dtypes.get(letter), shared_strings,
+                                      ws.parent.epoch)
+    return result
+
+
+def to_dataframe(ws, cell_range=None, header=True, dtypes=None):
+    """
+    Read a worksheet range into a pandas DataFrame, see `read_columns()`.
+
+    If `header` is True the first row of the range contains the column names
+    and `dtypes` can refer to columns by name as well as by letter.
+    """
+    from pandas import DataFrame
+
+    min_col, min_row, max_col, max_row = _boundaries(ws, cell_range)
+    dtypes = dict(dtypes or {})
+    names = None
+    if header:
+        names = next(ws.iter_rows(min_row=min_row, max_row=min_row, min_col=min_col,
+                                  max_col=max_col, values_only=True), ())
+        min_row += 1
+        if max_col is None:
+            max_col = min_col + len(names) - 1
+        for column, name in enumerate(names, min_col):
+            letter = get_column_letter(column)
+            if name in dtypes and letter not in dtypes:
+                dtypes[letter] = dtypes[name]
+
+    columns = read_columns(ws, (min_col, min_row, max_col, max_row), dtypes)
+    df = DataFrame(dict(enumerate(columns.values())))
+    if names is None:
+        df.columns = list(columns)
+    else:
+        df.columns = [name if name is not None else letter
+                      for letter, name in zip(columns, names)]
+    return df
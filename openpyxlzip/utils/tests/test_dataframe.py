@@ -77,3 +77,106 @@ def test_dataframe_multiindex():
 
     rows = list(dataframe_to_rows(df, header=False))
     assert rows[0] == ['first', 'second']
+
+
+@pytest.fixture
+def sample_workbook():
+    import datetime
+    from io import BytesIO
+    from openpyxlzip import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["number", "date", "text", "mixed", "formula"])
+    for i in range(1, 21):
+        ws.append([i * 1.5, datetime.datetime(2020, 1, i, 12), "t{0}".format(i % 3),
+                   i if i % 2 else "x", "=A{0}*2".format(i + 1)])
+    ws["A5"] = None
+    ws["C7"] = None
+    out = BytesIO()
+    wb.save(out, shared_strings=True)
+    return out
+
+
+@pytest.mark.numpy_required
+@pytest.mark.parametrize("read_only", [False, True])
+def test_read_columns(sample_workbook, read_only):
+    import datetime
+    import numpy
+    from openpyxlzip import load_workbook
+    from ..dataframe import read_columns
+
+    ws = load_workbook(sample_workbook, read_only=read_only).active
+    columns = read_columns(ws, "A2:E21")
+
+    assert list(columns) == ["A", "B", "C", "D", "E"]
+    assert columns["A"].dtype == numpy.float64
+    assert isnan(columns["A"][3])
+    assert columns["A"][1] == 3.0
+    assert columns["B"].dtype == numpy.dtype("datetime64[ns]")
+    assert columns["B"][0] == numpy.datetime64("2020-01-01T12:00")
+    assert columns["C"].dtype == object
+    assert list(columns["C"][4:7]) == ["t2", None, "t1"]
+    assert list(columns["D"][:2]) == [1.0, "x"]
+    assert columns["E"][0] == "=A2*2"
+
+
+@pytest.mark.numpy_required
+@pytest.mark.parametrize("read_only", [False, True])
+def test_read_columns_dtypes(sample_workbook, read_only):
+    import numpy
+    from openpyxlzip import load_workbook
+    from ..dataframe import read_columns
+
+    ws = load_workbook(sample_workbook, read_only=read_only).active
+    columns = read_columns(ws, "A2:D21", dtypes={"A": "object", "B": "float64",
+                                                  "D": "float64"})
+
+    assert columns["A"][0] == 1.5
+    assert columns["B"].dtype == numpy.float64
+    assert columns["B"][0] == 43831.5
+    assert isnan(columns["D"][1])
+
+    with pytest.raises(ValueError):
+        read_columns(ws, "A2:A3", dtypes={"A": "int64"})
+
+
+@pytest.mark.pandas_required
+@pytest.mark.parametrize("read_only", [False, True])
+def test_to_dataframe(sample_workbook, read_only):
+    from openpyxlzip import load_workbook
+    from ..dataframe import to_dataframe
+
+    ws = load_workbook(sample_workbook, read_only=read_only).active
+    df = to_dataframe(ws, dtypes={"text": "category"})
+
+    assert list(df.columns) == ["number", "date", "text", "mixed", "formula"]
+    assert df.shape == (20, 5)
+    assert sorted(df["text"].cat.categories) == ["t0", "t1", "t2"]
+    assert df["text"].isna().sum() == 1
+
+
+@pytest.mark.numpy_required
+def test_read_columns_unsized(sample_workbook):
+    from openpyxlzip import load_workbook
+    from ..dataframe import read_columns
+
+    ws = load_workbook(sample_workbook, read_only=True).active
+    ws.reset_dimensions()
+    columns = read_columns(ws)
+
+    assert list(columns) == ["A", "B", "C", "D", "E"]
+    assert len(columns["A"]) == 21
+
+
+@pytest.mark.numpy_required
+@pytest.mark.parametrize("epoch", ["windows", "mac"])
+def test_serial_to_datetime64(epoch):
+    import numpy
+    from ..datetime import from_excel, CALENDAR_WINDOWS_1900, CALENDAR_MAC_1904
+    from ..dataframe import _serial_to_datetime64
+
+    epoch = {"windows": CALENDAR_WINDOWS_1900, "mac": CALENDAR_MAC_1904}[epoch]
+    serials = [2, 59.25, 61, 40000.125, 43831.041666666664]
+    dates = _serial_to_datetime64(numpy.array(serials), epoch)
+    assert dates.astype("datetime64[us]").tolist() == [from_excel(v, epoch) for v in serials]
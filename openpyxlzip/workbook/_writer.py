@@ -5,7 +5,6 @@
 from copy import copy
 
 from openpyxlzip.utils import absolute_coordinate, quote_sheetname
-from openpyxlzip.xml import LXML
 from openpyxlzip.xml.constants import (
     ARC_APP,
     ARC_CORE,
@@ -15,7 +14,7 @@ from openpyxlzip.xml.constants import (
     CUSTOMUI_NS,
     ARC_ROOT_RELS,
 )
-from openpyxlzip.xml.functions import tostring, fromstring
+from openpyxlzip.xml.functions import tostring_part, fromstring
 
 from openpyxlzip.packaging.relationship import Relationship, RelationshipList
 from openpyxlzip.workbook.defined_name import DefinedName
@@ -48,8 +47,10 @@ def get_active_sheet(wb):
 
 class WorkbookWriter:
 
-    def __init__(self, wb):
+    def __init__(self, wb, shared_strings=False, compact_xml=False):
         self.wb = wb
+        self.shared_strings = shared_strings
+        self.compact_xml = compact_xml
         self.rels = RelationshipList()
         #Create the workbook package and fill in extra properties
         self.package = WorkbookPackage()
@@ -167,11 +168,7 @@ class WorkbookWriter:
         self.write_views()
         self.write_refs()
 
-        if LXML:
-            # print("Should be outputting", self.package.definedNames, tostring(self.package.definedNames.to_tree(verbose=True)))
-            return tostring(self.package.to_tree(), pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True)
-        else:
-            return tostring(self.package.to_tree())
+        return tostring_part(self.package.to_tree(), self.compact_xml)
 
 
     def write_rels(self):
@@ -183,6 +180,10 @@ class WorkbookWriter:
         theme =  Relationship(type='theme', Target='theme/theme1.xml')
         self.rels.append(theme)
 
+        if self.shared_strings:
+            strings =  Relationship(type='sharedStrings', Target='sharedStrings.xml')
+            self.rels.append(strings)
+
         if self.wb._custom_xml is not None:
             for pathname in self.wb._custom_xml:
                 if "_rels" not in pathname and "Props" not in pathname:
@@ -196,10 +197,7 @@ class WorkbookWriter:
             self.rels.append(vba)
 
 
-        if LXML:
-            return tostring(self.rels.to_tree(), pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True)
-        else:
-            return tostring(self.rels.to_tree())
+        return tostring_part(self.rels.to_tree(), self.compact_xml)
 
 
     def write_root_rels(self):
@@ -227,7 +225,4 @@ class WorkbookWriter:
             for rel in root_rels.find(CUSTOMUI_NS):
                 rels.append(rel)
 
-        if LXML:
-            return tostring(rels.to_tree(), pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True)
-        else:
-            return tostring(rels.to_tree())
+        return tostring_part(rels.to_tree(), self.compact_xml)
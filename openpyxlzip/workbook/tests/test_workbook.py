@@ -346,3 +346,33 @@ class TestCopy:
         ws = wb.create_sheet()
         with pytest.raises(ValueError):
             wb.copy_worksheet(ws)
+
+
+def test_stream_to(Workbook):
+    from io import BytesIO
+    wb = Workbook()
+    with pytest.raises(TypeError):
+        wb.stream_to(BytesIO())
+
+    wb = Workbook(write_only=True)
+    wb.stream_to(BytesIO())
+    with pytest.raises(ValueError):
+        wb.stream_to(BytesIO())
+    with pytest.raises(ValueError):
+        wb.save(BytesIO())
+
+
+@pytest.mark.parametrize("kw",
+                         [
+                             {"shared_strings": True},
+                             {"workers": 2},
+                             {"compresslevel": 1},
+                         ]
+                         )
+def test_save_streamed_options(Workbook, kw):
+    from io import BytesIO
+    wb = Workbook(write_only=True)
+    wb.stream_to(BytesIO())
+    with pytest.raises(ValueError):
+        wb.save(**kw)
+    wb.save(compact_xml=True)
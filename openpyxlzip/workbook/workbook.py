@@ -14,7 +14,7 @@ from openpyxlzip.utils.indexed_list import IndexedList
 from openpyxlzip.utils.datetime  import CALENDAR_WINDOWS_1900
 from openpyxlzip.utils.exceptions import ReadOnlyWorkbookException
 
-from openpyxlzip.writer.excel import save_workbook
+from openpyxlzip.writer.excel import save_workbook, save_stream, stream_workbook
 
 from openpyxlzip.styles.cell_style import StyleArray
 from openpyxlzip.styles.named_styles import NamedStyle
@@ -58,6 +58,7 @@ class Workbook(object):
     def __init__(self,
                  write_only=False,
                  iso_dates=False,
+                 shared_strings=False,
                  ):
         self._sheets = []
         self._pivots = []
@@ -80,6 +81,7 @@ class Workbook(object):
         self._setup_styles()
 
         self.loaded_theme = None
+        self._parts = None
         self.vba_archive = None
         self.app_archive = None
         self.arc_custom = None
@@ -88,6 +90,8 @@ class Workbook(object):
         self.epoch = CALENDAR_WINDOWS_1900
         self.encoding = "utf-8"
         self.iso_dates = iso_dates
+        self.use_shared_strings = shared_strings
+        self._stream_writer = None
 
         if not self.write_only:
             self._sheets.append(Worksheet(self))
@@ -386,10 +390,55 @@ class Workbook(object):
         return ct
 
 
-    def save(self, filename):
+    def stream_to(self, filename, compresslevel=None):
+        """Write the worksheets of a write-only workbook straight into
+        the file `filename` while rows are appended, instead of keeping them
+        in temporary files until the workbook is saved.
+
+        Worksheets are written one after the other: appending to a worksheet
+        closes the worksheet that was written before. The workbook must
+        still be saved, without a filename, to complete the file.
+
+        :param compresslevel: zlib compression level from 1 (fastest) to 9
+            (smallest)
+        :type compresslevel: int
+        """
+        if not self.write_only:
+            raise TypeError("Only write-only workbooks can be streamed")
+        if self._stream_writer is not None:
+            raise ValueError("Workbook is already streamed")
+        if any(ws._writer is not None for ws in self.worksheets):
+            raise ValueError("Worksheets have already been written to")
+        self._stream_writer = stream_workbook(self, filename, compresslevel)
+
+
+    def save(self, filename=None, shared_strings=None, compact_xml=False, workers=None,
+             compresslevel=None):
         """Save the current workbook under the given `filename`.
         Use this function instead of using an `ExcelWriter`.
 
+        :param shared_strings: write strings to a shared string table
+            instead of inline. Defaults to the value the workbook was
+            created with.
+        :type shared_strings: bool
+
+        :param compact_xml: write package parts without indentation to save
+            time and space.
+        :type compact_xml: bool
+
+        :param workers: write worksheet rows in this many forked processes.
+            Only used on platforms that support forking.
+        :type workers: int
+
+        :param compresslevel: zlib compression level from 1 (fastest) to 9
+            (smallest). Images and other parts that are already compressed
+            are always stored as they are.
+        :type compresslevel: int
+
+        Workbooks streamed with `stream_to()` are saved without a
+        `filename`, and only `compact_xml` can be set: the other options
+        were fixed when streaming started.
+
         .. warning::
             When creating your workbook using `write_only` set to True,
             you will only be able to call this function once. Subsequents attempts to
@@ -399,7 +448,54 @@ class Workbook(object):
             raise TypeError("""Workbook is read-only""")
         if self.write_only and not self.worksheets:
             self.create_sheet()
-        save_workbook(self, filename)
+        if self._stream_writer is not None:
+            if filename is not None:
+                raise ValueError("Streamed workbooks are saved to the file they are streamed to")
+            if (shared_strings is not None or workers is not None
+                or compresslevel is not None):
+                raise ValueError("Only compact_xml can be set when saving a streamed workbook")
+            writer, self._stream_writer = self._stream_writer, None
+            writer.compact_xml = compact_xml
+            writer.save()
+            return
+        if filename is None:
+            raise TypeError("A filename is required")
+        if shared_strings is None:
+            shared_strings = self.use_shared_strings
+        save_workbook(self, filename, shared_strings=shared_strings,
+                      compact_xml=compact_xml, workers=workers,
+                      compresslevel=compresslevel)
+
+
+    def save_stream(self, fileobj, shared_strings=None, compact_xml=False,
+                    compresslevel=None):
+        """Write the workbook to a file-like object that is only written
+        to, such as a socket, a pipe or a web response, without buffering
+        the whole file. Parts are written with data descriptors so nothing
+        has to be sought back to.
+
+        :param shared_strings: write strings to a shared string table
+            instead of inline. Defaults to the value the workbook was
+            created with.
+        :type shared_strings: bool
+
+        :param compact_xml: write package parts without indentation
+        :type compact_xml: bool
+
+        :param compresslevel: zlib compression level from 1 (fastest) to 9
+            (smallest)
+        :type compresslevel: int
+        """
+        if self.read_only:
+            raise TypeError("""Workbook is read-only""")
+        if self._stream_writer is not None:
+            raise ValueError("Streamed workbooks are saved to the file they are streamed to")
+        if self.write_only and not self.worksheets:
+            self.create_sheet()
+        if shared_strings is None:
+            shared_strings = self.use_shared_strings
+        save_stream(self, fileobj, shared_strings=shared_strings,
+                    compact_xml=compact_xml, compresslevel=compresslevel)
 
 
     @property
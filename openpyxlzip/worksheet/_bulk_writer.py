@@ -0,0 +1,386 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+"""
+Write blocks of values from numpy arrays and pandas dataframes to write-only
+worksheets.
+
+The type and the style of each column are determined once, the values are
+formatted a column at a time and the rows are written as markup without
+creating any cells. Columns of Python objects fall back to inferring the
+type of each value.
+"""
+
+from copy import copy
+from xml.sax.saxutils import quoteattr
+
+from openpyxlzip.cell import Cell, WriteOnlyCell
+from openpyxlzip.cell.cell import (
+    ERROR_CODES,
+    ILLEGAL_CHARACTERS_RE,
+    TIME_FORMATS,
+)
+from openpyxlzip.styles import is_date_format
+from openpyxlzip.utils.exceptions import IllegalCharacterError
+from openpyxlzip.utils import get_column_letter
+from openpyxlzip.utils.dataframe import _datetime64_to_serial, _timedelta64_to_days
+from openpyxlzip.utils.datetime import days_to_time, to_excel
+
+import datetime
+
+# rows formatted at once
+CHUNK_SIZE = 1024
+
+# largest integer that "%.16g" formats without an exponent
+MAX_INT_DIGITS = 10**16
+
+
+def _escape(value):
+    """
+    Escape text like the XML serialisers
+    """
+    if "&" in value:
+        value = value.replace("&", "&amp;")
+    if "<" in value:
+        value = value.replace("<", "&lt;")
+    if ">" in value:
+        value = value.replace(">", "&gt;")
+    if "\r" in value:
+        value = value.replace("\r", "&#13;")
+    return value
+
+
+def _style_template(ws, style=None):
+    """
+    Return a cell holding the style of a column
+    """
+    cell = WriteOnlyCell(ws)
+    if isinstance(style, Cell):
+        cell._style = copy(style._style)
+    elif style is not None:
+        cell.style = style
+    return cell
+
+
+class ColumnWriter(object):
+
+    """
+    Markup for the cells of a single column of an array
+    """
+
+    def __init__(self, ws, idx, values, style=None, shared_strings=None):
+        self.ws = ws
+        self.letter = get_column_letter(idx)
+        self.values = values
+        self.template = _style_template(ws, style)
+        self.shared_strings = shared_strings
+        self.cells = self._get_formatter()
+
+
+    def _style_attr(self, number_format=None):
+        template = self.template
+        if number_format is not None and not is_date_format(template.number_format):
+            template = copy(template)
+            template.number_format = number_format
+        if template.has_style:
+            return ' s="{0}"'.format(template.style_id)
+        return ""
+
+
+    def _get_formatter(self):
+        kind = self.values.dtype.kind
+        wb = self.ws.parent
+
+        if kind == "b":
+            self._head = '{0} t="b"><v>'.format(self._style_attr())
+            return self._bools
+        if kind in "iu":
+            self._head = '{0} t="n"><v>'.format(self._style_attr())
+            return self._integers
+        if kind == "f":
+            self._head = '{0} t="n"><v>'.format(self._style_attr())
+            return self._floats
+        if kind == "M" and not wb.iso_dates:
+            self._head = '{0} t="n"><v>'.format(
+                self._style_attr(TIME_FORMATS[datetime.datetime]))
+            self.values = _datetime64_to_serial(self.values, wb.epoch)
+            return self._floats
+        if kind == "M":
+            self._head = '{0} t="d"><v>'.format(
+                self._style_attr(TIME_FORMATS[datetime.datetime]))
+            return self._isoformats
+        if kind == "m" and not wb.iso_dates:
+            self._head = '{0} t="n"><v>'.format(
+                self._style_attr(TIME_FORMATS[datetime.timedelta]))
+            self.values = _timedelta64_to_days(self.values)
+            return self._floats
+        if kind in "mM":
+            # Python objects for the precision that the cells support
+            self.values = self.values.astype(self.values.dtype.str[:3] + "[us]")
+        if kind in "US":
+            return self._strings
+        return self._objects
+
+
+    def _markup(self, rows, texts):
+        start = '<c r="' + self.letter
+        head = self._head
+        return [
+            f'{start}{row}"{head}{text}</v></c>' if text is not None else ""
+            for row, text in zip(rows, texts)
+        ]
+
+
+    def _bools(self, rows, values):
+        texts = ["1" if value else "0" for value in values.tolist()]
+        return self._markup(rows, texts)
+
+
+    def _integers(self, rows, values):
+        if values.size and abs(values).max() >= MAX_INT_DIGITS:
+            texts = ["%.16g" % value for value in values.tolist()]
+        else:
+            texts = list(map(str, values.tolist()))
+        return self._markup(rows, texts)
+
+
+    def _floats(self, rows, values):
+        import numpy
+        texts = ["%.16g" % value for value in values.tolist()]
+        for pos in numpy.flatnonzero(~numpy.isfinite(values)).tolist():
+            texts[pos] = None
+        return self._markup(rows, texts)
+
+
+    def _isoformats(self, rows, values):
+        import numpy
+        missing = numpy.isnat(values)
+        texts = numpy.datetime_as_string(values, unit="s").tolist()
+        micro = values.astype("datetime64[us]")
+        fractions = (micro != micro.astype("datetime64[s]")) & ~missing
+        for pos in numpy.flatnonzero(fractions).tolist():
+            texts[pos] = numpy.datetime_as_string(micro[pos], unit="us")
+        for pos in numpy.flatnonzero(missing).tolist():
+            texts[pos] = None
+        return self._markup(rows, texts)
+
+
+    def _strings(self, rows, values):
+        """
+        Strings need no cells to check them or to infer formulae and errors
+        """
+        if not isinstance(values, list):
+            values = values.tolist()
+        if ILLEGAL_CHARACTERS_RE.search("".join(v for v in values if v is not None)):
+            raise IllegalCharacterError
+        attrs = self._style_attr()
+        result = []
+        append = result.append
+
+        for row, value in zip(rows, values):
+            if value is None:
+                append("")
+                continue
+            value = value[:32767]
+            data_type = "s"
+            if len(value) > 1 and value.startswith("="):
+                data_type = "f"
+            elif value in ERROR_CODES:
+                data_type = "e"
+            append(self._cell(row, value, data_type, attrs))
+        return result
+
+
+    def _objects(self, rows, values):
+        values = values.tolist()
+        if all(type(value) is str for value in values if value is not None):
+            return self._strings(rows, values)
+
+        style = self.template._style
+        cell = WriteOnlyCell(self.ws)
+        cell._style = copy(style)
+        default = self._style_attr()
+        result = []
+        append = result.append
+
+        for row, value in zip(rows, values):
+            if value is None or value != value: # NaN and NaT are missing
+                append("")
+                continue
+            cell.value = value
+            data_type = cell.data_type
+            attrs = default
+            if data_type == "d":
+                # dates get a number format
+                attrs = ' s="{0}"'.format(cell.style_id)
+                cell._style = copy(style)
+            append(self._cell(row, cell._value, data_type, attrs))
+        return result
+
+
+    def _cell(self, row, value, data_type, attrs):
+        """
+        Markup for a cell with a value of any type, as written by `write_cell`
+        """
+        start = '<c r="{0}{1}"{2}'.format(self.letter, row, attrs)
+
+        if data_type == "s":
+            if self.shared_strings is not None and value:
+                idx = self.shared_strings.add(value)
+                return f'{start} t="s"><v>{idx}</v></c>'
+            if value == "":
+                return f'{start} t="inlineStr"/>'
+            space = ""
+            if value != value.strip():
+                space = ' xml:space="preserve"'
+            return f'{start} t="inlineStr"><is><t{space}>{_escape(value)}</t></is></c>'
+
+        if data_type == "f":
+            return f'{start}><f>{_escape(value[1:])}</f><v></v></c>'
+
+        if data_type == "d":
+            wb = self.ws.parent
+            if wb.iso_dates:
+                if isinstance(value, datetime.timedelta):
+                    value = days_to_time(value)
+                return f'{start} t="d"><v>{value.isoformat()}</v></c>'
+            value = to_excel(value, wb.epoch)
+            data_type = "n"
+
+        if data_type == "b":
+            value = value and "1" or "0"
+        elif data_type == "n":
+            if value != value or value in (float("inf"), float("-inf")):
+                return ""
+            value = "%.16g" % value
+        else:
+            value = _escape(value)
+        return f'{start} t="{data_type}"><v>{value}</v></c>'
+
+
+class RowBlock(object):
+
+    """
+    Rows of a two-dimensional array and any header rows, written in chunks
+    """
+
+    def __init__(self, ws, columns, header=(), styles=None, shared_strings=None):
+        if styles is None:
+            styles = {}
+        self.ws = ws
+        self.columns = [
+            ColumnWriter(ws, idx, values, styles.get(idx - 1), shared_strings)
+            for idx, values in enumerate(columns, 1)
+        ]
+        self.header = [
+            ColumnWriter(ws, idx, values, None, shared_strings)
+            for idx, values in enumerate(header, 1)
+        ]
+        self.size = len(columns[0]) if columns else 0
+
+
+    def chunks(self, row_idx):
+        """
+        Yield the markup for the rows in chunks, starting at `row_idx`
+        """
+        if self.header:
+            size = len(self.header[0].values)
+            yield self._rows(self.header, row_idx, 0, size), size
+            row_idx += size
+
+        for start in range(0, self.size, CHUNK_SIZE):
+            stop = min(start + CHUNK_SIZE, self.size)
+            yield self._rows(self.columns, row_idx + start, start, stop), stop - start
+
+
+    def _rows(self, columns, row_idx, start, stop):
+        rows = list(map(str, range(row_idx, row_idx + stop - start)))
+        cells = [column.cells(rows, column.values[start:stop]) for column in columns]
+        markup = [
+            '<row r="{0}">{1}</row>'.format(row, "".join(row_cells))
+            for row, row_cells in zip(rows, zip(*cells))
+        ]
+
+        dims = self.ws.row_dimensions
+        for idx in range(row_idx, row_idx + len(rows)):
+            if idx in dims:
+                attrs = "".join(
+                    " {0}={1}".format(key, quoteattr(value)) for key, value in dims[idx]
+                )
+                pos = idx - row_idx
+                markup[pos] = markup[pos].replace(">", attrs + ">", 1)
+        return "".join(markup)
+
+
+    def write(self, writer, xf, row_idx):
+        """
+        Write the rows to the sheet data and return the index of the next row
+        """
+        for markup, size in self.chunks(row_idx):
+            writer.write_raw(xf, markup)
+            row_idx += size
+        return row_idx
+
+
+def array_columns(array):
+    """
+    Return the columns of a two-dimensional array
+    """
+    import numpy
+    array = numpy.asarray(array)
+    if array.ndim != 2:
+        raise ValueError("Arrays must have two dimensions, not {0}".format(array.ndim))
+    return list(array.T)
+
+
+def series_values(series):
+    """
+    Return the values of a series as an array that can be written
+    """
+    import numpy
+    dtype = series.dtype
+    if getattr(dtype, "tz", None) is not None:
+        # timezone aware datetimes are written as local times
+        return series.dt.tz_localize(None).to_numpy()
+    if isinstance(dtype, numpy.dtype) and dtype.kind != "O":
+        return series.to_numpy()
+    values = series.to_numpy(dtype=object)
+    values[series.isna().to_numpy()] = None
+    return values
+
+
+def frame_columns(df, index=True, header=True):
+    """
+    Return the columns and the header columns of a dataframe
+    """
+    import numpy
+    columns = [series_values(df.iloc[:, pos]) for pos in range(df.shape[1])]
+    labels = [
+        [_label(value) for value in df.columns.get_level_values(level)]
+        for level in range(df.columns.nlevels)
+    ]
+
+    if index:
+        idx = df.index
+        columns = [
+            series_values(idx.get_level_values(level).to_series())
+            for level in range(idx.nlevels)
+        ] + columns
+        # index names go in the last row of the header
+        blank = [None] * idx.nlevels
+        names = [_label(name) for name in idx.names]
+        labels = [blank + row for row in labels[:-1]] + [names + labels[-1]]
+
+    headers = []
+    if header:
+        for values in zip(*labels):
+            column = numpy.empty(len(values), dtype=object)
+            column[:] = values
+            headers.append(column)
+    return columns, headers
+
+
+def _label(value):
+    import numpy
+    if isinstance(value, numpy.generic):
+        return value.item()
+    return value
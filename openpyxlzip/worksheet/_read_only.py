@@ -8,6 +8,7 @@ from openpyxlzip.cell.read_only import ReadOnlyCell, EMPTY_CELL
 from openpyxlzip.utils import get_column_letter
 
 from ._reader import WorkSheetParser
+from ._row_index import RowIndex
 
 
 def read_dimension(source):
@@ -20,6 +21,11 @@ class ReadOnlyWorksheet(object):
     _min_column = 1
     _min_row = 1
     _max_column = _max_row = None
+    _row_index = None
+    # seek close to the first row requested instead of parsing from the top
+    use_row_index = True
+    # rows closer to the top are cheaper to parse than building the index
+    row_index_threshold = 1000
 
     # from Standard Worksheet
     # Methods from Worksheet
@@ -50,11 +56,25 @@ class ReadOnlyWorksheet(object):
             self._min_column, self._min_row, self._max_column, self._max_row = dimensions
 
 
-    def _get_source(self):
+    def _get_source(self, min_row=1):
         """Parse xml source on demand, must close after use"""
+        if min_row > self.row_index_threshold and self.use_row_index:
+            src = self._get_row_index().open(min_row, self.parent.data_only)
+            if src is not None:
+                return src
         return self.parent._archive.open(self._worksheet_path)
 
 
+    def _get_row_index(self):
+        """
+        Index of row checkpoints, built the first time it is needed
+        """
+        if self._row_index is None:
+            index = RowIndex(self.parent._archive, self._worksheet_path)
+            self._row_index = index.build()
+        return self._row_index
+
+
     def _cells_by_row(self, min_col, min_row, max_col, max_row, values_only=False):
         """
         The source worksheet file may have columns or rows missing.
@@ -72,11 +92,16 @@ class ReadOnlyWorksheet(object):
 
         counter = min_row
         idx = 1
-        src = self._get_source()
+        src = self._get_source(min_row)
         parser = WorkSheetParser(src, self._shared_strings,
                                  data_only=self.parent.data_only, epoch=self.parent.epoch,
                                  date_formats=self.parent._date_formats)
-        for idx, row in parser.parse():
+        if values_only:
+            rows = parser.parse_values()
+        else:
+            rows = parser.parse()
+
+        for idx, row in rows:
             if max_row is not None and idx > max_row:
                 break
 
@@ -87,7 +112,10 @@ class ReadOnlyWorksheet(object):
 
             # return cells from a row
             if counter <= idx:
-                row = self._get_row(row, min_col, max_col, values_only)
+                if values_only:
+                    row = self._get_values(row, min_col, max_col)
+                else:
+                    row = self._get_row(row, min_col, max_col)
                 counter += 1
                 yield row
 
@@ -101,11 +129,13 @@ class ReadOnlyWorksheet(object):
     def _get_row(self, row, min_col=1, max_col=None, values_only=False):
         """
         Make sure a row contains always the same number of cells or values
+
+        Cells are (row, column, value, data_type, style_id) records from the parser
         """
         if not row and not max_col: # in case someone wants to force rows where there aren't any
             return ()
 
-        max_col = max_col or  row[-1]['column']
+        max_col = max_col or row[-1][1]
         row_width = max_col + 1 - min_col
 
         new_row = [EMPTY_CELL] * row_width
@@ -113,13 +143,29 @@ class ReadOnlyWorksheet(object):
             new_row = [None] * row_width
 
         for cell in row:
-            counter = cell['column']
+            counter = cell[1]
             if min_col <= counter <= max_col:
                 idx = counter - min_col # position in list of cells returned
-                new_row[idx] = cell['value']
-                if not values_only:
-                    new_row[idx] = ReadOnlyCell(self, **cell)
+                if values_only:
+                    new_row[idx] = cell[2]
+                else:
+                    new_row[idx] = ReadOnlyCell(self, *cell)
+
+        return tuple(new_row)
+
+
+    def _get_values(self, row, min_col=1, max_col=None):
+        """
+        Make sure a row of (column, value) pairs always contains the same number of values
+        """
+        if not row and not max_col:
+            return ()
 
+        max_col = max_col or row[-1][0]
+        new_row = [None] * (max_col + 1 - min_col)
+        for column, value in row:
+            if min_col <= column <= max_col:
+                new_row[column - min_col] = value
         return tuple(new_row)
 
 
@@ -2,9 +2,11 @@
 
 """Reader for a single worksheet."""
 from copy import copy
+from string import digits
 from warnings import warn
 
 # compatibility imports
+from openpyxlzip import LXML
 from openpyxlzip.xml.functions import (iterparse, fromstring)
 
 # package imports
@@ -26,6 +28,7 @@ from openpyxlzip.utils import (
     get_column_letter,
     coordinate_to_tuple,
     )
+from openpyxlzip.utils.cell import _COL_STRING_CACHE
 from openpyxlzip.utils.datetime import from_excel, from_ISO8601, WINDOWS_EPOCH
 from openpyxlzip.descriptors.excel import ExtensionList
 
@@ -105,6 +108,11 @@ ALL_CHILD_TAGS = set([MERGE_TAG, CF_TAG, PROT_TAG, HYPERLINK_TAG, TABLE_TAG, PRI
                 DRAWING_TAG, DRAWING_HF_TAG, PICTURE_TAG, OLE_OBJECTS_TAG, CONTROLS_TAG,
                 WEB_PUBLISH_ITEMS_TAG])
 
+# Cells are parsed into plain tuples of (row, column, value, data_type,
+# style_id) which are cheaper to create than dictionaries or objects. The
+# order matches ReadOnlyCell.
+
+
 def _cast_number(value):
     "Convert numbers as string to an int or float"
     if "." in value or "E" in value or "e" in value:
@@ -207,6 +215,32 @@ class WorkSheetParser(object):
                 pass
         # print(self.extra_elem.keys())
 
+    def parse_values(self):
+        """
+        Yield the index and the (column, value) pairs of each row.
+
+        A faster alternative to `parse()` when only values are needed: only
+        rows are parsed and row dimensions are not collected.
+        """
+        for row in self.iter_row_elements():
+            yield self.parse_row_values(row)
+
+
+    def iter_row_elements(self):
+        """
+        Yield the row elements of the source, all other elements are skipped
+        """
+        if LXML:
+            it = iterparse(self.source, tag=ROW_TAG)
+        else:
+            it = iterparse(self.source)
+
+        for _event, element in it:
+            if element.tag == ROW_TAG:
+                yield element
+                element.clear()
+
+
     def parse_dimensions(self):
         """
         Get worksheet dimensions if they are provided.
@@ -232,17 +266,26 @@ class WorkSheetParser(object):
         if style_id:
             style_id = int(style_id)
 
+        # a cell has at most one of each child, looping is much cheaper than find()
+        value = formula = inline = None
+        for child in element:
+            tag = child.tag
+            if tag == VALUE_TAG:
+                value = child.text or None
+            elif tag == FORMULA_TAG:
+                formula = child
+            elif tag == INLINE_STRING:
+                inline = child
+
         if data_type == "inlineStr":
             value = None
-        else:
-            value = element.findtext(VALUE_TAG, None) or None
 
         if coordinate:
             row, column = coordinate_to_tuple(coordinate)
         else:
             row, column = self.row_counter, self.col_counter
 
-        if not self.data_only and element.find(FORMULA_TAG) is not None:
+        if not self.data_only and formula is not None:
             data_type = 'f'
             value = self.parse_formula(element)
 
@@ -268,13 +311,12 @@ class WorkSheetParser(object):
                 value = from_ISO8601(value)
 
         elif data_type == 'inlineStr':
-                child = element.find(INLINE_STRING)
-                if child is not None:
+                if inline is not None:
                     data_type = 's'
-                    richtext = Text.from_tree(child)
+                    richtext = Text.from_tree(inline)
                     value = richtext.content
 
-        return {'row':row, 'column':column, 'value':value, 'data_type':data_type, 'style_id':style_id}
+        return row, column, value, data_type, style_id
 
 
     def parse_formula(self, element):
@@ -327,6 +369,57 @@ class WorkSheetParser(object):
         return self.row_counter, cells
 
 
+    def parse_row_values(self, row):
+        """
+        Numbers, shared strings and booleans are converted directly, other
+        cells such as formulae, dates and inline strings use `parse_cell()`
+        """
+        r = row.get('r')
+        if r is not None:
+            self.row_counter = int(r)
+        else:
+            self.row_counter += 1
+        self.col_counter = 0
+
+        values = []
+        for element in row:
+            data_type = element.get('t', 'n')
+            simple = data_type != "inlineStr" and data_type != "d"
+            value = None
+            for child in element:
+                if child.tag == VALUE_TAG:
+                    value = child.text or None
+                elif child.tag == FORMULA_TAG and not self.data_only:
+                    simple = False
+
+            if simple and data_type == 'n' and self.date_formats:
+                style_id = element.get('s')
+                simple = not style_id or int(style_id) not in self.date_formats
+
+            if not simple:
+                cell = self.parse_cell(element)
+                values.append((cell[1], cell[2]))
+                continue
+
+            self.col_counter += 1
+            coordinate = element.get('r')
+            if coordinate:
+                column = _COL_STRING_CACHE[coordinate.rstrip(digits).upper()]
+            else:
+                column = self.col_counter
+
+            if value is not None:
+                if data_type == 'n':
+                    value = _cast_number(value)
+                elif data_type == 's':
+                    value = self.shared_strings[int(value)]
+                elif data_type == 'b':
+                    value = bool(int(value))
+            values.append((column, value))
+
+        return self.row_counter, values
+
+
     def parse_formatting(self, element):
         try:
             cf = ConditionalFormatting.from_tree(element)
@@ -388,13 +481,13 @@ class WorksheetReader(object):
 
 
     def bind_cells(self):
+        cell_styles = self.ws.parent._cell_styles
         for idx, row in self.parser.parse():
-            for cell in row:
-                style = self.ws.parent._cell_styles[cell['style_id']]
-                c = Cell(self.ws, row=cell['row'], column=cell['column'], style_array=style)
-                c._value = cell['value']
-                c.data_type = cell['data_type']
-                self.ws._cells[(cell['row'], cell['column'])] = c
+            for row_idx, column, value, data_type, style_id in row:
+                c = Cell(self.ws, row=row_idx, column=column, style_array=cell_styles[style_id])
+                c._value = value
+                c.data_type = data_type
+                self.ws._add_cell(c)
         self.ws.formula_attributes = self.parser.array_formulae
         if self.ws._cells:
             self.ws._current_row = self.ws.max_row # use cells not row dimensions
@@ -452,9 +545,9 @@ class WorksheetReader(object):
         Returns the appropriate cell to which a hyperlink, which references a merged cell at the specified coordinates,
         should be bound.
         """
-        for rng in self.ws.merged_cells:
-            if coord in rng:
-                return self.ws.cell(*rng.top[0])
+        rng = self.ws.merged_cells.find(coord)
+        if rng is not None:
+            return self.ws.cell(*rng.top[0])
 
     def bind_col_dimensions(self):
         for col, cd in self.parser.column_dimensions.items():
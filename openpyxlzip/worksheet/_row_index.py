@@ -0,0 +1,234 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+"""
+Index of the rows of a worksheet part so that read-only worksheets can start
+parsing close to a given row instead of at the top of the sheet.
+
+The index is built with a single pass over the part which inflates the data
+and scans it for row tags without parsing any XML. The position of every
+`step`th row is recorded and every `interval` bytes of inflated data a copy
+of the decompressor is kept, so that a later read only needs to inflate the
+data from the nearest checkpoint and can skip to the row without parsing.
+"""
+
+from array import array
+from bisect import bisect_right
+import re
+import zlib
+from zipfile import ZIP_STORED, ZIP_DEFLATED
+
+from openpyxlzip.packaging.parts import iter_raw, CHUNK_SIZE
+
+
+CHECKPOINT_INTERVAL = 1024 * 1024
+ROW_STEP = 32
+
+# tags of interest in the inflated part: only complete tags can match
+SHEET_DATA_START = re.compile(rb"<(?:[\w.-]+:)?sheetData\b[^>]*>")
+TOKEN = re.compile(rb"<(/?)(?:[\w.-]+:)?(row|f|sheetData)\b([^>]*)>")
+ROW_ATTR = re.compile(rb"""\sr\s*=\s*["'](\d+)["']""")
+SHARED_ATTR = re.compile(rb"""\st\s*=\s*["']shared["']""")
+# longest incomplete tag that is kept for the next chunk
+LOOKBEHIND = 4096
+
+
+class _Stored(object):
+    """
+    Decompressor interface for stored members
+    """
+
+    def decompress(self, data):
+        return data
+
+
+    def copy(self):
+        return self
+
+
+class Checkpoint(object):
+
+    __slots__ = ("base", "raw_offset", "state")
+
+    def __init__(self, base, raw_offset, state):
+        self.base = base # position of the next inflated byte
+        self.raw_offset = raw_offset # position of the next compressed byte
+        self.state = state # decompressor
+
+
+class RowIndex(object):
+
+    """
+    Row positions and decompressor checkpoints for a single worksheet part
+    """
+
+    def __init__(self, archive, name, interval=CHECKPOINT_INTERVAL, step=ROW_STEP,
+                 chunk_size=CHUNK_SIZE):
+        self.archive = archive
+        self.info = archive.getinfo(name)
+        self.interval = interval
+        self.step = step
+        self.chunk_size = chunk_size
+        self.head = None
+        self.shared_formula = None
+        self.checkpoints = []
+        self.rows = array("q")
+        self.offsets = array("q")
+        self._counter = 0
+
+
+    @property
+    def supported(self):
+        info = self.info
+        return (info.compress_type in (ZIP_STORED, ZIP_DEFLATED)
+                and not info.flag_bits & 0x1)
+
+
+    def _decompressor(self):
+        if self.info.compress_type == ZIP_STORED:
+            return _Stored()
+        return zlib.decompressobj(-15)
+
+
+    def build(self):
+        """
+        Scan the part and collect the row positions and checkpoints
+        """
+        if not self.supported or self.info.file_size <= self.interval:
+            return self
+
+        decompressor = self._decompressor()
+        self.checkpoints.append(Checkpoint(0, 0, decompressor.copy()))
+        data = b"" # inflated data not scanned yet
+        start = 0 # position of data in the inflated part
+        raw_offset = 0
+
+        for raw in iter_raw(self.archive, self.info, chunk_size=self.chunk_size):
+            raw_offset += len(raw)
+            data += decompressor.decompress(raw)
+            end = start + len(data)
+
+            if self.head is None:
+                match = SHEET_DATA_START.search(data)
+                if match is None:
+                    continue
+                if match.group().endswith(b"/>"):
+                    break
+                self.head = data[:match.end()]
+                data = data[match.end():]
+                start = match.end()
+
+            try:
+                pos = self._scan(data, start)
+            except StopIteration:
+                return self
+            except ValueError:
+                # rows out of order, the index cannot be used
+                break
+
+            pos = max(pos, len(data) - LOOKBEHIND)
+            data = data[pos:]
+            start += pos
+            if end - self.checkpoints[-1].base >= self.interval:
+                self.checkpoints.append(Checkpoint(end, raw_offset, decompressor.copy()))
+
+        self.rows = array("q")
+        self.offsets = array("q")
+        return self
+
+
+    def _scan(self, data, start):
+        """
+        Record the rows in a chunk of inflated data and return the position
+        after the last complete tag.
+        """
+        pos = 0
+        for match in TOKEN.finditer(data):
+            closing, tag, attrs = match.groups()
+            pos = match.end()
+            if closing:
+                if tag == b"sheetData":
+                    raise StopIteration
+            elif tag == b"row":
+                self._counter -= 1
+                if self._counter > 0:
+                    continue
+                row = ROW_ATTR.search(attrs)
+                if row is None:
+                    continue
+                row = int(row.group(1))
+                if self.rows and row <= self.rows[-1]:
+                    raise ValueError("Row {0} is out of order".format(row))
+                self.rows.append(row)
+                self.offsets.append(start + match.start())
+                self._counter = self.step
+            elif tag == b"f":
+                if self.shared_formula is None and SHARED_ATTR.search(attrs):
+                    self.shared_formula = start + match.start()
+        return pos
+
+
+    def find(self, row, data_only=False):
+        """
+        Return the position of the last indexed row up to a row.
+        Shared formulae have to be parsed from the top unless values are read.
+        """
+        idx = bisect_right(self.rows, row)
+        if not idx:
+            return
+        offset = self.offsets[idx - 1]
+        if data_only or self.shared_formula is None or offset <= self.shared_formula:
+            return offset
+
+
+    def open(self, row, data_only=False):
+        """
+        Return a stream for the worksheet which starts close to a row or None
+        """
+        offset = self.find(row, data_only)
+        if offset is None:
+            return
+        bases = [checkpoint.base for checkpoint in self.checkpoints]
+        checkpoint = self.checkpoints[bisect_right(bases, offset) - 1]
+        return ResumedPart(self, checkpoint, offset)
+
+
+class ResumedPart(object):
+
+    """
+    Worksheet source consisting of the head of the part up to the start of
+    the sheet data followed by the part from a row onwards.
+    """
+
+    def __init__(self, index, checkpoint, offset):
+        self._buffer = index.head
+        self._pos = 0
+        self._skip = offset - checkpoint.base
+        self._state = checkpoint.state.copy()
+        self._chunks = iter_raw(index.archive, index.info, checkpoint.raw_offset,
+                                index.chunk_size)
+
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) - self._pos < size:
+            raw = next(self._chunks, None)
+            if raw is None:
+                break
+            data = self._state.decompress(raw)
+            if self._skip:
+                skipped = min(self._skip, len(data))
+                data = data[skipped:]
+                self._skip -= skipped
+            self._buffer = self._buffer[self._pos:] + data
+            self._pos = 0
+
+        if size < 0:
+            size = len(self._buffer) - self._pos
+        data = self._buffer[self._pos:self._pos + size]
+        self._pos += len(data)
+        return data
+
+
+    def close(self):
+        self._chunks.close()
+        self._buffer = b""
+        self._pos = 0
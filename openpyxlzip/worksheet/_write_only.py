@@ -11,6 +11,7 @@ from .worksheet import Worksheet
 from openpyxlzip.utils.exceptions import WorkbookAlreadySaved
 
 from ._writer import WorksheetWriter
+from ._bulk_writer import RowBlock, array_columns, frame_columns
 
 
 class WriteOnlyWorksheet(_WorkbookChild):
@@ -24,6 +25,7 @@ class WriteOnlyWorksheet(_WorkbookChild):
     __saved = False
     _writer = None
     _rows = None
+    _entry = None
     _rel_type = Worksheet._rel_type
     _path = Worksheet._path
     mime_type = Worksheet.mime_type
@@ -67,6 +69,9 @@ class WriteOnlyWorksheet(_WorkbookChild):
             try:
                 while True:
                     row = (yield)
+                    if isinstance(row, RowBlock):
+                        row_idx = row.write(self._writer, xf, row_idx)
+                        continue
                     row = self._values_to_row(row, row_idx)
                     self._writer.write_row(xf, row, row_idx)
                     row_idx += 1
@@ -78,7 +83,14 @@ class WriteOnlyWorksheet(_WorkbookChild):
 
     def _get_writer(self):
         if self._writer is None:
-            self._writer = WorksheetWriter(self)
+            shared_strings = None
+            if self.parent.use_shared_strings:
+                shared_strings = self.parent.shared_strings
+            stream = getattr(self.parent, "_stream_writer", None)
+            if stream is not None:
+                self._entry = stream.open_worksheet(self)
+            self._writer = WorksheetWriter(self, out=self._entry,
+                                           shared_strings=shared_strings)
             self._writer.write_top()
 
 
@@ -96,6 +108,8 @@ class WriteOnlyWorksheet(_WorkbookChild):
         self._writer.write_tail()
 
         self._writer.close()
+        if self._entry is not None:
+            self._entry.close()
         self.__saved = True
 
 
@@ -119,6 +133,58 @@ class WriteOnlyWorksheet(_WorkbookChild):
         self._rows.send(row)
 
 
+    def _append_block(self, columns, header=(), styles=None):
+        self._get_writer()
+
+        if self._rows is None:
+            self._rows = self._write_rows()
+            next(self._rows)
+
+        if styles is not None and not isinstance(styles, dict):
+            styles = dict(enumerate(styles))
+        block = RowBlock(self, columns, header, styles, self._writer.shared_strings)
+        self._rows.send(block)
+
+
+    def write_array(self, array, styles=None):
+        """
+        Append the rows of a two-dimensional numpy array.
+
+        The type of each column is determined by the dtype of the array
+        rather than by each value and missing values (NaN, NaT and None) are
+        skipped.
+
+        :param array: two-dimensional array
+        :param styles: named styles, or cells to copy the style from, for
+            the columns in a list or in a dictionary by position
+        """
+        self._append_block(array_columns(array), styles=styles)
+
+
+    def write_frame(self, df, index=True, header=True, styles=None):
+        """
+        Append the rows of a pandas dataframe, including the index and the
+        column labels like `DataFrame.to_excel()`.
+
+        The type of each column is determined by its dtype rather than by
+        each value and missing values are skipped.
+
+        :param df: dataframe
+        :param index: write the index as the first columns
+        :param header: write the column labels as the first rows
+        :param styles: named styles, or cells to copy the style from, for
+            the columns in a dictionary by label
+        """
+        columns, headers = frame_columns(df, index, header)
+        if styles is not None:
+            offset = index and df.index.nlevels or 0
+            styles = {
+                pos + offset: styles[label]
+                for pos, label in enumerate(df.columns) if label in styles
+            }
+        self._append_block(columns, headers, styles)
+
+
     def _values_to_row(self, values, row_idx):
         """
         Convert whatever has been appended into a form suitable for work_rows
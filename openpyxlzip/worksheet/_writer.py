@@ -2,17 +2,17 @@
 
 import atexit
 from collections import defaultdict
-from io import BytesIO
 import os
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, SpooledTemporaryFile
 from warnings import warn
 
 from openpyxlzip import LXML
-from openpyxlzip.xml.functions import xmlfile, tostring
+from openpyxlzip.xml.functions import xmlfile, tostring, Element
 from openpyxlzip.xml.constants import SHEET_MAIN_NS, REL_NS
 
 from openpyxlzip.comments.comment_sheet import CommentRecord
 from openpyxlzip.packaging.relationship import Relationship, RelationshipList
+from openpyxlzip.styles.cell_style import StyleArray
 from openpyxlzip.styles.differential import DifferentialStyle
 from openpyxlzip.drawing.spreadsheet_drawing import SpreadsheetDrawing
 
@@ -24,7 +24,6 @@ from .table import TablePartList
 
 from openpyxlzip.cell._writer import write_cell
 
-from openpyxlzip.xml.schema import ALL_DEFINITIONS, ROOT_ELEMS
 
 PROPERTIES_TAG = '{%s}sheetPr' % SHEET_MAIN_NS
 DIMENSION_TAG = '{%s}dimension' % SHEET_MAIN_NS
@@ -65,6 +64,9 @@ LEGACY_TAG = '{%s}legacyDrawing' % SHEET_MAIN_NS
 TABLE_TAG = "{%s}tableParts" % SHEET_MAIN_NS
 EXT_LIST_TAG = "{%s}extLst" % SHEET_MAIN_NS
 
+# worksheets are kept in memory up to this size and in a temporary file after
+SPOOL_SIZE = 1024 * 1024
+
 ALL_TEMP_FILES = []
 
 @atexit.register
@@ -83,16 +85,30 @@ def create_temporary_file(suffix=''):
     return filename
 
 
+def create_spooled_file(max_size=None):
+    """
+    Return a buffer that is kept in memory until it exceeds `max_size` bytes
+    and moved to an anonymous temporary file after
+    """
+    if max_size is None:
+        max_size = SPOOL_SIZE
+    return SpooledTemporaryFile(max_size=max_size, mode="w+b",
+                                prefix='openpyxlzip.')
+
+
 class WorksheetWriter:
 
 
-    def __init__(self, ws, out=None):
+    def __init__(self, ws, out=None, shared_strings=None, defer_rows=False,
+                 spool_size=None):
         self.ws = ws
         self.ws._hyperlinks = []
         self.ws._comments = []
         if out is None:
-            out = create_temporary_file()
+            out = create_spooled_file(spool_size)
         self.out = out
+        self.shared_strings = shared_strings
+        self.defer_rows = defer_rows
         self._rels = ws._rels
         self.xf = self.get_stream()
         next(self.xf) # start generator
@@ -138,11 +154,11 @@ class WorksheetWriter:
         format
         cols
         """
-        self.write_properties(None)
-        self.write_dimensions(None)
-        self.write_views(None)
-        self.write_format(None)
-        self.write_cols(None)
+        self.write_properties()
+        self.write_dimensions()
+        self.write_views()
+        self.write_format()
+        self.write_cols()
 
 
     def rows(self):
@@ -160,13 +176,30 @@ class WorksheetWriter:
 
 
     def write_rows(self):
+        if self.defer_rows:
+            for row_idx, row in self.rows():
+                self.record_row(row, row_idx)
+            self.xf.send(Element("sheetData")) # placeholder
+            return
+
         xf = self.xf.send(True)
+        self._write_sheet_data(xf)
+        self.xf.send(None) # return control to generator
 
+
+    def _write_sheet_data(self, xf):
         with xf.element("sheetData"):
             for row_idx, row in self.rows():
                 self.write_row(xf, row, row_idx)
 
-        self.xf.send(None) # return control to generator
+
+    def write_sheet_data(self, out):
+        """
+        Write only the sheetData element to `out`. Rows written like this
+        replace the placeholder of a writer created with `defer_rows`.
+        """
+        with xmlfile(out, encoding="UTF-8") as xf:
+            self._write_sheet_data(xf)
 
 
     def write_row(self, xf, row, row_idx):
@@ -186,7 +219,48 @@ class WorksheetWriter:
                     and not cell._comment
                     ):
                     continue
-                write_cell(xf, self.ws, cell, cell.has_style)
+                write_cell(xf, self.ws, cell, cell.has_style, self.shared_strings)
+
+
+    def record_row(self, row, row_idx):
+        """
+        Assign style and shared string indices and collect comments and
+        hyperlinks in the same order as `write_row` without writing the row
+        """
+        dim = self.ws.row_dimensions.get(row_idx)
+        if dim is not None:
+            self._add_style(dim)
+
+        for cell in row:
+            if cell._comment is not None:
+                comment = CommentRecord.from_cell(cell)
+                self.ws._comments.append(comment)
+            if (
+                cell._value is None
+                and not cell.has_style
+                and not cell._comment
+                ):
+                continue
+            if cell.has_style:
+                self._add_style(cell)
+            if (
+                self.shared_strings is not None
+                and cell.data_type == "s"
+                and cell._value
+                ):
+                self.shared_strings.add(cell._value)
+            if cell.hyperlink:
+                self.ws._hyperlinks.append(cell.hyperlink)
+
+
+    def _add_style(self, obj):
+        """
+        Add the style of a cell or row to the workbook, as looking up its
+        `style_id` when writing it would
+        """
+        if obj._style is None:
+            obj._style = StyleArray()
+        self.ws.parent._cell_styles.add(obj._style)
 
 
     def write_protection(self):
@@ -479,8 +553,31 @@ class WorksheetWriter:
             self.xf.send(tables.to_tree())
 
 
+    def write_raw(self, xf, markup):
+        """
+        Write serialised XML to the stream at the current position
+        """
+        if LXML:
+            xf.flush()
+            self._stream.write(markup.encode("utf-8"))
+        else:
+            xf._file(markup)
+
+
     def get_stream(self):
-        with xmlfile(self.out,encoding="UTF-8") as xf:
+        self._stream = self.out
+        if isinstance(self.out, str):
+            # keep the file object for writing serialised XML
+            self._stream = open(self.out, "wb")
+        try:
+            yield from self._get_stream(self._stream)
+        finally:
+            if self._stream is not self.out:
+                self._stream.close()
+
+
+    def _get_stream(self, out):
+        with xmlfile(out, encoding="UTF-8") as xf:
             xf.write_declaration(standalone=True)
             temp_nsmap = {}
             if hasattr(self.ws, "nsmaps") and self.ws.nsmaps is not None:
@@ -535,23 +632,23 @@ class WorksheetWriter:
         web publishing #
         tables
         """
-        self.write_protection(None)
-        self.write_scenarios(None)
-        self.write_filter(None)
-        self.write_merged_cells(None)
-        self.write_formatting(None)
-        self.write_validations(None)
-        self.write_hyperlinks(None)
-        self.write_print(None)
-        self.write_margins(None)
-        self.write_page(None)
-        self.write_header(None)
-        self.write_row_breaks(None)
-        self.write_col_breaks(None)
-        self.write_drawings(None)
-        self.write_legacy(None)
-        self.write_tables(None)
-        self.write_extra(None)
+        self.write_protection()
+        self.write_scenarios()
+        self.write_filter()
+        self.write_merged_cells()
+        self.write_formatting()
+        self.write_validations()
+        self.write_hyperlinks()
+        self.write_print()
+        self.write_margins()
+        self.write_page()
+        self.write_header()
+        self.write_row_breaks()
+        self.write_col_breaks()
+        self.write_drawings()
+        self.write_legacy()
+        self.write_tables()
+        self.write_extra()
 
 
     def write(self):
@@ -640,17 +737,19 @@ class WorksheetWriter:
         Close the context manager and return serialised XML
         """
         self.close()
-        if isinstance(self.out, BytesIO):
-            return self.out.getvalue()
-        with open(self.out, "rb") as src:
-            out = src.read()
-
-        return out
+        if isinstance(self.out, str):
+            with open(self.out, "rb") as src:
+                return src.read()
+        self.out.seek(0)
+        return self.out.read()
 
 
     def cleanup(self):
         """
-        Remove tempfile
+        Remove tempfile or release the buffer
         """
+        if not isinstance(self.out, str):
+            self.out.close()
+            return
         os.remove(self.out)
         ALL_TEMP_FILES.remove(self.out)
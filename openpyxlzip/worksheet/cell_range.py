@@ -14,6 +14,18 @@ from openpyxlzip.utils import (
 )
 
 
+class _Bound(MinMax):
+    """
+    A bound of a range. Moving a range that is held in a range index makes
+    the index stale.
+    """
+
+    def __set__(self, instance, value):
+        super(_Bound, self).__set__(instance, value)
+        if instance.__dict__.get("_indexed"):
+            _RangeIndex.moves += 1
+
+
 class CellRange(Serialisable):
     """
     Represents a range in a sheet: title and coordinates.
@@ -38,10 +50,10 @@ class CellRange(Serialisable):
 
     """
 
-    min_col = MinMax(min=1, max=18278, expected_type=int)
-    min_row = MinMax(min=1, max=1048576, expected_type=int)
-    max_col = MinMax(min=1, max=18278, expected_type=int)
-    max_row = MinMax(min=1, max=1048576, expected_type=int)
+    min_col = _Bound(min=1, max=18278, expected_type=int)
+    min_row = _Bound(min=1, max=1048576, expected_type=int)
+    max_col = _Bound(min=1, max=18278, expected_type=int)
+    max_row = _Bound(min=1, max=1048576, expected_type=int)
 
 
     def __init__(self, range_string=None, min_col=None, min_row=None,
@@ -417,10 +429,103 @@ class CellRange(Serialisable):
         return [(row, self.max_col) for row in range(self.min_row, self.max_row+1)]
 
 
+# rows in each bucket of the index
+BUCKET_ROWS = 32
+# ranges that span more buckets than this are checked one by one
+MAX_BUCKETS = 64
+# fewer ranges than this are searched without an index
+INDEX_SIZE = 16
+
+
+class _RangeIndex(object):
+
+    """
+    Ranges bucketed by the blocks of rows they cover, so that only the
+    ranges near a cell have to be checked. Moving an indexed range, or
+    replacing one in the list, increments `moves` which makes every index
+    built before stale.
+    """
+
+    moves = 0
+
+    def __init__(self, ranges):
+        self.ranges = ranges
+        self.moves = _RangeIndex.moves
+        self.size = 0
+        self.buckets = {}
+        self.wide = []
+        for cr in ranges:
+            self.add(cr)
+
+
+    def is_current(self, ranges):
+        """
+        Check that the list of ranges has not been replaced or changed in size
+        and that no indexed range has been moved since the index was built
+        """
+        return (self.ranges is ranges and self.size == len(ranges)
+                and self.moves == _RangeIndex.moves)
+
+
+    def _lists(self, cr):
+        first = cr.min_row // BUCKET_ROWS
+        last = cr.max_row // BUCKET_ROWS
+        if last - first > MAX_BUCKETS:
+            return [self.wide]
+        return [self.buckets.setdefault(idx, []) for idx in range(first, last + 1)]
+
+
+    def add(self, cr):
+        cr._indexed = True
+        for bucket in self._lists(cr):
+            bucket.append(cr)
+        self.size += 1
+
+
+    def remove(self, cr):
+        for bucket in self._lists(cr):
+            for idx, value in enumerate(bucket):
+                if value is cr:
+                    del bucket[idx]
+                    break
+        self.size -= 1
+
+
+    def candidates(self, row):
+        """
+        Ranges that may contain a row
+        """
+        bucket = self.buckets.get(row // BUCKET_ROWS)
+        if bucket:
+            return bucket + self.wide
+        return self.wide
+
+
+class _RangeList(list):
+    """
+    List of ranges that makes range indexes stale when an item is replaced
+    """
+
+    def __setitem__(self, key, value):
+        super(_RangeList, self).__setitem__(key, value)
+        _RangeIndex.moves += 1
+
+
+class _RangeSequence(Sequence):
+    """
+    Sequence of ranges which can be indexed
+    """
+
+    def __set__(self, instance, seq):
+        super(_RangeSequence, self).__set__(instance, seq)
+        instance.__dict__[self.name] = _RangeList(instance.__dict__[self.name])
+
+
 class MultiCellRange(Strict):
 
 
-    ranges = Sequence(expected_type=CellRange)
+    ranges = _RangeSequence(expected_type=CellRange)
+    _index = None
 
 
     def __init__(self, ranges=()):
@@ -429,13 +534,45 @@ class MultiCellRange(Strict):
         self.ranges = ranges
 
 
-    def __contains__(self, coord):
+    def _get_index(self):
+        """
+        Return the index of the ranges, rebuilding it if the list of ranges
+        has been changed directly
+        """
+        index = self._index
+        if index is None or not index.is_current(self.ranges):
+            index = self._index = _RangeIndex(self.ranges)
+        return index
+
+
+    def _candidates(self, row):
+        if len(self.ranges) < INDEX_SIZE:
+            return self.ranges
+        return self._get_index().candidates(row)
+
+
+    def find(self, coord):
+        """
+        Return the range that contains a cell coordinate or range, or None
+        """
         if isinstance(coord, str):
             coord = CellRange(coord)
-        for r in self.ranges:
+        for r in self._candidates(coord.min_row):
             if coord <= r:
-                return True
-        return False
+                return r
+
+
+    def find_cell(self, row, column):
+        """
+        Return the range that contains the cell in a row and column, or None
+        """
+        for r in self._candidates(row):
+            if r.min_row <= row <= r.max_row and r.min_col <= column <= r.max_col:
+                return r
+
+
+    def __contains__(self, coord):
+        return self.find(coord) is not None
 
 
     def __repr__(self):
@@ -460,7 +597,11 @@ class MultiCellRange(Strict):
         elif not isinstance(coord, CellRange):
             raise ValueError("You can only add CellRanges")
         if cr not in self:
+            index = self._index
+            current = index is not None and index.is_current(self.ranges)
             self.ranges.append(cr)
+            if current:
+                index.add(cr)
 
 
     def __iadd__(self, coord):
@@ -485,7 +626,11 @@ class MultiCellRange(Strict):
     def remove(self, coord):
         if not isinstance(coord, CellRange):
             coord = CellRange(coord)
-        self.ranges.remove(coord)
+        index = self._index
+        current = index is not None and index.is_current(self.ranges)
+        cr = self.ranges.pop(self.ranges.index(coord))
+        if current:
+            index.remove(cr)
 
 
     def __iter__(self):
@@ -3,6 +3,8 @@
 #standard lib imports
 from copy import copy
 
+from .cell_range import MultiCellRange
+from .merge import MergedCellRange
 from .worksheet import Worksheet
 
 
@@ -38,7 +40,7 @@ class WorksheetCopy(object):
 
         self.target.sheet_format = copy(self.source.sheet_format)
         self.target.sheet_properties = copy(self.source.sheet_properties)
-        self.target.merged_cells = copy(self.source.merged_cells)
+        self._copy_merged_cells()
         self.target.page_margins = copy(self.source.page_margins)
         self.target.page_setup = copy(self.source.page_setup)
         self.target.print_options = copy(self.source.print_options)
@@ -61,6 +63,22 @@ class WorksheetCopy(object):
                 target_cell.comment = copy(source_cell.comment)
 
 
+    def _copy_merged_cells(self):
+        """
+        Merge the same ranges in the target. The MergedCells that have not
+        been used are created there when they are.
+        """
+        ranges = []
+        for cr in self.source.merged_cells:
+            if isinstance(cr, MergedCellRange):
+                cr = MergedCellRange(self.target, cr.coord)
+            else:
+                cr = copy(cr)
+            ranges.append(cr)
+        self.target.merged_cells = MultiCellRange(ranges)
+        self.target._bounds = None
+
+
     def _copy_dimensions(self):
         for attr in ('row_dimensions', 'column_dimensions'):
             src = getattr(self.source, attr)
@@ -57,8 +57,9 @@ class MergedCellRange(CellRange):
     """
     MergedCellRange stores the border information of a merged cell in the top
     left cell of the merged cell.
-    The remaining cells in the merged cell are stored as MergedCell objects and
-    get their border information from the upper left cell.
+    The remaining cells in the merged cell are MergedCell objects. Those at
+    the edges get their border information from the upper left cell, the
+    others are only created by the worksheet when they are used.
     """
 
     def __init__(self, worksheet, coord):
@@ -115,6 +116,7 @@ class MergedCellRange(CellRange):
                     row, col = coord
                     cell = MergedCell(self.ws, row=row, column=col)
                     self.ws._cells[(cell.row, cell.column)] = cell
+                    self.ws._extend_bounds(row, col, row, col)
                 cell.border += border
 
 
@@ -13,9 +13,8 @@ from openpyxlzip.descriptors import (
 )
 from openpyxlzip.descriptors.excel import ExtensionList, CellRange
 from openpyxlzip.descriptors.sequence import NestedSequence
-from openpyxlzip.xml import LXML
 from openpyxlzip.xml.constants import SHEET_MAIN_NS, REL_NS
-from openpyxlzip.xml.functions import tostring
+from openpyxlzip.xml.functions import tostring_part
 from openpyxlzip.utils import range_boundaries
 from openpyxlzip.utils.escape import escape, unescape
 
@@ -309,15 +308,12 @@ class Table(Serialisable):
         return "/xl" + self._path.format(self.id)
 
 
-    def _write(self, archive):
+    def _write(self, archive, compact_xml=False):
         """
         Serialise to XML and write to archive
         """
         xml = self.to_tree()
-        if LXML:
-            return archive.writestr(self.path[1:], tostring(xml, pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True))
-        else:
-            return archive.writestr(self.path[1:], tostring(xml))
+        return archive.writestr(self.path[1:], tostring_part(xml, compact_xml))
 
 
     def _initialise_columns(self):
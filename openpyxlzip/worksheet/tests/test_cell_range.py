@@ -386,3 +386,51 @@ class TestMultiCellRange:
         from copy import copy
         r2 = copy(r1)
         assert list(r1)[0] is not list(r2)[0]
+
+
+    def test_find(self, MultiCellRange, CellRange):
+        ranges = [CellRange(min_col=col, min_row=row, max_col=col + 1, max_row=row + 2)
+                  for row in range(1, 400, 3) for col in (1, 5)]
+        ranges.append(CellRange("Z1:Z1000"))
+        cells = MultiCellRange(ranges)
+
+        assert cells.find("B2") is ranges[0]
+        assert cells.find("F299:F300") is ranges[199]
+        assert cells.find("Z500") is ranges[-1]
+        assert cells.find("C2") is None
+        assert "A1:A2" in cells
+        assert "A1:A4" not in cells
+
+
+    def test_indexed_add_remove(self, MultiCellRange, CellRange):
+        cells = MultiCellRange(["A{0}:B{0}".format(row) for row in range(1, 51)])
+        assert "A10" in cells
+
+        cells.add("D100:E120")
+        assert "E119" in cells
+        cells.remove("A10:B10")
+        assert "A10" not in cells
+        assert len(cells.ranges) == 50
+
+        # lists changed directly are indexed again
+        cells.ranges.append(CellRange("G1:G5"))
+        assert "G3" in cells
+        cells.ranges = [CellRange("H1")]
+        assert "A1" not in cells
+        assert "H1" in cells
+
+
+    def test_indexed_moved(self, MultiCellRange, CellRange):
+        cells = MultiCellRange(["A{0}:B{0}".format(row) for row in range(1, 51)])
+        assert "A10" in cells
+
+        cells.ranges[0].shift(row_shift=200)
+        assert "A201:B201" in cells
+        assert "A1" not in cells
+
+        cells.ranges[1].expand(right=2)
+        assert "D2" in cells
+
+        cells.ranges[2] = CellRange("D500")
+        assert "D500" in cells
+        assert "A3" not in cells
@@ -71,7 +71,7 @@ class TestReadOnlyWorksheet:
 
     def test_empty_cell(self, ReadOnlyWorksheet):
         row = [
-            {'column':4, 'value':None, 'row':1},
+            (1, 4, None, 'n', 0),
         ]
         ws = ReadOnlyWorksheet
         cells = ws._get_row(row, max_col=4, values_only=True)
@@ -80,8 +80,8 @@ class TestReadOnlyWorksheet:
 
     def test_pad_row_left(self, ReadOnlyWorksheet):
         row = [
-            {'column':4, 'value':4,},
-            {'column':8, 'value':8,},
+            (1, 4, 4, 'n', 0),
+            (1, 8, 8, 'n', 0),
         ]
         ws = ReadOnlyWorksheet
         cells = ws._get_row(row, max_col=4, values_only=True)
@@ -90,8 +90,8 @@ class TestReadOnlyWorksheet:
 
     def test_pad_row(self, ReadOnlyWorksheet):
         row = [
-            {'column':4, 'value':4,},
-            {'column':8, 'value':8,},
+            (1, 4, 4, 'n', 0),
+            (1, 8, 8, 'n', 0),
         ]
         ws = ReadOnlyWorksheet
         cells = ws._get_row(row, min_col=4, max_col=8, values_only=True)
@@ -100,8 +100,8 @@ class TestReadOnlyWorksheet:
 
     def test_pad_row_right(self, ReadOnlyWorksheet):
         row = [
-            {'column':4, 'value':4},
-            {'column':8, 'value':8},
+            (1, 4, 4, 'n', 0),
+            (1, 8, 8, 'n', 0),
         ]
         ws = ReadOnlyWorksheet
         cells = ws._get_row(row, min_col=6, max_col=10, values_only=True)
@@ -110,8 +110,8 @@ class TestReadOnlyWorksheet:
 
     def test_pad_row_cells(self, ReadOnlyWorksheet):
         row = [
-            {'column':4, 'value':4, 'row':2},
-            {'column':8, 'value':8, 'row':2},
+            (2, 4, 4, 'n', 0),
+            (2, 8, 8, 'n', 0),
         ]
         ws = ReadOnlyWorksheet
         cells = ws._get_row(row, min_col=6, max_col=10)
@@ -198,3 +198,22 @@ class TestReadOnlyWorksheet:
             pass
         c = row[-1]
         assert c.value == 9
+
+
+    def test_row_index(self, DummyWorkbook):
+        from .._read_only import ReadOnlyWorksheet
+        from .._row_index import RowIndex
+        from .test_row_index import make_sheet
+
+        wb = DummyWorkbook
+        wb._archive.writestr("sheet2.xml", make_sheet(range(1, 3000, 2)))
+        ws = ReadOnlyWorksheet(wb, "Sheet", "sheet2.xml", [])
+        ws._row_index = RowIndex(wb._archive, "sheet2.xml", interval=4096,
+                                 chunk_size=512).build()
+        assert ws._row_index.open(2001) is not None
+
+        assert ws["B2001"].value == 4002
+        assert ws["B2000"].value is None
+        rows = list(ws.iter_rows(min_row=1500, max_row=1510, values_only=True))
+        ws.use_row_index = False
+        assert rows == list(ws.iter_rows(min_row=1500, max_row=1510, values_only=True))
@@ -2,7 +2,9 @@
 
 import pytest
 
+from collections import namedtuple
 import datetime
+import os
 from io import BytesIO
 
 from lxml.etree import iterparse, fromstring
@@ -19,6 +21,9 @@ from ..worksheet import Worksheet
 from ..pagebreak import Break, RowBreak, ColBreak
 from ..scenario import ScenarioList, Scenario, InputCells
 
+# the fields of the tuples cells are parsed into
+CellRecord = namedtuple("CellRecord", "row column value data_type style_id")
+
 @pytest.mark.parametrize("value, expected",
                          [
                              ('4.2', 4.2),
@@ -203,8 +208,8 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 'f', 'row': 1,
-                        'style_id':0, 'value': '=IF(TRUE, "y", "n")'}
+        assert cell == CellRecord(row=1, column=1, value='=IF(TRUE, "y", "n")',
+                                  data_type='f', style_id=0)
 
 
     def test_formula_data_only(self, WorkSheetParser):
@@ -220,8 +225,8 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 'n', 'row': 1,
-                        'style_id':0, 'value': 3}
+        assert cell == CellRecord(row=1, column=1, value=3,
+                                  data_type='n', style_id=0)
 
 
     def test_string_formula_data_only(self, WorkSheetParser):
@@ -237,8 +242,8 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 's', 'row': 1,
-                        'style_id':0, 'value': 'y'}
+        assert cell == CellRecord(row=1, column=1, value='y',
+                                  data_type='s', style_id=0)
 
 
     def test_number(self, WorkSheetParser):
@@ -252,8 +257,8 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 'n', 'row': 1,
-                        'style_id':0, 'value': 1}
+        assert cell == CellRecord(row=1, column=1, value=1,
+                                  data_type='n', style_id=0)
 
 
 
@@ -268,8 +273,8 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 'd', 'row': 1,
-                        'style_id':0, 'value': datetime.datetime(2011, 12, 25, 14, 23, 55)}
+        assert cell == CellRecord(row=1, column=1, value=datetime.datetime(2011, 12, 25, 14, 23, 55),
+                                  data_type='d', style_id=0)
 
 
     def test_mac_date(self, WorkSheetParser):
@@ -284,8 +289,8 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 'd', 'row': 1,
-                        'style_id':29, 'value':datetime.datetime(2016, 10, 3, 0, 0)}
+        assert cell == CellRecord(row=1, column=1, value=datetime.datetime(2016, 10, 3, 0, 0),
+                                  data_type='d', style_id=29)
 
 
     def test_string(self, WorkSheetParser):
@@ -299,8 +304,8 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 's', 'row': 1,
-                        'style_id':0, 'value':'a'}
+        assert cell == CellRecord(row=1, column=1, value='a',
+                                  data_type='s', style_id=0)
 
 
     def test_boolean(self, WorkSheetParser):
@@ -314,8 +319,8 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 'b', 'row': 1,
-                        'style_id':0, 'value':True}
+        assert cell == CellRecord(row=1, column=1, value=True,
+                                  data_type='b', style_id=0)
 
 
     def test_inline_string(self, WorkSheetParser):
@@ -331,8 +336,8 @@ class TestWorksheetParser:
         element = fromstring(src)
 
         cell = parser.parse_cell(element)
-        assert cell == {'column': 1, 'data_type': 's', 'row': 1,
-                        'style_id':0, 'value':"ID"}
+        assert cell == CellRecord(row=1, column=1, value="ID",
+                                  data_type='s', style_id=0)
 
 
     def test_inline_richtext(self, WorkSheetParser):
@@ -352,8 +357,8 @@ class TestWorksheetParser:
 
         element = fromstring(src)
         cell = parser.parse_cell(element)
-        assert cell == {'column': 18, 'data_type': 's', 'row': 2,
-                        'style_id':4, 'value':"11 de September de 2014"}
+        assert cell == CellRecord(row=2, column=18, value="11 de September de 2014",
+                                  data_type='s', style_id=4)
 
 
     def test_sheet_views(self, WorkSheetParser):
@@ -510,9 +515,9 @@ class TestWorksheetParser:
         element = fromstring(src)
         max_row, cells = parser.parse_row(element)
         expected = [
-            {'column': 1, 'row': 1, 'data_type': 'n', 'value': 2, 'style_id': 0},
-            {'column': 2, 'row': 1, 'data_type': 'n', 'value': 4, 'style_id': 0},
-            {'column': 3, 'row': 1, 'data_type': 'n', 'value': 3, 'style_id': 0},
+            CellRecord(row=1, column=1, value=2, data_type='n', style_id=0),
+            CellRecord(row=1, column=2, value=4, data_type='n', style_id=0),
+            CellRecord(row=1, column=3, value=3, data_type='n', style_id=0),
         ]
         for expected_cell, cell in zip(expected, cells):
             assert expected_cell == cell
@@ -531,7 +536,7 @@ class TestWorksheetParser:
         parser.parse_row(element)
         max_row, cells = parser.parse_row(element)
         expected = [
-            {'column': 1, 'row': 2, 'data_type': 'n', 'value': 2, 'style_id': 0},
+            CellRecord(row=2, column=1, value=2, data_type='n', style_id=0),
         ]
         for expected_cell, cell in zip(expected, cells):
             assert expected_cell == cell
@@ -771,6 +776,41 @@ class TestWorksheetParser:
         assert parser.row_breaks == RowBreak()
 
 
+    @pytest.mark.parametrize("data_only", [False, True])
+    @pytest.mark.parametrize("filename",
+                             [
+                                 "worksheet/tests/data/complex-styles-worksheet.xml",
+                                 "worksheet/tests/data/sheet_inline_strings.xml",
+                                 "worksheet/tests/data/more_rows_than_cells.xml",
+                                 "reader/tests/data/worksheet_formulae.xml",
+                                 "reader/tests/data/worksheet_without_coordinates.xml",
+                                 "reader/tests/data/jasper_sheet.xml",
+                                 "tests/data/reader/empty_rows.xml",
+                             ]
+                             )
+    def test_parse_values(self, filename, data_only):
+        from .._reader import WorkSheetParser
+        from openpyxlzip import __file__ as root
+
+        class SharedStrings:
+
+            def __getitem__(self, idx):
+                return "string {0}".format(idx)
+
+        path = os.path.join(os.path.dirname(root), filename)
+        expected = []
+        with open(path, "rb") as src:
+            parser = WorkSheetParser(src, SharedStrings(), data_only=data_only,
+                                     epoch=CALENDAR_WINDOWS_1900, date_formats={1, 2, 14})
+            for idx, row in parser.parse():
+                expected.append((idx, [(cell[1], cell[2]) for cell in row]))
+
+        with open(path, "rb") as src:
+            parser = WorkSheetParser(src, SharedStrings(), data_only=data_only,
+                                     epoch=CALENDAR_WINDOWS_1900, date_formats={1, 2, 14})
+            assert list(parser.parse_values()) == expected
+
+
 @pytest.fixture
 def WorksheetReader():
     from .._reader import WorksheetReader
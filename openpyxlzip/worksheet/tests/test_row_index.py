@@ -0,0 +1,94 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+from io import BytesIO
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
+
+import pytest
+
+from openpyxlzip.xml.functions import fromstring
+
+
+def make_sheet(rows, formula=""):
+    xml = ['<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">',
+           '<dimension ref="A1:B{0}"/><sheetData>'.format(rows[-1])]
+    for r in rows:
+        xml.append('<row r="{0}" spans="1:2"><c r="A{0}"><v>{0}</v></c>'
+                   '<c r="B{0}">{1}<v>{2}</v></c></row>'.format(r, formula.format(r), r * 2))
+    xml.append('</sheetData><pageMargins left="0.75" right="0.75" top="1" bottom="1" '
+               'header="0.5" footer="0.5"/></worksheet>')
+    return "".join(xml).encode("utf-8")
+
+
+@pytest.fixture
+def Archive():
+
+    def make_archive(src, compression=ZIP_DEFLATED):
+        archive = ZipFile(BytesIO(), "w", compression)
+        archive.writestr("sheet1.xml", src)
+        return archive
+
+    return make_archive
+
+
+@pytest.fixture
+def RowIndex():
+    from .._row_index import RowIndex
+    return RowIndex
+
+
+class TestRowIndex:
+
+    @pytest.mark.parametrize("compression", [ZIP_DEFLATED, ZIP_STORED])
+    def test_build(self, RowIndex, Archive, compression):
+        archive = Archive(make_sheet(range(1, 2001)), compression)
+        index = RowIndex(archive, "sheet1.xml", interval=4096, chunk_size=512, step=10).build()
+        assert index.head.endswith(b"<sheetData>")
+        assert len(index.checkpoints) > 1
+        assert list(index.rows[:3]) == [1, 11, 21]
+        assert index.shared_formula is None
+
+
+    def test_small_part(self, RowIndex, Archive):
+        archive = Archive(make_sheet(range(1, 10)))
+        index = RowIndex(archive, "sheet1.xml").build()
+        assert index.checkpoints == []
+        assert index.open(5) is None
+
+
+    def test_unordered(self, RowIndex, Archive):
+        archive = Archive(make_sheet(list(range(1, 1001)) + [5]))
+        index = RowIndex(archive, "sheet1.xml", interval=4096, chunk_size=512, step=1).build()
+        assert len(index.rows) == 0
+        assert index.open(500) is None
+
+
+    @pytest.mark.parametrize("compression", [ZIP_DEFLATED, ZIP_STORED])
+    @pytest.mark.parametrize("row", [1, 2, 500, 1234, 1999])
+    def test_open(self, RowIndex, Archive, compression, row):
+        archive = Archive(make_sheet(range(1, 2001, 1)), compression)
+        index = RowIndex(archive, "sheet1.xml", interval=4096, chunk_size=512, step=7).build()
+        src = index.open(row)
+        tree = fromstring(src.read())
+        src.close()
+        rows = [int(el.get("r")) for el in tree.iter("{*}row")]
+        assert row - 7 < rows[0] <= row
+        assert rows[-1] == 2000
+        assert tree.find("{*}pageMargins") is not None
+
+
+    def test_read_chunks(self, RowIndex, Archive):
+        archive = Archive(make_sheet(range(1, 2001)))
+        index = RowIndex(archive, "sheet1.xml", interval=4096, chunk_size=512, step=7).build()
+        src = index.open(1500)
+        chunks = iter(lambda: src.read(100), b"")
+        assert b"".join(chunks) == index.open(1500).read()
+
+
+    @pytest.mark.parametrize("data_only", [False, True])
+    def test_shared_formula(self, RowIndex, Archive, data_only):
+        src = make_sheet(range(1, 2001), '<f t="shared" ref="B{0}:B2000" si="0">A{0}*2</f>')
+        archive = Archive(src)
+        index = RowIndex(archive, "sheet1.xml", interval=4096, chunk_size=512, step=1).build()
+        assert index.shared_formula is not None
+        assert index.find(1, data_only) == index.offsets[0]
+        assert (index.open(1500, data_only) is None) is (not data_only)
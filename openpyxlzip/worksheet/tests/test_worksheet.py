@@ -402,6 +402,110 @@ class TestWorksheet:
         assert (4, 4) not in ws._cells
 
 
+    def test_merge_full_column(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws['B2'] = 1
+        ws.merge_cells("A1:B1048576")
+
+        assert (2, 2) not in ws._cells
+        assert len(ws._cells) == 1
+        assert ws.dimensions == "A1:B1048576"
+
+        cell = ws['B500']
+        assert cell.__class__.__name__ == "MergedCell"
+        assert ws['B500'] is cell
+        assert ws['A1'].__class__.__name__ == "Cell"
+        assert ws['C1'].__class__.__name__ == "Cell"
+        assert [c.__class__.__name__ for c in ws[3]] == ["MergedCell"] * 2 + ["Cell"]
+
+
+    def test_unmerge_full_column(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws.merge_cells("A1:A1048576")
+        ws['A10']
+        ws.unmerge_cells("A1:A1048576")
+
+        assert list(ws._cells) == [(1, 1)]
+        assert ws['A10'].__class__.__name__ == "Cell"
+
+
+    @pytest.mark.parametrize("op, dimensions, merged",
+                             [
+                                 ("delete_rows", "A2:D4", "B2:D4"),
+                                 ("delete_cols", "B1:C5", "B2:C5"),
+                             ]
+                             )
+    def test_delete_merged(self, Worksheet, op, dimensions, merged):
+        ws = Worksheet(Workbook())
+        ws.merge_cells("B2:D5")
+        getattr(ws, op)(2)
+
+        assert ws.dimensions == dimensions
+        assert ws.merged_cells.ranges == [CellRange(merged)]
+        assert ws['C3'].__class__.__name__ == "MergedCell"
+
+
+    @pytest.mark.parametrize("op, args, merged",
+                             [
+                                 ("insert_rows", (1,), ["B3:D6"]),
+                                 ("insert_rows", (3, 2), ["B2:D7"]),
+                                 ("insert_cols", (2,), ["C2:E5"]),
+                                 ("delete_rows", (2, 4), []),
+                                 ("delete_rows", (4, 3), ["B2:D3"]),
+                                 ("apply_row_edits", ([(1, 2), (6, -2)],), ["B4:D5"]),
+                                 ("apply_col_edits", ([(3, -1)],), ["B2:C5"]),
+                             ]
+                             )
+    def test_edit_merged(self, Worksheet, op, args, merged):
+        ws = Worksheet(Workbook())
+        ws.merge_cells("B2:D5")
+        getattr(ws, op)(*args)
+
+        assert ws.merged_cells.ranges == [CellRange(r) for r in merged]
+
+
+    def test_insert_rows_large_merge(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws['A1'] = 1
+        ws.merge_cells("A1:A50000")
+        ws.insert_rows(1)
+
+        assert list(ws._cells) == [(2, 1)]
+        assert ws.merged_cells.ranges == [CellRange("A2:A50001")]
+        assert ws.dimensions == "A2:A50001"
+
+
+    def test_copy_and_edit_merged(self):
+        wb = Workbook()
+        ws = wb.active
+        ws['A1'] = 1
+        ws.merge_cells("B2:D5")
+        cells = len(ws._cells)
+
+        ws2 = wb.copy_worksheet(ws)
+        assert ws2.dimensions == "A1:D5"
+        ws2.insert_rows(1)
+
+        assert len(ws._cells) == cells
+        assert [r.coord for r in ws.merged_cells.ranges] == ["B2:D5"]
+        assert [r.coord for r in ws2.merged_cells.ranges] == ["B3:D6"]
+        assert ws2.merged_cells.ranges[0].ws is ws2
+        assert ws2['C4'].__class__.__name__ == "MergedCell"
+        assert ws2.dimensions == "A2:D6"
+
+
+    def test_move_merged_range(self, Worksheet):
+        ws = Worksheet(Workbook())
+        for row in range(1, 41, 2):
+            ws.merge_cells("A{0}:C{1}".format(row, row + 1))
+
+        ws.move_range(ws.merged_cells.ranges[0], rows=200)
+        assert "A201:C202" in ws.merged_cells
+        assert ws['B201'].__class__.__name__ == "MergedCell"
+        ws.unmerge_cells("A201:C202")
+        assert "A201:C202" not in ws.merged_cells
+
+
     @pytest.mark.parametrize("rows, cols, titles",
                              [
                                 ("1:4", None, "1:4"),
@@ -515,6 +619,70 @@ def test_max_row(Worksheet):
     assert ws.max_row == 4
 
 
+class TestBounds:
+
+
+    def test_incremental(self, Worksheet):
+        ws = Worksheet(DummyWorkbook())
+        ws["C3"] = 1
+        assert ws._bounds == [3, 3, 3, 3]
+        ws.append({"E": 2, 2: 3})
+        ws["A2"].value = 4
+        assert ws._bounds == [2, 1, 4, 5]
+        assert ws.calculate_dimension() == "A2:E4"
+
+
+    def test_delete_inside(self, Worksheet):
+        ws = Worksheet(DummyWorkbook())
+        for coord in ["A1", "B2", "C3"]:
+            ws[coord] = 1
+        del ws["B2"]
+        assert ws._bounds == [1, 1, 3, 3]
+
+
+    @pytest.mark.parametrize("coord, dimension",
+                             [
+                                 ("A1", "B2:C3"),
+                                 ("C3", "A1:B2"),
+                             ]
+                             )
+    def test_delete_boundary(self, Worksheet, coord, dimension):
+        ws = Worksheet(DummyWorkbook())
+        for c in ["A1", "B2", "C3"]:
+            ws[c] = 1
+        del ws[coord]
+        assert ws._bounds is None
+        assert ws.calculate_dimension() == dimension
+        assert ws._bounds is not None
+
+
+    def test_delete_all(self, Worksheet):
+        ws = Worksheet(DummyWorkbook())
+        ws["B2"] = 1
+        del ws["B2"]
+        assert ws.dimensions == "A1:A1"
+        assert ws.max_row == 1
+
+
+    def test_move(self, Worksheet):
+        ws = Worksheet(DummyWorkbook())
+        ws["A1"] = 1
+        ws["B2"] = 2
+        ws.move_range("B2", rows=3, cols=2)
+        assert ws.dimensions == "A1:D5"
+        ws.move_range("A1", rows=1)
+        assert ws.dimensions == "A2:D5"
+
+
+    def test_merge(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws["A1"] = 1
+        ws.merge_cells("A1:C4")
+        assert ws.dimensions == "A1:C4"
+        ws.unmerge_cells("A1:C4")
+        assert ws.dimensions == "A1:A1"
+
+
 def test_add_chart(Worksheet):
     from openpyxlzip.chart import BarChart
     ws = Worksheet(DummyWorkbook())
@@ -757,3 +925,75 @@ class TestEditableWorksheet:
         ws['G4'] = "=SUM(G1:G3)"
         ws.move_range("G4", 1, 1, True)
         assert ws['H5'].value == "=SUM(H2:H4)"
+
+
+    def test_apply_row_edits(self, dummy_worksheet):
+        ws = dummy_worksheet
+        ws.apply_row_edits([(2, 2), (7, -1), (1, -1)])
+
+        assert ws.max_row == 6
+        assert ws._current_row == 6
+        assert [c.value for c in ws['A']] == [None, None, "A2", "A3", "A4", "A6"]
+        assert ws['B6'].coordinate == "B6"
+
+
+    def test_apply_col_edits(self, dummy_worksheet):
+        ws = dummy_worksheet
+        ws.apply_col_edits([(3, 1), (1, -2)])
+
+        assert ws.max_column == 7
+        assert [c.value for c in ws[1]] == [None, "C1", "D1", "E1", "F1", "G1", "H1"]
+
+
+    def test_apply_edits_delete_all(self, dummy_worksheet):
+        ws = dummy_worksheet
+        ws.apply_row_edits([(1, -6)])
+        assert ws.max_row == 1
+        assert ws._current_row == 0
+
+
+    @pytest.mark.parametrize("translate, result",
+                             [
+                                 (False, ("=SUM(A1:A5)", "=A3*2")),
+                                 (True, ("=SUM(A1:A7)", "=A5*2")),
+                             ]
+                             )
+    def test_apply_edits_translate(self, dummy_worksheet, translate, result):
+        ws = dummy_worksheet
+        ws['A6'] = "=SUM(A1:A5)"
+        ws['B1'] = "=A3*2"
+        ws.apply_row_edits([(2, 2)], translate=translate)
+        assert (ws['A8'].value, ws['B1'].value) == result
+
+
+    def test_apply_edits_translate_deleted(self, dummy_worksheet):
+        ws = dummy_worksheet
+        ws['A6'] = "=SUM(A1:A5)+A2"
+        ws['B1'] = "=C1+D1"
+        ws.apply_row_edits([(2, -1)], translate=True)
+        ws.apply_col_edits([(3, -1)], translate=True)
+        assert ws['A5'].value == "=SUM(A1:A4)+#REF!"
+        assert ws['B1'].value == "=#REF!+C1"
+
+
+    @pytest.mark.parametrize("edits, segments",
+                             [
+                                 ([], [(1, 1)]),
+                                 ([(3, 0)], [(1, 1)]),
+                                 ([(3, 2)], [(1, 1), (3, 5)]),
+                                 ([(3, -2)], [(1, 1), (3, None), (5, 3)]),
+                                 ([(3, 2), (3, -2)], [(1, 1)]),
+                                 ([(3, -2), (3, 2)], [(1, 1), (3, None), (5, 5)]),
+                                 ([(5, 1), (2, 1)], [(1, 1), (2, 3), (5, 7)]),
+                                 ([(2, 3), (3, -3)], [(1, 1), (2, None), (3, 3)]),
+                             ]
+                             )
+    def test_compose_edits(self, edits, segments):
+        from ..worksheet import _compose_edits
+        assert _compose_edits(edits) == segments
+
+
+    def test_compose_invalid_edits(self):
+        from ..worksheet import _compose_edits
+        with pytest.raises(ValueError):
+            _compose_edits([(0, 1)])
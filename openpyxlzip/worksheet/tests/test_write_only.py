@@ -24,6 +24,7 @@ class DummyWorkbook:
         self.epoch = CALENDAR_WINDOWS_1900
         self.sheetnames = []
         self.iso_dates = False
+        self.use_shared_strings = False
 
 
 @pytest.fixture
@@ -53,8 +54,7 @@ def test_append(WriteOnlyWorksheet):
     ws.append([datetime.date(2001, 1, 1), 1])
     ws.append(i for i in [1, 2])
     ws.close()
-    with open(ws._writer.out, "rb") as src:
-        xml = src.read()
+    xml = ws._writer.read()
     expected = """
     <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
           <sheetPr>
@@ -121,8 +121,7 @@ def test_cannot_save_twice(WriteOnlyWorksheet):
 def test_close(WriteOnlyWorksheet):
     ws = WriteOnlyWorksheet
     ws.close()
-    with open(ws._writer.out, "rb") as src:
-        xml = src.read()
+    xml = ws._writer.read()
     expected = """
     <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
     <sheetPr>
@@ -146,8 +145,7 @@ def test_close(WriteOnlyWorksheet):
 def test_read_after_closing(WriteOnlyWorksheet):
     ws = WriteOnlyWorksheet
     ws.close()
-    with open(ws._writer.out, "rb") as src:
-        xml = src.read()
+    xml = ws._writer.read()
     expected = """
     <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
     <sheetPr>
@@ -173,8 +171,7 @@ def test_write_only_cell(WriteOnlyWorksheet):
     c = WriteOnlyCell(ws, value=5)
     ws.append([c])
     ws.close()
-    with open(ws._writer.out, "rb") as src:
-        xml = src.read()
+    xml = ws._writer.read()
     expected = """
     <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
     <sheetPr>
@@ -209,3 +206,164 @@ def test_hyperlink(WriteOnlyWorksheet):
     ws.append([cell])
     assert cell.hyperlink.ref == "A2"
     ws.close()
+
+
+def _sheet_data(ws):
+    from openpyxlzip.xml.functions import fromstring, tostring
+    from openpyxlzip.xml.constants import SHEET_MAIN_NS
+    ws.close()
+    tree = fromstring(ws._writer.read())
+    return tostring(tree.find("{%s}sheetData" % SHEET_MAIN_NS))
+
+
+@pytest.mark.numpy_required
+def test_write_array(WriteOnlyWorksheet):
+    import numpy
+    ws = WriteOnlyWorksheet
+    ws.append(["before"])
+    ws.write_array(numpy.array([[1.5, numpy.nan], [3, 1e20]]))
+    ws.write_array(numpy.array([[True, False]]))
+    ws.append(["after"])
+    xml = _sheet_data(ws)
+    expected = """
+    <sheetData xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+      <row r="1">
+        <c r="A1" t="inlineStr"><is><t>before</t></is></c>
+      </row>
+      <row r="2">
+        <c r="A2" t="n"><v>1.5</v></c>
+      </row>
+      <row r="3">
+        <c r="A3" t="n"><v>3</v></c>
+        <c r="B3" t="n"><v>1e+20</v></c>
+      </row>
+      <row r="4">
+        <c r="A4" t="b"><v>1</v></c>
+        <c r="B4" t="b"><v>0</v></c>
+      </row>
+      <row r="5">
+        <c r="A5" t="inlineStr"><is><t>after</t></is></c>
+      </row>
+    </sheetData>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
+@pytest.mark.numpy_required
+def test_write_array_styles(WriteOnlyWorksheet):
+    import numpy
+    ws = WriteOnlyWorksheet
+    cell = WriteOnlyCell(ws)
+    cell.number_format = "0.00"
+    ws.write_array(numpy.array([[1, 2]]), styles=[None, cell])
+    xml = _sheet_data(ws)
+    expected = """
+    <sheetData xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+      <row r="1">
+        <c r="A1" t="n"><v>1</v></c>
+        <c r="B1" s="1" t="n"><v>2</v></c>
+      </row>
+    </sheetData>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
+@pytest.mark.numpy_required
+def test_write_array_dimensions(WriteOnlyWorksheet):
+    import numpy
+    ws = WriteOnlyWorksheet
+    with pytest.raises(ValueError):
+        ws.write_array(numpy.arange(3))
+
+
+@pytest.mark.pandas_required
+def test_write_frame(WriteOnlyWorksheet):
+    from pandas import DataFrame, Index, Timestamp, NaT
+    ws = WriteOnlyWorksheet
+    df = DataFrame(
+        {
+            "number": [1.25, None],
+            "text": ["a & b", None],
+            "date": [Timestamp("2018-03-01 12:00"), NaT],
+            "mixed": ["=A1", 5],
+        },
+        index=Index([10, 11], name="idx"),
+    )
+    ws.write_frame(df)
+    xml = _sheet_data(ws)
+    expected = """
+    <sheetData xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+      <row r="1">
+        <c r="A1" t="inlineStr"><is><t>idx</t></is></c>
+        <c r="B1" t="inlineStr"><is><t>number</t></is></c>
+        <c r="C1" t="inlineStr"><is><t>text</t></is></c>
+        <c r="D1" t="inlineStr"><is><t>date</t></is></c>
+        <c r="E1" t="inlineStr"><is><t>mixed</t></is></c>
+      </row>
+      <row r="2">
+        <c r="A2" t="n"><v>10</v></c>
+        <c r="B2" t="n"><v>1.25</v></c>
+        <c r="C2" t="inlineStr"><is><t>a &amp; b</t></is></c>
+        <c r="D2" s="1" t="n"><v>43160.5</v></c>
+        <c r="E2"><f>A1</f><v></v></c>
+      </row>
+      <row r="3">
+        <c r="A3" t="n"><v>11</v></c>
+        <c r="E3" t="n"><v>5</v></c>
+      </row>
+    </sheetData>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
+@pytest.mark.pandas_required
+def test_write_frame_shared_strings(WriteOnlyWorksheet):
+    from pandas import DataFrame
+    ws = WriteOnlyWorksheet
+    ws.parent.use_shared_strings = True
+    ws.write_frame(DataFrame({"a": ["x", "y", "x"]}), index=False, header=False)
+    xml = _sheet_data(ws)
+    expected = """
+    <sheetData xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+      <row r="1"><c r="A1" t="s"><v>0</v></c></row>
+      <row r="2"><c r="A2" t="s"><v>1</v></c></row>
+      <row r="3"><c r="A3" t="s"><v>0</v></c></row>
+    </sheetData>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+    assert list(ws.parent.shared_strings) == ["x", "y"]
+
+
+@pytest.mark.pandas_required
+def test_write_frame_like_append():
+    from io import BytesIO
+    from zipfile import ZipFile
+    from pandas import DataFrame, date_range
+    from openpyxlzip import Workbook
+    from openpyxlzip.utils.dataframe import dataframe_to_rows
+
+    df = DataFrame({
+        "float": [0.1 + 0.2, -1.5, 1e-300],
+        "int": [1, 10**17, -3],
+        "date": date_range("1900-02-27 06:00", periods=3, freq="D"),
+        "text": [" padded ", "#N/A", "=SUM(B1:B2)"],
+    })
+
+    def write(bulk):
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        if bulk:
+            ws.write_frame(df, index=False)
+        else:
+            for row in dataframe_to_rows(df, index=False):
+                ws.append(row)
+        out = BytesIO()
+        wb.save(out)
+        return ZipFile(out).read("xl/worksheets/sheet1.xml")
+
+    diff = compare_xml(write(True), write(False))
+    assert diff is None, diff
@@ -10,6 +10,7 @@ from openpyxlzip.workbook import Workbook
 from openpyxlzip.styles import PatternFill, Font, Color
 from openpyxlzip.formatting.rule import CellIsRule
 from openpyxlzip.comments import Comment
+from openpyxlzip.utils.indexed_list import IndexedList
 
 from ..dimensions import RowDimension
 from ..protection import SheetProtection
@@ -587,8 +588,65 @@ class TestWorksheetWriter:
         assert diff is None, diff
 
 
+    def test_defer_rows(self, writer):
+        ws = writer.ws
+        ws['A1'] = "label"
+        ws['A1'].font = Font(bold=True)
+        ws['B2'] = "link"
+        ws['B2'].hyperlink = "http://www.example.com"
+        ws['C3']._comment = Comment("comment", "author")
+        writer.defer_rows = True
+        writer.shared_strings = IndexedList()
+        writer.write_rows()
+
+        xml = writer.read()
+        expected = """
+        <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <sheetData />
+        </worksheet>
+        """
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+        assert list(writer.shared_strings) == ["label", "link"]
+        assert ws.parent._cell_styles.index(ws['A1']._style) == 1
+        assert [link.ref for link in ws._hyperlinks] == ["B2"]
+        assert len(ws._comments) == 1
+
+
+    def test_write_sheet_data(self, writer):
+        from io import BytesIO
+        writer.ws['A10'] = 15
+        out = BytesIO()
+        writer.write_sheet_data(out)
+        expected = """
+        <sheetData>
+          <row r="10">
+            <c r="A10" t="n">
+              <v>15</v>
+            </c>
+          </row>
+        </sheetData>
+        """
+        diff = compare_xml(out.getvalue(), expected)
+        assert diff is None, diff
+
+
     def test_cleanup(self, writer):
-        assert os.path.exists(writer.out) is True
+        assert writer.out.closed is False
         writer.close()
         writer.cleanup()
-        assert os.path.exists(writer.out) is False
+        assert writer.out.closed is True
+
+
+    def test_spool(self):
+        from .._writer import WorksheetWriter
+        ws = Workbook().active
+        ws.append([1, 2, 3])
+        writer = WorksheetWriter(ws)
+        writer.write()
+        assert writer.out._rolled is False
+
+        writer = WorksheetWriter(ws, spool_size=100)
+        writer.write()
+        assert writer.out._rolled is True
+        assert b'<c r="C1" t="n"><v>3</v></c>' in writer.read()
@@ -4,6 +4,7 @@
 
 
 # Python stdlib imports
+from bisect import bisect_right
 from itertools import chain
 from operator import itemgetter
 from inspect import isgenerator
@@ -127,6 +128,7 @@ class Worksheet(_WorkbookChild):
         self.row_breaks = RowBreak()
         self.col_breaks = ColBreak()
         self._cells = {}
+        self._bounds = [] # min_row, min_col, max_row, max_col or None if unknown
         self._charts = []
         self._images = []
         self._legacy_images = {}
@@ -284,8 +286,14 @@ class Worksheet(_WorkbookChild):
             raise ValueError("Row numbers must be between 1 and 1048576")
         coordinate = (row, column)
         if not coordinate in self._cells:
-            cell = Cell(self, row=row, column=column)
-            self._add_cell(cell)
+            merged = self.merged_cells and self.merged_cells.find_cell(row, column)
+            if (isinstance(merged, MergedCellRange)
+                and coordinate != (merged.min_row, merged.min_col)):
+                # cells covered by a merged cell are only created when used
+                self._cells[coordinate] = MergedCell(self, row=row, column=column)
+            else:
+                cell = Cell(self, row=row, column=column)
+                self._add_cell(cell)
         return self._cells[coordinate]
 
 
@@ -297,6 +305,61 @@ class Worksheet(_WorkbookChild):
         row = cell.row
         self._current_row = max(row, self._current_row)
         self._cells[(row, column)] = cell
+        self._extend_bounds(row, column, row, column)
+
+
+    def _remove_cell(self, row, column):
+        """
+        Internal method for removing cell objects.
+        """
+        del self._cells[(row, column)]
+        bounds = self._bounds
+        if bounds and (row in (bounds[0], bounds[2]) or column in (bounds[1], bounds[3])):
+            self._bounds = None
+
+
+    def _extend_bounds(self, min_row, min_col, max_row, max_col):
+        """
+        Grow the cached bounding box of the cells to include a range
+        """
+        bounds = self._bounds
+        if bounds is None:
+            return
+        if not bounds:
+            self._bounds = [min_row, min_col, max_row, max_col]
+            return
+        if min_row < bounds[0]:
+            bounds[0] = min_row
+        if min_col < bounds[1]:
+            bounds[1] = min_col
+        if max_row > bounds[2]:
+            bounds[2] = max_row
+        if max_col > bounds[3]:
+            bounds[3] = max_col
+
+
+    def _get_bounds(self):
+        """
+        Return the bounding box of the cells, recalculating it only if a
+        cell on the boundary has been removed
+        """
+        if self._bounds is None:
+            bounds = []
+            rows = set()
+            cols = set()
+            for row, col in self._cells:
+                rows.add(row)
+                cols.add(col)
+            # merged cells cover their whole range
+            for cr in self.merged_cells:
+                if not isinstance(cr, MergedCellRange):
+                    continue
+                rows.update((cr.min_row, cr.max_row))
+                cols.update((cr.min_col, cr.max_col))
+            if rows:
+                bounds = [min(rows), min(cols), max(rows), max(cols)]
+            self._bounds = bounds
+        return self._bounds
 
 
     def __getitem__(self, key):
@@ -351,7 +414,7 @@ class Worksheet(_WorkbookChild):
     def __delitem__(self, key):
         row, column = coordinate_to_tuple(key)
         if (row, column) in self._cells:
-            del self._cells[(row, column)]
+            self._remove_cell(row, column)
 
 
     @property
@@ -360,11 +423,10 @@ class Worksheet(_WorkbookChild):
 
         :type: int
         """
-        min_row = 1
-        if self._cells:
-            rows = set(c[0] for c in self._cells)
-            min_row = min(rows)
-        return min_row
+        bounds = self._get_bounds()
+        if bounds:
+            return bounds[0]
+        return 1
 
 
     @property
@@ -373,11 +435,10 @@ class Worksheet(_WorkbookChild):
 
         :type: int
         """
-        max_row = 1
-        if self._cells:
-            rows = set(c[0] for c in self._cells)
-            max_row = max(rows)
-        return max_row
+        bounds = self._get_bounds()
+        if bounds:
+            return bounds[2]
+        return 1
 
 
     @property
@@ -386,11 +447,10 @@ class Worksheet(_WorkbookChild):
 
         :type: int
         """
-        min_col = 1
-        if self._cells:
-            cols = set(c[1] for c in self._cells)
-            min_col = min(cols)
-        return min_col
+        bounds = self._get_bounds()
+        if bounds:
+            return bounds[1]
+        return 1
 
 
     @property
@@ -399,11 +459,10 @@ class Worksheet(_WorkbookChild):
 
         :type: int
         """
-        max_col = 1
-        if self._cells:
-            cols = set(c[1] for c in self._cells)
-            max_col = max(cols)
-        return max_col
+        bounds = self._get_bounds()
+        if bounds:
+            return bounds[3]
+        return 1
 
 
     def calculate_dimension(self):
@@ -411,18 +470,10 @@ class Worksheet(_WorkbookChild):
 
         :rtype: string
         """
-        if self._cells:
-            rows = set()
-            cols = set()
-            for row, col in self._cells:
-                rows.add(row)
-                cols.add(col)
-            max_row = max(rows)
-            max_col = max(cols)
-            min_col = min(cols)
-            min_row = min(rows)
-        else:
+        bounds = self._get_bounds()
+        if not bounds:
             return "A1:A1"
+        min_row, min_col, max_row, max_col = bounds
 
         return f"{get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{max_row}"
 
@@ -882,15 +933,67 @@ class Worksheet(_WorkbookChild):
         """
         Remove all but the top left-cell from a range of merged cells
         and recreate the lost border information.
-        Borders are then applied
+        Borders are then applied to the cells at the edges; the other
+        MergedCells are created when they are first used.
         """
-        cells = mcr.cells
-        next(cells) # skip first cell
-        for row, col in cells:
-            self._cells[row, col] = MergedCell(self, row, col)
+        self._remove_range_cells(mcr)
+        self._extend_bounds(mcr.min_row, mcr.min_col, mcr.max_row, mcr.max_col)
         mcr.format()
 
 
+    def _remove_range_cells(self, cr):
+        """
+        Remove all but the top-left cell of a range, going through either the
+        range or the cells of the worksheet, whichever is smaller
+        """
+        min_col, min_row, max_col, max_row = cr.bounds
+        if (max_row - min_row + 1) * (max_col - min_col + 1) <= len(self._cells):
+            coords = cr.cells
+        else:
+            coords = [(row, col) for row, col in self._cells
+                      if min_row <= row <= max_row and min_col <= col <= max_col]
+        for row, col in coords:
+            if (row, col) != (min_row, min_col) and (row, col) in self._cells:
+                self._remove_cell(row, col)
+
+
+    def _merged_in_row(self, row):
+        """
+        Merged ranges which cover a row and create MergedCells when used
+        """
+        if not self.merged_cells:
+            return []
+        return [cr for cr in self.merged_cells._candidates(row)
+                if cr.min_row <= row <= cr.max_row and isinstance(cr, MergedCellRange)]
+
+
+    def _move_merged_cells(self, segments, axis):
+        """
+        Move and resize the merged ranges with the rows (axis 0) or columns
+        (axis 1) they cover, given as segments by `_compose_edits()`. Ranges
+        whose rows or columns are all deleted are removed.
+        """
+        if not self.merged_cells:
+            return
+        move = _span_mover(segments, axis)
+        kept = []
+        for cr in self.merged_cells.ranges:
+            if axis:
+                bounds = move(cr.min_col, cr.max_col)
+            else:
+                bounds = move(cr.min_row, cr.max_row)
+            if bounds is None:
+                continue # deleted or moved off the sheet
+            if axis:
+                cr.min_col, cr.max_col = bounds
+            else:
+                cr.min_row, cr.max_row = bounds
+            kept.append(cr)
+        if len(kept) != len(self.merged_cells.ranges):
+            self.merged_cells.ranges = kept
+        self._bounds = None
+
+
     @property
     @deprecated("Use ws.merged_cells.ranges")
     def merged_cell_ranges(self):
@@ -907,11 +1010,8 @@ class Worksheet(_WorkbookChild):
             raise ValueError("Cell range {0} is not merged".format(cr.coord))
 
         self.merged_cells.remove(cr)
-
-        cells = cr.cells
-        next(cells) # skip first cell
-        for row, col in cells:
-            del self._cells[(row, col)]
+        self._remove_range_cells(cr)
+        self._bounds = None
 
 
     def append(self, iterable):
@@ -936,6 +1036,7 @@ class Worksheet(_WorkbookChild):
 
         if (isinstance(iterable, (list, tuple, range))
             or isgenerator(iterable)):
+            col_idx = 0
             for col_idx, content in enumerate(iterable, 1):
                 if isinstance(content, Cell):
                     # compatible with write-only mode
@@ -948,13 +1049,19 @@ class Worksheet(_WorkbookChild):
                 else:
                     cell = Cell(self, row=row_idx, column=col_idx, value=content)
                 self._cells[(row_idx, col_idx)] = cell
+            if col_idx:
+                self._extend_bounds(row_idx, 1, row_idx, col_idx)
 
         elif isinstance(iterable, dict):
+            cols = []
             for col_idx, content in iterable.items():
                 if isinstance(col_idx, str):
                     col_idx = column_index_from_string(col_idx)
                 cell = Cell(self, row=row_idx, column=col_idx, value=content)
                 self._cells[(row_idx, col_idx)] = cell
+                cols.append(col_idx)
+            if cols:
+                self._extend_bounds(row_idx, min(cols), row_idx, max(cols))
 
         else:
             self._invalid_row(iterable)
@@ -971,15 +1078,13 @@ class Worksheet(_WorkbookChild):
         col_offset = 0
 
         # need to make affected ranges contiguous
+        self._fill_gaps(min_row or 1, min_col or 1)
         if row_or_col == 'row':
-            cells = self.iter_rows(min_row=min_row)
             row_offset = offset
             key = 0
         else:
-            cells = self.iter_cols(min_col=min_col)
             col_offset = offset
             key = 1
-        cells = list(cells)
 
         for row, column in sorted(self._cells, key=itemgetter(key), reverse=reverse):
             if min_row and row < min_row:
@@ -990,11 +1095,39 @@ class Worksheet(_WorkbookChild):
             self._move_cell(row, column, row_offset, col_offset)
 
 
+    def _fill_gaps(self, min_row, min_col):
+        """
+        Create the missing cells from a row and column to the end of the
+        sheet. Cells covered by merged cells are still only created when used.
+        """
+        max_row = self.max_row
+        max_col = self.max_column
+        for row in range(min_row, max_row + 1):
+            merged = self._merged_in_row(row)
+            for col in range(min_col, max_col + 1):
+                if (row, col) in self._cells:
+                    continue
+                if any(cr.min_col <= col <= cr.max_col
+                       and (row, col) != (cr.min_row, cr.min_col) for cr in merged):
+                    continue
+                self._add_cell(Cell(self, row=row, column=col))
+
+
+    def _remove_lines(self, idx, amount, axis):
+        """
+        Remove the cells in `amount` rows (axis 0) or columns (axis 1) from idx
+        """
+        end = idx + amount
+        for key in [key for key in self._cells if idx <= key[axis] < end]:
+            self._remove_cell(*key)
+
+
     def insert_rows(self, idx, amount=1):
         """
         Insert row or rows before row==idx
         """
         self._move_cells(min_row=idx, offset=amount, row_or_col="row")
+        self._move_merged_cells(_compose_edits([(idx, amount)]), 0)
         self._current_row = self.max_row
 
 
@@ -1003,6 +1136,7 @@ class Worksheet(_WorkbookChild):
         Insert column or columns before col==idx
         """
         self._move_cells(min_col=idx, offset=amount, row_or_col="column")
+        self._move_merged_cells(_compose_edits([(idx, amount)]), 1)
 
 
     def delete_rows(self, idx, amount=1):
@@ -1012,7 +1146,9 @@ class Worksheet(_WorkbookChild):
 
         remainder = _gutter(idx, amount, self.max_row)
 
+        self._remove_lines(idx, amount, 0)
         self._move_cells(min_row=idx+amount, offset=-amount, row_or_col="row")
+        self._move_merged_cells(_compose_edits([(idx, -amount)]), 0)
 
         # calculating min and max col is an expensive operation, do it only once
         min_col = self.min_column
@@ -1020,7 +1156,7 @@ class Worksheet(_WorkbookChild):
         for row in remainder:
             for col in range(min_col, max_col):
                 if (row, col) in self._cells:
-                    del self._cells[row, col]
+                    self._remove_cell(row, col)
         self._current_row = self.max_row
         if not self._cells:
             self._current_row = 0
@@ -1033,7 +1169,9 @@ class Worksheet(_WorkbookChild):
 
         remainder = _gutter(idx, amount, self.max_column)
 
+        self._remove_lines(idx, amount, 1)
         self._move_cells(min_col=idx+amount, offset=-amount, row_or_col="column")
+        self._move_merged_cells(_compose_edits([(idx, -amount)]), 1)
 
         # calculating min and max row is an expensive operation, do it only once
         min_row = self.min_row
@@ -1041,7 +1179,71 @@ class Worksheet(_WorkbookChild):
         for col in remainder:
             for row in range(min_row, max_row):
                 if (row, col) in self._cells:
-                    del self._cells[row, col]
+                    self._remove_cell(row, col)
+
+
+    def apply_row_edits(self, edits, translate=False):
+        """
+        Insert and delete rows in a single pass over the cells.
+
+        `edits` is a sequence of (idx, amount) pairs, applied in order as if
+        by `insert_rows(idx, amount)` for positive amounts and
+        `delete_rows(idx, -amount)` for negative ones. If `translate` is
+        True, the references of the formulae in the worksheet are moved with
+        the rows they refer to, and references to deleted rows become #REF!.
+        """
+        self._apply_edits(edits, 0, translate)
+        self._current_row = self.max_row
+        if not self._cells:
+            self._current_row = 0
+
+
+    def apply_col_edits(self, edits, translate=False):
+        """
+        Insert and delete columns in a single pass over the cells, like
+        `apply_row_edits()`
+        """
+        self._apply_edits(edits, 1, translate)
+
+
+    def _apply_edits(self, edits, axis, translate=False):
+        """
+        Rebuild the cells with the rows (axis 0) or columns (axis 1) remapped
+        """
+        segments = _compose_edits(edits)
+        if segments == [(1, 1)]:
+            return
+        starts = [start for start, dest in segments]
+        if translate:
+            move = _span_mover(segments, axis)
+            rows, cols = axis and (None, move) or (move, None)
+        remapped = {}
+
+        cells = {}
+        for key, cell in self._cells.items():
+            idx = key[axis]
+            pos = bisect_right(starts, idx) - 1
+            dest = segments[pos][1]
+            if dest is None:
+                continue # deleted
+            offset = dest - starts[pos]
+            if offset:
+                if axis:
+                    cell.column += offset
+                else:
+                    cell.row += offset
+            if translate and cell.data_type == "f" and isinstance(cell.value, str):
+                value = remapped.get(cell.value)
+                if value is None:
+                    value = remapped[cell.value] = Translator.remap_formula(
+                        cell.value, rows, cols, self.title)
+                cell.value = value
+            cells[cell.row, cell.column] = cell
+
+        self._cells.clear()
+        self._cells.update(cells)
+        self._move_merged_cells(segments, axis)
+        self._bounds = None
 
 
     def move_range(self, cell_range, rows=0, cols=0, translate=False):
@@ -1059,6 +1261,10 @@ class Worksheet(_WorkbookChild):
         if not rows and not cols:
             return
 
+        # merged cells inside the range move with it
+        merged = [cr for cr in self.merged_cells
+                  if isinstance(cr, MergedCellRange) and cr.issubset(cell_range)]
+
         down = rows > 0
         right = cols > 0
 
@@ -1068,8 +1274,20 @@ class Worksheet(_WorkbookChild):
             cells = sorted(cell_range.cols, reverse=right)
 
         for row, col in chain.from_iterable(cells):
+            if (row, col) not in self._cells and any(
+                cr.min_row <= row <= cr.max_row and cr.min_col <= col <= cr.max_col
+                and (row, col) != (cr.min_row, cr.min_col) for cr in merged):
+                # unused MergedCells are not created to be moved
+                if (row + rows, col + cols) in self._cells:
+                    self._remove_cell(row + rows, col + cols)
+                continue
             self._move_cell(row, col, rows, cols, translate)
 
+        for cr in merged:
+            if cr is not cell_range:
+                cr.shift(row_shift=rows, col_shift=cols)
+        if merged:
+            self._bounds = None
         # rebase moved range
         cell_range.shift(row_shift=rows, col_shift=cols)
 
@@ -1085,6 +1303,12 @@ class Worksheet(_WorkbookChild):
         new_col = cell.column + col_offset
         self._cells[new_row, new_col] = cell
         del self._cells[(cell.row, cell.column)]
+        bounds = self._bounds
+        if bounds:
+            if cell.row in (bounds[0], bounds[2]) or cell.column in (bounds[1], bounds[3]):
+                self._bounds = None
+            elif not (bounds[0] <= new_row <= bounds[2] and bounds[1] <= new_col <= bounds[3]):
+                self._extend_bounds(new_row, new_col, new_row, new_col)
         cell.row = new_row
         cell.column = new_col
         if translate and cell.data_type == "f":
@@ -1175,6 +1399,96 @@ class Worksheet(_WorkbookChild):
         self._print_area = [absolute_coordinate(v) for v in value]
 
 
+def _split_segment(segments, target):
+    """
+    Start a new segment at the source index that is mapped to `target`
+    """
+    for pos, (start, dest) in enumerate(segments):
+        if dest is None or dest >= target:
+            continue
+        if pos + 1 < len(segments) and segments[pos + 1][0] - start <= target - dest:
+            continue
+        segments.insert(pos + 1, (start + target - dest, target))
+        return
+
+
+def _compose_edits(edits):
+    """
+    Compose insertions and deletions of rows or columns into a single
+    mapping of indices.
+
+    Returns a list of (start, dest) segments sorted by start: indices from
+    `start` up to the start of the next segment are moved to `dest` onwards,
+    or deleted if `dest` is None.
+    """
+    segments = [(1, 1)]
+    for idx, amount in edits:
+        if idx < 1:
+            raise ValueError("Row and column indices start at 1, not {0}".format(idx))
+        if not amount:
+            continue
+        end = idx - min(amount, 0)
+        _split_segment(segments, idx)
+        _split_segment(segments, end)
+
+        composed = []
+        for start, dest in segments:
+            if dest is not None and dest >= idx:
+                dest = dest >= end and dest + amount or None
+            if composed:
+                # join segments that continue the one before them
+                last_start, last_dest = composed[-1]
+                if dest is None and last_dest is None:
+                    continue
+                if None not in (dest, last_dest) and dest - last_dest == start - last_start:
+                    continue
+            composed.append((start, dest))
+        segments = composed
+    return segments
+
+
+def _span_mover(segments, axis):
+    """
+    Return a function that maps spans of rows (axis 0) or columns (axis 1)
+    like `_map_span()`. Spans moved off the sheet are treated as deleted and
+    spans moved across its edge are cut short.
+    """
+    starts = [start for start, dest in segments]
+    limit = axis and 18278 or 1048576
+
+    def move(first, last):
+        bounds = _map_span(segments, starts, first, last)
+        if bounds is None or bounds[0] > limit:
+            return None
+        return bounds[0], min(bounds[1], limit)
+
+    return move
+
+
+def _map_span(segments, starts, first, last):
+    """
+    Map the span of indices from `first` to `last` through the segments of
+    `_compose_edits()` to the span of the indices that are kept, or None if
+    they are all deleted
+    """
+    pos = bisect_right(starts, first) - 1
+    if segments[pos][1] is None:
+        # deleted segments are always followed by kept ones
+        pos += 1
+        if pos == len(segments) or starts[pos] > last:
+            return None
+        first = starts[pos]
+    start, dest = segments[pos]
+    new_first = dest + first - start
+
+    pos = bisect_right(starts, last) - 1
+    if segments[pos][1] is None:
+        last = starts[pos] - 1
+        pos -= 1
+    start, dest = segments[pos]
+    return new_first, dest + last - start
+
+
 def _gutter(idx, offset, max_val):
     """
     When deleting rows and columns are deleted we rely on overwriting.
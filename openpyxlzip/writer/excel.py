@@ -3,16 +3,22 @@
 """Write a .xlsx file."""
 
 # Python stdlib imports
+from itertools import count
+from multiprocessing import get_all_start_methods, get_context
+import os
 import re
+from shutil import copyfileobj
 from tempfile import TemporaryFile
-from zipfile import ZipFile, ZIP_DEFLATED
+import time
+from warnings import warn
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED, ZIP_STORED
 
 # package imports
-from openpyxlzip.xml import LXML
 from openpyxlzip.compat import deprecated
 from openpyxlzip.utils.exceptions import InvalidFileException
 from openpyxlzip.xml.constants import (
     ARC_SHARED_STRINGS,
+    SHARED_STRINGS,
     ARC_CONTENT_TYPES,
     ARC_ROOT_RELS,
     ARC_WORKBOOK_RELS,
@@ -32,8 +38,16 @@ from openpyxlzip.xml.constants import (
     SHEET_MAIN_NS,
     )
 from openpyxlzip.drawing.spreadsheet_drawing import SpreadsheetDrawing
-from openpyxlzip.xml.functions import tostring, fromstring, Element
+from openpyxlzip.xml.functions import tostring_part, fromstring, Element
+from openpyxlzip.compat.zipfile import (
+    RAW_WRITES,
+    create_archive,
+    get_compresslevel,
+    set_compresslevel,
+)
 from openpyxlzip.packaging.manifest import Manifest
+from openpyxlzip.packaging.deflate import PARALLEL_SIZE, parallel_deflate
+from openpyxlzip.packaging.parts import PartIndex, PartStore, write_deflated
 from openpyxlzip.packaging.relationship import (
     get_rels_path,
     RelationshipList,
@@ -42,17 +56,68 @@ from openpyxlzip.packaging.relationship import (
 from openpyxlzip.comments.comment_sheet import CommentSheet
 from openpyxlzip.packaging.extended import ExtendedProperties
 from openpyxlzip.styles.stylesheet import write_stylesheet
-from openpyxlzip.worksheet._writer import WorksheetWriter
+from openpyxlzip.utils.indexed_list import IndexedList
+from openpyxlzip.worksheet._writer import (
+    WorksheetWriter,
+    create_temporary_file,
+    ALL_TEMP_FILES,
+)
 from openpyxlzip.workbook._writer import WorkbookWriter
+from .strings import write_string_table
 from .theme import theme_xml
 
 
+SHEET_DATA_PLACEHOLDER = re.compile(rb"<sheetData\s*/>")
+
+# parts in these formats are already compressed and are stored as they are
+STORED_EXTENSIONS = frozenset([
+    "png", "jpg", "jpeg", "gif", "emz", "wmz",
+    "zip", "xlsx", "xlsm", "docx", "docm", "pptx", "pptm",
+])
+
+# worksheet writers whose rows are rendered by forked worker processes
+_DEFERRED_WRITERS = []
+
+
+def _compress_type(name):
+    """
+    Return the compression for a part or None for the archive's default
+    """
+    ext = name.rsplit(".", 1)[-1].lower()
+    if ext in STORED_EXTENSIONS:
+        return ZIP_STORED
+
+
+def _render_sheet_data(idx):
+    """
+    Write the rows of a deferred worksheet writer to a temporary file
+    """
+    out = create_temporary_file()
+    _DEFERRED_WRITERS[idx].write_sheet_data(out)
+    return out
+
+
 class ExcelWriter(object):
     """Write a workbook object to an Excel file."""
 
-    def __init__(self, workbook, archive):
+    def __init__(self, workbook, archive, shared_strings=False, compact_xml=False,
+                 workers=None):
         self._archive = archive
+        # the parts written so far, kept up to date as the archive grows
+        self._written = PartIndex(archive)
         self.workbook = workbook
+        # write-only sheets have already been serialised against the table
+        if workbook is not None and workbook.write_only:
+            if shared_strings and not workbook.use_shared_strings:
+                raise ValueError("Write-only workbooks must be created with shared_strings=True to use shared strings")
+            shared_strings = workbook.use_shared_strings
+        elif shared_strings:
+            workbook.shared_strings = IndexedList()
+        self.shared_strings = shared_strings
+        self.compact_xml = compact_xml
+        self.workers = workers
+        # threads that compress very large worksheets
+        self.deflate_threads = os.cpu_count() or 1
         self.manifest = Manifest()
         self.vba_modified = set()
         self._tables = []
@@ -62,27 +127,24 @@ class ExcelWriter(object):
         self._comments = []
         self._pivots = []
         self.drawing_id = 1
+        self._streaming = None
+        self._streamed = {}
 
 
     def write_data(self):
         """Write the various xml files into the zip archive."""
         # cleanup all worksheets
         archive = self._archive
+        self._close_worksheet()
 
         if self.workbook.app_archive is None:
             props = ExtendedProperties()
-            if LXML:
-                archive.writestr(ARC_APP, tostring(props.to_tree(), pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True))
-            else:
-                archive.writestr(ARC_APP, tostring(props.to_tree()))
+            archive.writestr(ARC_APP, tostring_part(props.to_tree(), self.compact_xml))
 
         else:
-            archive.writestr(ARC_APP, self.workbook.app_archive.read(ARC_APP))
+            self._copy_part(self.workbook.app_archive, ARC_APP)
 
-        if LXML:
-            archive.writestr(ARC_CORE, tostring(self.workbook.properties.to_tree(), pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True))
-        else:
-            archive.writestr(ARC_CORE, tostring(self.workbook.properties.to_tree()))
+        archive.writestr(ARC_CORE, tostring_part(self.workbook.properties.to_tree(), self.compact_xml))
         if self.workbook.loaded_theme:
             archive.writestr(ARC_THEME, self.workbook.loaded_theme)
         else:
@@ -98,24 +160,51 @@ class ExcelWriter(object):
         #MattJ this ensures that the original versions are all preserved
         self._write_drawings_and_dependencies()
 
-        #self._archive.writestr(ARC_SHARED_STRINGS,
-                              #write_string_table(self.workbook.shared_strings))
+        if self.shared_strings:
+            self._archive.writestr(ARC_SHARED_STRINGS,
+                                   write_string_table(self.workbook.shared_strings))
+            self.manifest.append_manual("/" + ARC_SHARED_STRINGS, SHARED_STRINGS)
         self._write_external_links()
 
         stylesheet = write_stylesheet(self.workbook)
-        if LXML:
-            archive.writestr(ARC_STYLE, tostring(stylesheet, pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True))
-        else:
-            archive.writestr(ARC_STYLE, tostring(stylesheet))
+        archive.writestr(ARC_STYLE, tostring_part(stylesheet, self.compact_xml))
 
-        writer = WorkbookWriter(self.workbook)
+        writer = WorkbookWriter(self.workbook, shared_strings=self.shared_strings,
+                                compact_xml=self.compact_xml)
         archive.writestr(ARC_ROOT_RELS, writer.write_root_rels())
         archive.writestr(ARC_WORKBOOK, writer.write())
         archive.writestr(ARC_WORKBOOK_RELS, writer.write_rels())
 
         self._merge_vba()
 
-        self.manifest._write(archive, self.workbook)
+        self.manifest._write(archive, self.workbook, self.compact_xml,
+                             self._written)
+
+    def _copy_part(self, source, name):
+        """
+        Copy an unchanged part from the source package. Parts from the
+        workbook's part store keep their compressed data.
+        """
+        if isinstance(source, PartStore):
+            source.copy_to(self._archive, name)
+        else:
+            self._archive.writestr(name, source.read(name),
+                                   compress_type=_compress_type(name))
+
+
+    def _checkbox_index(self, name):
+        """
+        Return the index of an ActiveX control whose checkbox value is to be
+        changed. Other parts are copied unmodified.
+        """
+        checkbox_values = getattr(self.workbook, "checkbox_values", None)
+        if not checkbox_values:
+            return
+        if name.startswith("xl/activeX/activeX") and name.endswith(".bin"):
+            idx = int(name.replace("xl/activeX/activeX", "").replace(".bin", ""))
+            if idx in checkbox_values:
+                return idx
+
 
     def _merge_vba(self):
         """
@@ -129,12 +218,14 @@ class ExcelWriter(object):
                              )
 
         if self.workbook.vba_archive:
-            for name in set(self.workbook.vba_archive.namelist()) - self.vba_modified:
+            for name in self.workbook.vba_archive.namelist():
+                if name in self.vba_modified:
+                    continue
                 if ARC_VBA.match(name):
                     # print("VBA**************", name)
-                    if name not in self._archive.namelist():
-                        if hasattr(self.workbook, "checkbox_values") and name.startswith("xl/activeX/activeX") and name.endswith(".bin"):
-                            idx = int(name.replace("xl/activeX/activeX", "").replace(".bin", ""))
+                    if name not in self._written:
+                        idx = self._checkbox_index(name)
+                        if idx is not None:
                             byte_array = bytearray(self.workbook.vba_archive.read(name))
                             if idx in self.workbook.checkbox_values:
                                 byte_idx = 56
@@ -150,7 +241,7 @@ class ExcelWriter(object):
                                 # print(idx, type(byte_array), byte_array[byte_idx])
                             self._archive.writestr(name, bytes(byte_array))
                         else:
-                            self._archive.writestr(name, self.workbook.vba_archive.read(name))
+                            self._copy_part(self.workbook.vba_archive, name)
                     if name == "xl/vbaProject.bin":
                         self.manifest.append_manual("/" + name, VBA)
 
@@ -160,41 +251,38 @@ class ExcelWriter(object):
             for key in self.workbook._printer_settings:
                 printer_setting = self.workbook._printer_settings[key]
                 full_filename = "{}/printerSettings{}.bin".format(PACKAGE_PRINTER_SETTINGS, key)
-                self._archive.writestr(full_filename, printer_setting.read(full_filename))
+                self._copy_part(printer_setting, full_filename)
 
 
     def _write_custom_xml(self):
         if self.workbook._custom_xml is not None:
             for full_filename in self.workbook._custom_xml:
                 custom_xml = self.workbook._custom_xml[full_filename]
-                self._archive.writestr(full_filename, custom_xml.read(full_filename))
+                self._copy_part(custom_xml, full_filename)
                 if full_filename.startswith(PACKAGE_CUSTOM_XML + "/" + "itemProps"):
                     self.manifest.append_manual("/" + full_filename, "application/vnd.openxmlformats-officedocument.customXmlProperties+xml")
         if self.workbook.arc_custom is not None:
-            self._archive.writestr(ARC_CUSTOM, self.workbook.arc_custom.read(ARC_CUSTOM))
+            self._copy_part(self.workbook.arc_custom, ARC_CUSTOM)
             self.manifest.append_manual("/" + ARC_CUSTOM, "application/vnd.openxmlformats-officedocument.custom-properties+xml")
 
 
     def _write_drawings_and_dependencies(self):
         if self.workbook._all_drawings is not None:
             for pathname in self.workbook._all_drawings:
-                if pathname not in self._archive.namelist():
+                if pathname not in self._written:
                     drawing = self.workbook._all_drawings[pathname]
-                    self._archive.writestr(pathname, drawing.read(pathname))
+                    self._copy_part(drawing, pathname)
         if self.workbook._all_drawings_rels is not None:
             for pathname in self.workbook._all_drawings_rels:
-                if pathname not in self._archive.namelist():
+                if pathname not in self._written:
                     rels = self.workbook._all_drawings_rels[pathname]
                     tree = rels.to_tree()
-                    if LXML:
-                        self._archive.writestr(pathname, tostring(tree, pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True))
-                    else:
-                        self._archive.writestr(pathname, tostring(tree))
+                    self._archive.writestr(pathname, tostring_part(tree, self.compact_xml))
         if self.workbook._all_drawing_dependencies is not None:
             for pathname in self.workbook._all_drawing_dependencies:
-                if pathname not in self._archive.namelist():
+                if pathname not in self._written:
                     drawing = self.workbook._all_drawing_dependencies[pathname]
-                    self._archive.writestr(pathname, drawing.read(pathname))
+                    self._copy_part(drawing, pathname)
 
 
     def _write_images(self):
@@ -202,7 +290,8 @@ class ExcelWriter(object):
         print("_write_images")
         for img in self._images:
             print("photo")
-            self._archive.writestr(img.path[1:], img._data())
+            self._archive.writestr(img.path[1:], img._data(),
+                                   compress_type=_compress_type(img.path))
 
 
     def _write_charts(self):
@@ -210,10 +299,7 @@ class ExcelWriter(object):
         if len(self._charts) != len(set(self._charts)):
             raise InvalidFileException("The same chart cannot be used in more than one worksheet")
         for chart in self._charts:
-            if LXML:
-                self._archive.writestr(chart.path[1:], tostring(chart._write(), pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True))
-            else:
-                self._archive.writestr(chart.path[1:], tostring(chart._write()))
+            self._archive.writestr(chart.path[1:], tostring_part(chart._write(), self.compact_xml))
             self.manifest.append(chart)
 
 
@@ -232,14 +318,8 @@ class ExcelWriter(object):
             self._images.append(img)
             img._id = len(self._images)
         rels_path = get_rels_path(drawing.path)[1:]
-        if LXML:
-            self._archive.writestr(drawing.path[1:], tostring(drawing._write(), pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True))
-        else:
-            self._archive.writestr(drawing.path[1:], tostring(drawing._write()))
-        if LXML:
-            self._archive.writestr(rels_path, tostring(drawing._write_rels(), pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True))
-        else:
-            self._archive.writestr(rels_path, tostring(drawing._write_rels()))
+        self._archive.writestr(drawing.path[1:], tostring_part(drawing._write(), self.compact_xml))
+        self._archive.writestr(rels_path, tostring_part(drawing._write_rels(), self.compact_xml))
         self.manifest.append(drawing)
 
 
@@ -247,10 +327,7 @@ class ExcelWriter(object):
         for idx, sheet in enumerate(self.workbook.chartsheets, 1):
 
             sheet._id = idx
-            if LXML:
-                xml = tostring(sheet.to_tree(), pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True)
-            else:
-                xml = tostring(sheet.to_tree())
+            xml = tostring_part(sheet.to_tree(), self.compact_xml)
 
             self._archive.writestr(sheet.path[1:], xml)
             self.manifest.append(sheet)
@@ -264,10 +341,7 @@ class ExcelWriter(object):
                 tree = rels.to_tree()
 
                 rels_path = get_rels_path(sheet.path[1:])
-                if LXML:
-                    self._archive.writestr(rels_path, tostring(tree, pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True))
-                else:
-                    self._archive.writestr(rels_path, tostring(tree))
+                self._archive.writestr(rels_path, tostring_part(tree, self.compact_xml))
 
 
     def _write_comment(self, ws):
@@ -282,10 +356,7 @@ class ExcelWriter(object):
 
         cs._id = len(self._comments) + total_vml_already_existing
 
-        if LXML:
-            self._archive.writestr(cs.path[1:], tostring(cs.to_tree(), pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True))
-        else:
-            self._archive.writestr(cs.path[1:], tostring(cs.to_tree()))
+        self._archive.writestr(cs.path[1:], tostring_part(cs.to_tree(), self.compact_xml))
         self.manifest.append(cs)
 
         if ws.legacy_drawing is None or self.workbook.vba_archive is None:
@@ -303,7 +374,11 @@ class ExcelWriter(object):
         ws._rels.append(comment_rel)
 
 
-    def write_worksheet(self, ws):
+    def _prepare_worksheet(self, ws, defer_rows=False):
+        """
+        Assign the drawing and serialise the worksheet. With `defer_rows`
+        rows are only registered and a placeholder is written for them.
+        """
         if len(ws.drawings) == 0:
             ws._drawing = SpreadsheetDrawing()
         elif len(ws.drawings) == 1:
@@ -321,11 +396,53 @@ class ExcelWriter(object):
                 ws.close()
             writer = ws._writer
         else:
-            writer = WorksheetWriter(ws)
+            shared_strings = None
+            if self.shared_strings:
+                shared_strings = self.workbook.shared_strings
+            writer = WorksheetWriter(ws, shared_strings=shared_strings,
+                                     defer_rows=defer_rows)
             writer.write()
 
         ws._rels = writer._rels
-        self._archive.write(writer.out, ws.path[1:])
+        return writer
+
+
+    def open_worksheet(self, ws):
+        """
+        Return a new entry in the archive that the rows of a write-only
+        worksheet are streamed into. The worksheet streamed before is closed.
+        """
+        self._close_worksheet()
+        used = {sheet._id for sheet in self._streamed.values()}
+        ws._id = next(idx for idx in count(1) if idx not in used)
+        self._streaming = ws
+        self._streamed[ws.path] = ws
+
+        info = self._zip_info(ws.path[1:])
+        return self._archive.open(info, "w", force_zip64=True)
+
+
+    def _close_worksheet(self):
+        """
+        Close the worksheet that is being streamed, if any
+        """
+        ws = self._streaming
+        if ws is not None:
+            self._streaming = None
+            self._prepare_worksheet(ws)
+
+
+    def write_worksheet(self, ws, writer=None, sheet_data=None):
+        if self._streamed.get(ws.path) is ws:
+            # already in the archive
+            self.manifest.append(ws)
+            return
+        if writer is None:
+            writer = self._prepare_worksheet(ws)
+        if sheet_data is None:
+            self._write_buffer(writer.out, ws.path[1:])
+        else:
+            self._write_sheet_data(writer.out, sheet_data, ws.path[1:])
         self.manifest.append(ws)
 
         if ws.ole_objects is not None:
@@ -335,19 +452,105 @@ class ExcelWriter(object):
         writer.cleanup()
 
 
+    def _render_worksheets(self):
+        """
+        Serialise worksheets in order with deferred rows, so that styles,
+        shared strings and relationships are assigned as they would be
+        otherwise, then render the rows in a pool of forked processes.
+        """
+        worksheets = self.workbook.worksheets
+        if (
+            not self.workers
+            or self.workers < 2
+            or len(worksheets) < 2
+            or self.workbook.write_only
+            ):
+            return
+        if "fork" not in get_all_start_methods():
+            warn("Worksheets can only be written in parallel where processes can be forked")
+            return
+
+        writers = []
+        for idx, ws in enumerate(worksheets, 1):
+            ws._id = idx
+            writers.append(self._prepare_worksheet(ws, defer_rows=True))
+
+        _DEFERRED_WRITERS[:] = writers
+        try:
+            workers = min(self.workers, len(writers))
+            with get_context("fork").Pool(workers) as pool:
+                sheet_data = pool.map(_render_sheet_data, range(len(writers)))
+        finally:
+            del _DEFERRED_WRITERS[:]
+        ALL_TEMP_FILES.extend(sheet_data)
+        return list(zip(writers, sheet_data))
+
+
+    def _zip_info(self, arcname):
+        info = ZipInfo(arcname, time.localtime()[:6])
+        info.compress_type = self._archive.compression
+        set_compresslevel(info, get_compresslevel(self._archive))
+        info.external_attr = 0o600 << 16
+        return info
+
+
+    def _write_buffer(self, src, arcname):
+        """
+        Copy a serialised worksheet into the archive
+        """
+        info = self._zip_info(arcname)
+        info.file_size = src.seek(0, os.SEEK_END)
+        src.seek(0)
+        if (info.compress_type == ZIP_DEFLATED and info.file_size >= PARALLEL_SIZE
+            and self.deflate_threads > 1 and RAW_WRITES):
+            chunks = parallel_deflate(src, get_compresslevel(self._archive),
+                                      threads=self.deflate_threads)
+            write_deflated(self._archive, info, chunks)
+            return
+        with self._archive.open(info, "w") as dest:
+            copyfileobj(src, dest)
+
+
+    def _write_sheet_data(self, src, sheet_data, arcname):
+        """
+        Replace the rows placeholder of a worksheet with its rendered rows
+        """
+        src.seek(0)
+        head, tail = SHEET_DATA_PLACEHOLDER.split(src.read(), 1)
+
+        info = self._zip_info(arcname)
+        info.file_size = len(head) + os.path.getsize(sheet_data) + len(tail)
+        with self._archive.open(info, "w") as dest:
+            dest.write(head)
+            with open(sheet_data, "rb") as src:
+                copyfileobj(src, dest)
+            dest.write(tail)
+
+        os.remove(sheet_data)
+        ALL_TEMP_FILES.remove(sheet_data)
+
+
     def _write_worksheets(self):
 
         pivot_caches = set()
+        rendered = self._render_worksheets()
+        streamed = {ws._id for ws in self._streamed.values()}
+        ids = (idx for idx in count(1) if idx not in streamed)
 
         for idx, ws in enumerate(self.workbook.worksheets, 1):
 
-            ws._id = idx
-            self.write_worksheet(ws)
+            if self._streamed.get(ws.path) is not ws:
+                ws._id = next(ids)
+            if rendered:
+                self.write_worksheet(ws, *rendered[idx - 1])
+            else:
+                self.write_worksheet(ws)
 
             if ws.ole_objects is not None:
                 for ole_obj in ws.ole_objects.oleObject:
 
-                    self._archive.write(ole_obj.oleObj, arcname=ole_obj.path)
+                    self._archive.write(ole_obj.oleObj, arcname=ole_obj.path,
+                                        compress_type=_compress_type(ole_obj.path))
                     # self._archive.write(ole_obj.objectPr.imgData, arcname=ole_obj.objectPr.path)
 
                     found = False
@@ -418,19 +621,17 @@ class ExcelWriter(object):
                 if hasattr(ws, "vml_rels") and ws.vml_rels is not None:
                     tree = ws.vml_rels.to_tree()
                     vml_rels_out_path = vml_out_path.replace("/drawings/", "/drawings/_rels/") + ".rels"
-                    if LXML:
-                        self._archive.writestr(vml_rels_out_path, tostring(tree, pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True))
-                    else:
-                        self._archive.writestr(vml_rels_out_path, tostring(tree))
+                    self._archive.writestr(vml_rels_out_path, tostring_part(tree, self.compact_xml))
                 if hasattr(ws, "_legacy_images") and ws._legacy_images is not None:
                     for filename in ws._legacy_images:
                         print(filename, type(ws._legacy_images[filename]))
-                        self._archive.write(ws._legacy_images[filename], arcname=filename)
+                        self._archive.write(ws._legacy_images[filename], arcname=filename,
+                                            compress_type=_compress_type(filename))
 
             for t in ws._tables.values():
                 self._tables.append(t)
                 t.id = len(self._tables)
-                t._write(self._archive)
+                t._write(self._archive, self.compact_xml)
                 self.manifest.append(t)
                 #TODO probably a bug
                 if t._rel_id in ws._rels:
@@ -444,7 +645,8 @@ class ExcelWriter(object):
 
                 self._pivots.append(p)
                 p._id = len(self._pivots)
-                p._write(self._archive, self.manifest)
+                p._write(self._archive, self.manifest, self.compact_xml,
+                         self._written)
                 self.workbook._pivots.append(p)
                 r = Relationship(Type=p.rel_type, Target=p.path)
                 ws._rels.append(r)
@@ -452,10 +654,7 @@ class ExcelWriter(object):
             if ws._rels:
                 rels_path = get_rels_path(ws.path)[1:]
                 tree = ws._rels.to_tree()
-                if LXML:
-                    self._archive.writestr(rels_path, tostring(tree, pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True))
-                else:
-                    self._archive.writestr(rels_path, tostring(tree))
+                self._archive.writestr(rels_path, tostring_part(tree, self.compact_xml))
 
 
     def _write_external_links(self):
@@ -467,16 +666,10 @@ class ExcelWriter(object):
             rels_path = get_rels_path(link.path[1:])
 
             xml = link.to_tree()
-            if LXML:
-                self._archive.writestr(link.path[1:], tostring(xml, pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True))
-            else:
-                self._archive.writestr(link.path[1:], tostring(xml))
+            self._archive.writestr(link.path[1:], tostring_part(xml, self.compact_xml))
             rels = RelationshipList()
             rels.append(link.file_link)
-            if LXML:
-                self._archive.writestr(rels_path, tostring(rels.to_tree(), pretty_print = True, xml_declaration = True, encoding='UTF-8', standalone=True))
-            else:
-                self._archive.writestr(rels_path, tostring(rels.to_tree()))
+            self._archive.writestr(rels_path, tostring_part(rels.to_tree(), self.compact_xml))
             self.manifest.append(link)
 
 
@@ -486,7 +679,8 @@ class ExcelWriter(object):
         self._archive.close()
 
 
-def save_workbook(workbook, filename):
+def save_workbook(workbook, filename, shared_strings=False, compact_xml=False,
+                  workers=None, compresslevel=None):
     """Save the given workbook on the filesystem under the name filename.
 
     :param workbook: the workbook to save
@@ -495,15 +689,100 @@ def save_workbook(workbook, filename):
     :param filename: the path to which save the workbook
     :type filename: string
 
+    :param shared_strings: write strings to a shared string table instead of inline
+    :type shared_strings: bool
+
+    :param compact_xml: write package parts without indentation
+    :type compact_xml: bool
+
+    :param workers: number of processes used to write worksheet rows
+    :type workers: int
+
+    :param compresslevel: zlib compression level from 1 (fastest) to 9 (smallest)
+    :type compresslevel: int
+
     :rtype: bool
 
     """
-    archive = ZipFile(filename, 'w', ZIP_DEFLATED, allowZip64=True)
-    writer = ExcelWriter(workbook, archive)
+    archive = create_archive(filename, compresslevel)
+    writer = ExcelWriter(workbook, archive, shared_strings=shared_strings,
+                         compact_xml=compact_xml, workers=workers)
     writer.save()
     return True
 
 
+class _UnseekableStream(object):
+
+    """
+    Only expose writing so that the archive is written front to back, with
+    the sizes of parts in data descriptors after their data
+    """
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+
+
+    def write(self, data):
+        """
+        Write all of the data. Raw streams can write less than they are
+        given; objects whose write() returns nothing are taken to have
+        written it all.
+        """
+        size = len(data)
+        written = self._fileobj.write(data)
+        if written is not None and written < size:
+            view = memoryview(data)
+            while written < size:
+                count = self._fileobj.write(view[written:])
+                if not count:
+                    raise OSError("The stream stopped accepting data")
+                written += count
+        return size
+
+
+    def flush(self):
+        flush = getattr(self._fileobj, "flush", None)
+        if flush is not None:
+            flush()
+
+
+def save_stream(workbook, fileobj, shared_strings=False, compact_xml=False,
+                compresslevel=None):
+    """Write the given workbook to a file-like object which only needs a
+    `write` method, such as a socket, a pipe or an HTTP response. Nothing
+    is read back or sought, so the workbook is never buffered as a whole.
+
+    :param workbook: the workbook to save
+    :type workbook: :class:`openpyxl.workbook.Workbook`
+
+    :param fileobj: the object to write the workbook to
+
+    :param shared_strings: write strings to a shared string table instead of inline
+    :type shared_strings: bool
+
+    :param compact_xml: write package parts without indentation
+    :type compact_xml: bool
+
+    :param compresslevel: zlib compression level from 1 (fastest) to 9 (smallest)
+    :type compresslevel: int
+
+    """
+    archive = create_archive(_UnseekableStream(fileobj), compresslevel)
+    writer = ExcelWriter(workbook, archive, shared_strings=shared_strings,
+                         compact_xml=compact_xml)
+    writer.save()
+    return True
+
+
+def stream_workbook(workbook, filename, compresslevel=None):
+    """
+    Return a writer for a write-only workbook whose worksheets are written
+    into the archive `filename` while rows are appended to them
+    """
+    archive = create_archive(filename, compresslevel)
+    return ExcelWriter(workbook, archive)
+
+
 @deprecated("Use a NamedTemporaryFile")
 def save_virtual_workbook(workbook):
     """Return an in-memory workbook, suitable for a Django response."""
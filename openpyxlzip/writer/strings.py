@@ -0,0 +1,25 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+"""Write the shared string table."""
+from io import BytesIO
+
+from openpyxlzip.xml.constants import SHEET_MAIN_NS
+from openpyxlzip.xml.functions import Element, SubElement, whitespace, xmlfile
+
+
+def write_string_table(string_table):
+    """Write the string table xml."""
+    out = BytesIO()
+
+    with xmlfile(out, encoding="UTF-8") as xf:
+        xf.write_declaration(standalone=True)
+        with xf.element("sst", xmlns=SHEET_MAIN_NS, uniqueCount="%d" % len(string_table)):
+
+            for key in string_table:
+                el = Element('si')
+                text = SubElement(el, 't')
+                text.text = key
+                whitespace(text)
+                xf.write(el)
+
+    return out.getvalue()
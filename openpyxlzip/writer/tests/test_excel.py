@@ -2,9 +2,10 @@ from __future__ import absolute_import
 # Copyright (c) 2010-2020 openpyxlzip
 
 from io import BytesIO
+from multiprocessing import get_all_start_methods
 import os
 from string import ascii_letters
-from zipfile import ZipFile
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
 
 import pytest
 
@@ -99,6 +100,7 @@ def test_write_images(datadir, ExcelWriter, archive):
 
     zipinfo = archive.infolist()
     assert 'xl/media/image1.png' in archive.namelist()
+    assert archive.getinfo('xl/media/image1.png').compress_type == ZIP_STORED
 
 
 def test_chartsheet(ExcelWriter, archive):
@@ -188,3 +190,267 @@ def test_write_virtual_workbook():
     saved_wb = save_virtual_workbook(old_wb)
     new_wb = load_workbook(BytesIO(saved_wb))
     assert new_wb
+
+
+def test_write_shared_strings(ExcelWriter):
+    out = BytesIO()
+    archive = ZipFile(out, "w")
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Label", "Label", 1])
+    ws.append(["Other", "Label", None])
+
+    writer = ExcelWriter(wb, archive, shared_strings=True)
+    writer.write_data()
+
+    assert 'xl/sharedStrings.xml' in archive.namelist()
+    assert '/xl/sharedStrings.xml' in writer.manifest.filenames
+    assert list(wb.shared_strings) == ["Label", "Other"]
+    assert b'sharedStrings.xml' in archive.read('xl/_rels/workbook.xml.rels')
+
+    archive.close()
+    wb = load_workbook(out)
+    assert list(wb.active.values) == [("Label", "Label", 1), ("Other", "Label", None)]
+
+
+def test_write_only_shared_strings(tmpdir):
+    tmpdir.chdir()
+    wb = Workbook(write_only=True, shared_strings=True)
+    ws = wb.create_sheet()
+    for i in range(10):
+        ws.append(["Label", "Value {0}".format(i % 2)])
+    wb.save("shared.xlsx")
+
+    with ZipFile("shared.xlsx") as src:
+        assert 'xl/sharedStrings.xml' in src.namelist()
+    wb = load_workbook("shared.xlsx")
+    assert wb.active["B10"].value == "Value 1"
+    assert list(wb.shared_strings) == []
+
+
+def test_write_only_without_shared_strings(tmpdir):
+    tmpdir.chdir()
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(["Label"])
+    with pytest.raises(ValueError):
+        wb.save("inline.xlsx", shared_strings=True)
+
+
+def test_merge_vba_keeps_compressed_data(ExcelWriter, archive, datadir):
+    from openpyxlzip import load_workbook
+    datadir.chdir()
+    wb = load_workbook("vba+comments.xlsm", keep_vba=True)
+
+    writer = ExcelWriter(wb, archive)
+    writer._merge_vba()
+
+    src = ZipFile("vba+comments.xlsm")
+    for name in archive.namelist():
+        assert archive.getinfo(name).compress_size == src.getinfo(name).compress_size
+        assert archive.read(name) == src.read(name)
+
+
+@pytest.mark.lxml_required
+def test_write_compact_xml(ExcelWriter):
+    wb = Workbook()
+    ws = wb.active
+    ws.append([1, 2, 3])
+    ws.add_chart(BarChart(), "E1")
+
+    parts = {}
+    for compact_xml in (False, True):
+        out = BytesIO()
+        archive = ZipFile(out, "w")
+        writer = ExcelWriter(wb, archive, compact_xml=compact_xml)
+        writer.save()
+        archive = ZipFile(out)
+        parts[compact_xml] = dict((name, archive.read(name)) for name in archive.namelist())
+
+    assert parts[True].keys() == parts[False].keys()
+    for name in ["[Content_Types].xml", "xl/workbook.xml", "xl/styles.xml",
+                 "xl/charts/chart1.xml", "xl/drawings/drawing1.xml"]:
+        compact = parts[True][name]
+        assert compact.startswith(b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>")
+        assert b">\n" not in compact.split(b"?>", 1)[1]
+        assert len(compact) < len(parts[False][name])
+    wb = load_workbook(BytesIO(out.getvalue()))
+    assert list(wb.active.values) == [(1, 2, 3)]
+
+
+@pytest.mark.skipif("fork" not in get_all_start_methods(), reason="requires fork")
+@pytest.mark.parametrize("shared_strings", [False, True])
+def test_write_worksheets_in_parallel(shared_strings):
+    from openpyxlzip.styles import Font
+    from openpyxlzip.formatting.rule import CellIsRule
+
+    def make_workbook():
+        wb = Workbook()
+        for idx in range(3):
+            ws = wb.create_sheet()
+            ws.column_dimensions["B"].font = Font(italic=True, size=9 + idx)
+            ws.row_dimensions[3].font = Font(name="Arial", size=20 + idx)
+            for row in range(20):
+                ws.append(["label {0}".format(row % 3), row, "sheet {0}".format(idx)])
+            ws["A1"].font = Font(bold=True, size=10 + idx)
+            ws["C3"].hyperlink = "http://example.com/{0}".format(idx)
+            rule = CellIsRule(operator="lessThan", formula=["1"], font=Font(size=idx + 1))
+            ws.conditional_formatting.add("B1:B10", rule)
+        return wb
+
+    parts = []
+    for workers in (None, 2):
+        out = BytesIO()
+        make_workbook().save(out, shared_strings=shared_strings, workers=workers)
+        archive = ZipFile(out)
+        parts.append(dict((name, archive.read(name)) for name in archive.namelist()))
+    assert parts[0] == parts[1]
+
+    wb = load_workbook(out)
+    assert wb.worksheets[2]["A1"].font.size == 11
+    assert wb.worksheets[3]["C3"].hyperlink.target == "http://example.com/2"
+
+
+def test_stream_write_only_worksheets():
+    from openpyxlzip.worksheet._writer import ALL_TEMP_FILES
+
+    out = BytesIO()
+    wb = Workbook(write_only=True)
+    ws1 = wb.create_sheet("first")
+    ws2 = wb.create_sheet("second")
+    wb.create_sheet("empty", 0)
+    wb.stream_to(out)
+    temp_files = list(ALL_TEMP_FILES)
+
+    for idx in range(10):
+        ws2.append([idx, "row {0}".format(idx)])
+    archive = wb._stream_writer._archive
+    assert archive.namelist() == []
+    ws1.append(["streamed second"])
+    assert archive.namelist() == ["xl/worksheets/sheet1.xml"]
+    assert ws2.closed
+
+    wb.save()
+    assert ALL_TEMP_FILES == temp_files
+
+    wb = load_workbook(out)
+    assert wb.sheetnames == ["empty", "first", "second"]
+    assert list(wb["first"].values) == [("streamed second",)]
+    assert list(wb["second"].values)[-1] == (9, "row 9")
+
+
+class WriteOnlyStream:
+
+    """
+    Output without tell, seek or flush
+    """
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+
+
+@pytest.mark.parametrize("write_only", [False, True])
+def test_save_stream(write_only):
+    wb = Workbook(write_only=write_only)
+    ws = wb.active if not write_only else wb.create_sheet()
+    for idx in range(100):
+        ws.append([idx, "row {0}".format(idx)])
+
+    out = WriteOnlyStream()
+    wb.save_stream(out)
+
+    archive = ZipFile(BytesIO(b"".join(out.chunks)))
+    assert archive.testzip() is None
+    assert all(info.flag_bits & 0x08 for info in archive.infolist())
+    wb = load_workbook(BytesIO(b"".join(out.chunks)))
+    assert list(wb.active.values)[-1] == (99, "row 99")
+
+
+class ShortWriteStream(WriteOnlyStream):
+
+    """
+    Output that writes at most a few bytes at a time, like a raw stream
+    """
+
+    def write(self, data):
+        data = bytes(data[:7])
+        self.chunks.append(data)
+        return len(data)
+
+
+def test_save_stream_short_writes():
+    wb = Workbook()
+    wb.active.append(["short", "writes"])
+
+    out = ShortWriteStream()
+    wb.save_stream(out)
+
+    wb = load_workbook(BytesIO(b"".join(out.chunks)))
+    assert list(wb.active.values) == [("short", "writes")]
+
+
+def test_stream_stops_accepting_data():
+    from ..excel import _UnseekableStream
+
+    class Full:
+        def write(self, data):
+            return 0
+
+    with pytest.raises(OSError):
+        _UnseekableStream(Full()).write(b"data")
+
+
+@pytest.mark.parametrize("name, compress_type",
+                         [
+                             ("xl/media/image1.png", ZIP_STORED),
+                             ("xl/media/image2.JPEG", ZIP_STORED),
+                             ("xl/embeddings/Workbook1.xlsx", ZIP_STORED),
+                             ("xl/media/image3.emf", None),
+                             ("xl/embeddings/oleObject1.bin", None),
+                             ("xl/worksheets/sheet1.xml", None),
+                         ]
+                         )
+def test_compress_type(name, compress_type):
+    from ..excel import _compress_type
+    assert _compress_type(name) == compress_type
+
+
+def test_compresslevel():
+    wb = Workbook()
+    ws = wb.active
+    for idx in range(2000):
+        ws.append([idx, "row {0}".format(idx % 7), idx * 0.5])
+
+    sizes = {}
+    for level in (1, 9):
+        out = BytesIO()
+        wb.save(out, compresslevel=level)
+        archive = ZipFile(out)
+        info = archive.getinfo("xl/worksheets/sheet1.xml")
+        assert info.compress_type == ZIP_DEFLATED
+        sizes[level] = info.compress_size
+    assert sizes[9] < sizes[1]
+    assert list(load_workbook(out).active.values)[-1] == (1999, "row 4", 999.5)
+
+
+def test_parallel_deflate(ExcelWriter, monkeypatch):
+    from .. import excel
+    monkeypatch.setattr(excel, "PARALLEL_SIZE", 1024)
+    wb = Workbook()
+    ws = wb.active
+    for idx in range(2000):
+        ws.append([idx, "row {0}".format(idx % 7), idx * 0.5])
+
+    out = BytesIO()
+    archive = ZipFile(out, "w", ZIP_DEFLATED)
+    writer = ExcelWriter(wb, archive)
+    writer.deflate_threads = 2
+    writer.save()
+
+    archive = ZipFile(out)
+    assert archive.testzip() is None
+    assert archive.getinfo("xl/worksheets/sheet1.xml").compress_type == ZIP_DEFLATED
+    assert list(load_workbook(out).active.values)[-1] == (1999, "row 4", 999.5)
@@ -3,7 +3,6 @@
 
 """Collection of XML resources compatible across different Python versions"""
 import os
-import xmlschema
 
 def lxml_available():
     try:
@@ -43,4 +42,5 @@ DEFUSEDXML = defusedxml_available() and defusedxml_env_set()
 
 
 def load_schema():
+    import xmlschema
     root_schema = xmlschema.XMLSchema('/sml.xsd')
\ No newline at end of file
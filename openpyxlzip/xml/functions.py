@@ -121,3 +121,16 @@ def get_namespace(node):
 def whitespace(node):
     if node.text != node.text.strip():
         node.set("{%s}space" % XML_NS, "preserve")
+
+
+def tostring_part(tree, compact_xml=False):
+    """
+    Serialise the root element of a package part.
+
+    With lxml parts get an XML declaration and are pretty printed unless
+    `compact_xml` is set.
+    """
+    if LXML:
+        return tostring(tree, pretty_print=not compact_xml, xml_declaration=True,
+                        encoding='UTF-8', standalone=True)
+    return tostring(tree)
@@ -0,0 +1,5 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+"""
+OOXML schema tables generated by xml/schemas/build_schemas.py
+"""
@@ -0,0 +1,29 @@
+# Generated by openpyxlzip/xml/schemas/build_schemas.py
+
+ALL_NAMESPACES_PREFIXES = {
+    'xml': 'http://www.w3.org/XML/1998/namespace',
+    'x': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main',
+    'x2': 'http://schemas.microsoft.com/office/spreadsheetml/2009/9/main',
+    'xsd': 'http://www.w3.org/2001/XMLSchema',
+    'vt': 'http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes',
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+    'cdr': 'http://schemas.openxmlformats.org/drawingml/2006/chartDrawing',
+    's': 'http://schemas.openxmlformats.org/officeDocument/2006/sharedTypes',
+    'xdr': 'http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing',
+    'xdr14': 'http://xldr14SchemaUri',
+    'a14': 'http://schemas.microsoft.com/office/drawing/2010/main',
+    'x14': 'http://schemas.microsoft.com/office/spreadsheetml/2009/9/main',
+    'xm': 'http://schemas.microsoft.com/office/excel/2006/main',
+    'xr10': 'http://schemas.microsoft.com/office/spreadsheetml/2016/revision10',
+    'w': 'http://schemas.openxmlformats.org/wordprocessingml/main',
+    'dpct': 'http://schemas.openxmlformats.org/drawingml/2006/picture',
+    'xlrd2': 'http://schemas.microsoft.com/office/spreadsheetml/2017/richdata2',
+    'xr6': 'http://schemas.microsoft.com/office/spreadsheetml/2016/revision6',
+    'm': 'http://schemas.openxmlformats.org/officeDocument/2006/math',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'sl': 'http://schemas.openxmlformats.org/schemaLibrary/2006/main',
+    'wp': 'http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing',
+    'xr': 'http://schemas.microsoft.com/office/spreadsheetml/2014/revision',
+    'xr2': 'http://schemas.microsoft.com/office/spreadsheetml/2015/revision2',
+}
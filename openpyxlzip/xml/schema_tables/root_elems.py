@@ -0,0 +1,228 @@
+# Generated by openpyxlzip/xml/schemas/build_schemas.py
+
+ROOT_ELEMS = {
+    '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata2}filterColumn': '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata2}CT_RichFilterColumn',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata2}richSortCondition': '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata2}CT_RichSortCondition',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata2}supportingPropertyBags': '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata2}CT_SupportingPropertyBags',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata2}spbStructures': '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata2}CT_SupportingPropertyBagStructures',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata2}arrayData': '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata2}CT_ArrayData',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata2}richStyleSheet': '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata2}CT_RichStylesheet',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata2}rvTypesInfo': '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata2}CT_RichValueTypesInfo',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/extended-properties}Properties': '{http://schemas.openxmlformats.org/officeDocument/2006/extended-properties}CT_Properties',
+    '{http://schemas.openxmlformats.org/drawingml/2006/picture}pic': '{http://schemas.openxmlformats.org/drawingml/2006/picture}CT_Picture',
+    '{http://schemas.openxmlformats.org/drawingml/2006/picture}lockedCanvas': '{http://schemas.openxmlformats.org/drawingml/2006/main}CT_GvmlGroupShape',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2016/pivotdefaultlayout}pivotTableDefinition16': '{http://schemas.microsoft.com/office/spreadsheetml/2016/pivotdefaultlayout}CT_PivotTableDefinition16',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2014/11/main}modelTimeGroupings': '{http://schemas.microsoft.com/office/spreadsheetml/2014/11/main}CT_ModelTimeGroupings',
+    '{http://schemas.openxmlformats.org/drawingml/2006/chart}chartSpace': '{http://schemas.openxmlformats.org/drawingml/2006/chart}CT_ChartSpace',
+    '{http://schemas.openxmlformats.org/drawingml/2006/chart}userShapes': '{http://schemas.openxmlformats.org/drawingml/2006/chartDrawing}CT_Drawing',
+    '{http://schemas.openxmlformats.org/drawingml/2006/chart}chart': '{http://schemas.openxmlformats.org/drawingml/2006/chart}CT_RelId',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/customXml}datastoreItem': '{http://schemas.openxmlformats.org/officeDocument/2006/customXml}CT_DatastoreItem',
+    '{http://schemas.microsoft.com/office/excel/2010/spreadsheetDrawing}contentPart': '{http://schemas.microsoft.com/office/excel/2010/spreadsheetDrawing}CT_ContentPart',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2020/richvaluerefresh}refreshIntervals': '{http://schemas.microsoft.com/office/spreadsheetml/2020/richvaluerefresh}CT_RichValueRefreshIntervals',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}calcChain': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_CalcChain',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}comments': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_Comments',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}MapInfo': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_MapInfo',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}connections': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_Connections',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}pivotCacheDefinition': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_PivotCacheDefinition',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}pivotCacheRecords': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_PivotCacheRecords',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}pivotTableDefinition': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_pivotTableDefinition',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}queryTable': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_QueryTable',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}sst': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_Sst',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}headers': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_RevisionHeaders',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}revisions': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_Revisions',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}users': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_Users',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}worksheet': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_Worksheet',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}chartsheet': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_Chartsheet',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}dialogsheet': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_Dialogsheet',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}metadata': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_Metadata',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}singleXmlCells': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_SingleXmlCells',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}styleSheet': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_Stylesheet',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}externalLink': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_ExternalLink',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}table': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_Table',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}volTypes': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_VolTypes',
+    '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}workbook': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_Workbook',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2018/threadedcomments}personList': '{http://schemas.microsoft.com/office/spreadsheetml/2018/threadedcomments}CT_PersonList',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2018/threadedcomments}ThreadedComments': '{http://schemas.microsoft.com/office/spreadsheetml/2018/threadedcomments}CT_ThreadedComments',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}slicerCaches': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_SlicerCaches',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}tableSlicerCache': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_TableSlicerCache',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}slicerCacheHideItemsWithNoData': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_SlicerCacheHideNoData',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}slicerCachePivotTables': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_SlicerCachePivotTables',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}pivotCaches': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_PivotCaches',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}pivotTableReferences': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_PivotTableReferences',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}queryTable': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_QueryTable',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}webExtensions': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_WebExtensions',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}timelineCacheRefs': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_TimelineCacheRefs',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}timelineRefs': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_TimelineRefs',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}timelineCachePivotCaches': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_PivotCaches',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}workbookPr': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_WorkbookPr',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}timelineStyles': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_TimelineStyles',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}dxfs': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_Dxfs',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}connection': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_Connection',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}calculatedMember': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_CalculatedMember',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}pivotTableUISettings': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_PivotTableUISettings',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}pivotFilter': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_PivotFilter',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}cachedUniqueNames': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_CachedUniqueNames',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}cacheHierarchy': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_CacheHierarchy',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}timelinePivotCacheDefinition': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_TimelinePivotCacheDefinition',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}pivotCacheIdVersion': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_PivotCacheIdVersion',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}dataModel': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_DataModel',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}pivotTableData': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_PivotTableData',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}dataField': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_DataField',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}survey': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_Survey',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}timelines': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_Timelines',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}timelineCacheDefinition': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/main}CT_TimelineCacheDefinition',
+    '{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}wpc': '{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}CT_WordprocessingCanvas',
+    '{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}wgp': '{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}CT_WordprocessingGroup',
+    '{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}wsp': '{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}CT_WordprocessingShape',
+    '{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}inline': '{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}CT_Inline',
+    '{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}anchor': '{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}CT_Anchor',
+    '{http://schemas.microsoft.com/office/drawing/2012/timeslicer}timeslicer': '{http://schemas.microsoft.com/office/drawing/2012/timeslicer}CT_Timeline',
+    '{http://schemas.openxmlformats.org/drawingml/2006/diagram}colorsDef': '{http://schemas.openxmlformats.org/drawingml/2006/diagram}CT_ColorTransform',
+    '{http://schemas.openxmlformats.org/drawingml/2006/diagram}colorsDefHdr': '{http://schemas.openxmlformats.org/drawingml/2006/diagram}CT_ColorTransformHeader',
+    '{http://schemas.openxmlformats.org/drawingml/2006/diagram}colorsDefHdrLst': '{http://schemas.openxmlformats.org/drawingml/2006/diagram}CT_ColorTransformHeaderLst',
+    '{http://schemas.openxmlformats.org/drawingml/2006/diagram}dataModel': '{http://schemas.openxmlformats.org/drawingml/2006/diagram}CT_DataModel',
+    '{http://schemas.openxmlformats.org/drawingml/2006/diagram}layoutDef': '{http://schemas.openxmlformats.org/drawingml/2006/diagram}CT_DiagramDefinition',
+    '{http://schemas.openxmlformats.org/drawingml/2006/diagram}layoutDefHdr': '{http://schemas.openxmlformats.org/drawingml/2006/diagram}CT_DiagramDefinitionHeader',
+    '{http://schemas.openxmlformats.org/drawingml/2006/diagram}layoutDefHdrLst': '{http://schemas.openxmlformats.org/drawingml/2006/diagram}CT_DiagramDefinitionHeaderLst',
+    '{http://schemas.openxmlformats.org/drawingml/2006/diagram}relIds': '{http://schemas.openxmlformats.org/drawingml/2006/diagram}CT_RelIds',
+    '{http://schemas.openxmlformats.org/drawingml/2006/diagram}styleDef': '{http://schemas.openxmlformats.org/drawingml/2006/diagram}CT_StyleDefinition',
+    '{http://schemas.openxmlformats.org/drawingml/2006/diagram}styleDefHdr': '{http://schemas.openxmlformats.org/drawingml/2006/diagram}CT_StyleDefinitionHeader',
+    '{http://schemas.openxmlformats.org/drawingml/2006/diagram}styleDefHdrLst': '{http://schemas.openxmlformats.org/drawingml/2006/diagram}CT_StyleDefinitionHeaderLst',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/bibliography}Sources': '{http://schemas.openxmlformats.org/officeDocument/2006/bibliography}CT_Sources',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2011/1/ac}list': '{http://www.w3.org/2001/XMLSchema}anyType',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata}rvData': '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata}CT_RichValueData',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata}rvStructures': '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata}CT_RichValueStructures',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata}rvb': '{http://schemas.microsoft.com/office/spreadsheetml/2017/richdata}CT_RichValueBlock',
+    '{http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing}from': '{http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing}CT_Marker',
+    '{http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing}to': '{http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing}CT_Marker',
+    '{http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing}wsDr': '{http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing}CT_Drawing',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/custom-properties}Properties': '{http://schemas.openxmlformats.org/officeDocument/2006/custom-properties}CT_Properties',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/characteristics}additionalCharacteristics': '{http://schemas.openxmlformats.org/officeDocument/2006/characteristics}CT_AdditionalCharacteristics',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}variant': '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}CT_Variant',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}vector': '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}CT_Vector',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}array': '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}CT_Array',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}blob': '{http://www.w3.org/2001/XMLSchema}base64Binary',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}oblob': '{http://www.w3.org/2001/XMLSchema}base64Binary',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}empty': '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}CT_Empty',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}null': '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}CT_Null',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}i1': '{http://www.w3.org/2001/XMLSchema}byte',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}i2': '{http://www.w3.org/2001/XMLSchema}short',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}i4': '{http://www.w3.org/2001/XMLSchema}int',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}i8': '{http://www.w3.org/2001/XMLSchema}long',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}int': '{http://www.w3.org/2001/XMLSchema}int',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}ui1': '{http://www.w3.org/2001/XMLSchema}unsignedByte',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}ui2': '{http://www.w3.org/2001/XMLSchema}unsignedShort',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}ui4': '{http://www.w3.org/2001/XMLSchema}unsignedInt',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}ui8': '{http://www.w3.org/2001/XMLSchema}unsignedLong',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}uint': '{http://www.w3.org/2001/XMLSchema}unsignedInt',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}r4': '{http://www.w3.org/2001/XMLSchema}float',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}r8': '{http://www.w3.org/2001/XMLSchema}double',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}decimal': '{http://www.w3.org/2001/XMLSchema}decimal',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}lpstr': '{http://www.w3.org/2001/XMLSchema}string',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}lpwstr': '{http://www.w3.org/2001/XMLSchema}string',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}bstr': '{http://www.w3.org/2001/XMLSchema}string',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}date': '{http://www.w3.org/2001/XMLSchema}dateTime',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}filetime': '{http://www.w3.org/2001/XMLSchema}dateTime',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}bool': '{http://www.w3.org/2001/XMLSchema}boolean',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}cy': '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}ST_Cy',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}error': '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}ST_Error',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}stream': '{http://www.w3.org/2001/XMLSchema}base64Binary',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}ostream': '{http://www.w3.org/2001/XMLSchema}base64Binary',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}storage': '{http://www.w3.org/2001/XMLSchema}base64Binary',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}ostorage': '{http://www.w3.org/2001/XMLSchema}base64Binary',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}vstream': '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}CT_Vstream',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes}clsid': '{http://schemas.openxmlformats.org/officeDocument/2006/sharedTypes}ST_Guid',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2019/namedsheetviews}namedSheetViews': '{http://schemas.microsoft.com/office/spreadsheetml/2019/namedsheetviews}CT_NamedSheetViews',
+    '{http://schemas.microsoft.com/office/excel/2006/main}f': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}ST_Formula',
+    '{http://schemas.microsoft.com/office/excel/2006/main}ref': '{http://schemas.microsoft.com/office/excel/2006/main}CT_Ref',
+    '{http://schemas.microsoft.com/office/excel/2006/main}sqref': '{http://schemas.microsoft.com/office/excel/2006/main}CT_Sqref',
+    '{http://schemas.microsoft.com/office/drawing/2010/slicer}slicer': '{http://schemas.microsoft.com/office/drawing/2010/slicer}CT_Slicer',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2014/revision}revisionPtr': '{http://schemas.microsoft.com/office/spreadsheetml/2014/revision}CT_RevisionPtr',
+    '{http://schemas.microsoft.com/office/drawing/2010/main}m': '{http://schemas.microsoft.com/office/drawing/2010/main}CT_TextMath',
+    '{http://schemas.microsoft.com/office/drawing/2010/main}cameraTool': '{http://schemas.microsoft.com/office/drawing/2010/main}CT_CameraTool',
+    '{http://schemas.microsoft.com/office/drawing/2010/main}compatExt': '{http://schemas.microsoft.com/office/drawing/2010/main}CT_CompatExt',
+    '{http://schemas.microsoft.com/office/drawing/2010/main}isCanvas': '{http://schemas.microsoft.com/office/drawing/2010/main}CT_IsGvmlCanvas',
+    '{http://schemas.microsoft.com/office/drawing/2010/main}contentPart': '{http://schemas.microsoft.com/office/drawing/2010/main}CT_GvmlContentPart',
+    '{http://schemas.microsoft.com/office/drawing/2010/main}shadowObscured': '{http://schemas.microsoft.com/office/drawing/2010/main}CT_ShadowObscured',
+    '{http://schemas.microsoft.com/office/drawing/2010/main}hiddenFill': '{http://schemas.openxmlformats.org/drawingml/2006/main}CT_FillProperties',
+    '{http://schemas.microsoft.com/office/drawing/2010/main}hiddenLine': '{http://schemas.openxmlformats.org/drawingml/2006/main}CT_LineProperties',
+    '{http://schemas.microsoft.com/office/drawing/2010/main}hiddenEffects': '{http://schemas.openxmlformats.org/drawingml/2006/main}CT_EffectProperties',
+    '{http://schemas.microsoft.com/office/drawing/2010/main}hiddenScene3d': '{http://schemas.openxmlformats.org/drawingml/2006/main}CT_Scene3D',
+    '{http://schemas.microsoft.com/office/drawing/2010/main}hiddenSp3d': '{http://schemas.openxmlformats.org/drawingml/2006/main}CT_Shape3D',
+    '{http://schemas.microsoft.com/office/drawing/2010/main}imgProps': '{http://schemas.microsoft.com/office/drawing/2010/main}CT_Photo',
+    '{http://schemas.microsoft.com/office/drawing/2010/main}useLocalDpi': '{http://schemas.microsoft.com/office/drawing/2010/main}CT_UseLocalDpi',
+    '{http://schemas.openxmlformats.org/schemaLibrary/2006/main}schemaLibrary': '{http://schemas.openxmlformats.org/schemaLibrary/2006/main}CT_SchemaLibrary',
+    '{http://schemas.openxmlformats.org/presentationml/2006/main}cmAuthorLst': '{http://schemas.openxmlformats.org/presentationml/2006/main}CT_CommentAuthorList',
+    '{http://schemas.openxmlformats.org/presentationml/2006/main}cmLst': '{http://schemas.openxmlformats.org/presentationml/2006/main}CT_CommentList',
+    '{http://schemas.openxmlformats.org/presentationml/2006/main}oleObj': '{http://schemas.openxmlformats.org/presentationml/2006/main}CT_OleObject',
+    '{http://schemas.openxmlformats.org/presentationml/2006/main}presentation': '{http://schemas.openxmlformats.org/presentationml/2006/main}CT_Presentation',
+    '{http://schemas.openxmlformats.org/presentationml/2006/main}presentationPr': '{http://schemas.openxmlformats.org/presentationml/2006/main}CT_PresentationProperties',
+    '{http://schemas.openxmlformats.org/presentationml/2006/main}sld': '{http://schemas.openxmlformats.org/presentationml/2006/main}CT_Slide',
+    '{http://schemas.openxmlformats.org/presentationml/2006/main}sldLayout': '{http://schemas.openxmlformats.org/presentationml/2006/main}CT_SlideLayout',
+    '{http://schemas.openxmlformats.org/presentationml/2006/main}sldMaster': '{http://schemas.openxmlformats.org/presentationml/2006/main}CT_SlideMaster',
+    '{http://schemas.openxmlformats.org/presentationml/2006/main}handoutMaster': '{http://schemas.openxmlformats.org/presentationml/2006/main}CT_HandoutMaster',
+    '{http://schemas.openxmlformats.org/presentationml/2006/main}notesMaster': '{http://schemas.openxmlformats.org/presentationml/2006/main}CT_NotesMaster',
+    '{http://schemas.openxmlformats.org/presentationml/2006/main}notes': '{http://schemas.openxmlformats.org/presentationml/2006/main}CT_NotesSlide',
+    '{http://schemas.openxmlformats.org/presentationml/2006/main}sldSyncPr': '{http://schemas.openxmlformats.org/presentationml/2006/main}CT_SlideSyncProperties',
+    '{http://schemas.openxmlformats.org/presentationml/2006/main}tagLst': '{http://schemas.openxmlformats.org/presentationml/2006/main}CT_TagList',
+    '{http://schemas.openxmlformats.org/presentationml/2006/main}viewPr': '{http://schemas.openxmlformats.org/presentationml/2006/main}CT_ViewProperties',
+    '{http://schemas.openxmlformats.org/wordprocessingml/main}recipients': '{http://schemas.openxmlformats.org/wordprocessingml/main}CT_Recipients',
+    '{http://schemas.openxmlformats.org/wordprocessingml/main}comments': '{http://schemas.openxmlformats.org/wordprocessingml/main}CT_Comments',
+    '{http://schemas.openxmlformats.org/wordprocessingml/main}footnotes': '{http://schemas.openxmlformats.org/wordprocessingml/main}CT_Footnotes',
+    '{http://schemas.openxmlformats.org/wordprocessingml/main}endnotes': '{http://schemas.openxmlformats.org/wordprocessingml/main}CT_Endnotes',
+    '{http://schemas.openxmlformats.org/wordprocessingml/main}hdr': '{http://schemas.openxmlformats.org/wordprocessingml/main}CT_HdrFtr',
+    '{http://schemas.openxmlformats.org/wordprocessingml/main}ftr': '{http://schemas.openxmlformats.org/wordprocessingml/main}CT_HdrFtr',
+    '{http://schemas.openxmlformats.org/wordprocessingml/main}settings': '{http://schemas.openxmlformats.org/wordprocessingml/main}CT_Settings',
+    '{http://schemas.openxmlformats.org/wordprocessingml/main}webSettings': '{http://schemas.openxmlformats.org/wordprocessingml/main}CT_WebSettings',
+    '{http://schemas.openxmlformats.org/wordprocessingml/main}fonts': '{http://schemas.openxmlformats.org/wordprocessingml/main}CT_FontsList',
+    '{http://schemas.openxmlformats.org/wordprocessingml/main}numbering': '{http://schemas.openxmlformats.org/wordprocessingml/main}CT_Numbering',
+    '{http://schemas.openxmlformats.org/wordprocessingml/main}styles': '{http://schemas.openxmlformats.org/wordprocessingml/main}CT_Styles',
+    '{http://schemas.openxmlformats.org/wordprocessingml/main}document': '{http://schemas.openxmlformats.org/wordprocessingml/main}CT_Document',
+    '{http://schemas.openxmlformats.org/wordprocessingml/main}glossaryDocument': '{http://schemas.openxmlformats.org/wordprocessingml/main}CT_GlossaryDocument',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2017/dynamicarray}dynamicArrayProperties': '{http://schemas.microsoft.com/office/spreadsheetml/2017/dynamicarray}CT_DynamicArrayProperties',
+    '{http://schemas.openxmlformats.org/drawingml/2006/main}videoFile': '{http://schemas.openxmlformats.org/drawingml/2006/main}CT_VideoFile',
+    '{http://schemas.openxmlformats.org/drawingml/2006/main}graphic': '{http://schemas.openxmlformats.org/drawingml/2006/main}CT_GraphicalObject',
+    '{http://schemas.openxmlformats.org/drawingml/2006/main}blip': '{http://schemas.openxmlformats.org/drawingml/2006/main}CT_Blip',
+    '{http://schemas.openxmlformats.org/drawingml/2006/main}theme': '{http://schemas.openxmlformats.org/drawingml/2006/main}CT_OfficeStyleSheet',
+    '{http://schemas.openxmlformats.org/drawingml/2006/main}themeOverride': '{http://schemas.openxmlformats.org/drawingml/2006/main}CT_BaseStylesOverride',
+    '{http://schemas.openxmlformats.org/drawingml/2006/main}themeManager': '{http://schemas.openxmlformats.org/drawingml/2006/main}CT_EmptyElement',
+    '{http://schemas.openxmlformats.org/drawingml/2006/main}tbl': '{http://schemas.openxmlformats.org/drawingml/2006/main}CT_Table',
+    '{http://schemas.openxmlformats.org/drawingml/2006/main}tblStyleLst': '{http://schemas.openxmlformats.org/drawingml/2006/main}CT_TableStyleList',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2018/calcfeatures}calcFeatures': '{http://schemas.microsoft.com/office/spreadsheetml/2018/calcfeatures}CT_CalcFeatures',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}slicerCacheDefinition': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_SlicerCacheDefinition',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}conditionalFormattings': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_ConditionalFormattings',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}dataValidations': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_DataValidations',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}sparklineGroups': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_SparklineGroups',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}slicerList': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_SlicerRefs',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}protectedRanges': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_ProtectedRanges',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}ignoredErrors': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_IgnoredErrors',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}pivotCaches': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_PivotCaches',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}slicerCaches': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_SlicerCaches',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}workbookPr': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_WorkbookPr',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}calculatedMember': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_CalculatedMember',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}cacheHierarchy': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_CacheHierarchy',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}dataField': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_DataField',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}pivotField': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_PivotField',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}pivotTableDefinition': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_PivotTableDefinition',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}pivotCacheDefinition': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_PivotCacheDefinition',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}connection': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_Connection',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}table': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_Table',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}slicerStyles': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_SlicerStyles',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}dxfs': '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_Dxfs',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}oleItem': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_OleItem',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}pivotHierarchy': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_PivotHierarchy',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}cacheField': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_CacheField',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}id': '{http://www.w3.org/2001/XMLSchema}anyType',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}iconFilter': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_IconFilter',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}filter': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_Filter',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}customFilters': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_CustomFilters',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}sortCondition': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_SortCondition',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}sourceConnection': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_SourceConnection',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}datastoreItem': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_DatastoreItem',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}formControlPr': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_FormControlPr',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}slicers': '{http://schemas.microsoft.com/office/spreadsheetml/2009/9/main}CT_Slicers',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/math}mathPr': '{http://schemas.openxmlformats.org/officeDocument/2006/math}CT_MathPr',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/math}oMathPara': '{http://schemas.openxmlformats.org/officeDocument/2006/math}CT_OMathPara',
+    '{http://schemas.openxmlformats.org/officeDocument/2006/math}oMath': '{http://schemas.openxmlformats.org/officeDocument/2006/math}CT_OMath',
+    '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/ac}absPath': '{http://schemas.microsoft.com/office/spreadsheetml/2010/11/ac}CT_AbsolutePath',
+}
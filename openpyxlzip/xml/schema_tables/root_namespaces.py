@@ -0,0 +1,40 @@
+# Generated by openpyxlzip/xml/schemas/build_schemas.py
+
+ROOT_NAMESPACES = [
+    'http://schemas.microsoft.com/office/spreadsheetml/2017/richdata2',
+    'http://schemas.openxmlformats.org/officeDocument/2006/extended-properties',
+    'http://schemas.openxmlformats.org/drawingml/2006/picture',
+    'http://schemas.microsoft.com/office/spreadsheetml/2016/pivotdefaultlayout',
+    'http://schemas.microsoft.com/office/spreadsheetml/2014/11/main',
+    'http://schemas.openxmlformats.org/drawingml/2006/chart',
+    'http://schemas.openxmlformats.org/officeDocument/2006/customXml',
+    'http://schemas.microsoft.com/office/excel/2010/spreadsheetDrawing',
+    'http://schemas.microsoft.com/office/spreadsheetml/2020/richvaluerefresh',
+    'http://schemas.openxmlformats.org/spreadsheetml/2006/main',
+    'http://schemas.microsoft.com/office/spreadsheetml/2018/threadedcomments',
+    'http://schemas.microsoft.com/office/spreadsheetml/2010/11/main',
+    'http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing',
+    'http://schemas.microsoft.com/office/drawing/2012/timeslicer',
+    'http://schemas.openxmlformats.org/drawingml/2006/diagram',
+    'http://schemas.openxmlformats.org/officeDocument/2006/bibliography',
+    'xl12AcSchemaUri',
+    'http://schemas.microsoft.com/office/spreadsheetml/2017/richdata',
+    'http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing',
+    'http://schemas.openxmlformats.org/officeDocument/2006/custom-properties',
+    'http://schemas.openxmlformats.org/officeDocument/2006/characteristics',
+    'http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes',
+    'http://schemas.microsoft.com/office/spreadsheetml/2019/namedsheetviews',
+    'http://schemas.microsoft.com/office/excel/2006/main',
+    'http://schemas.microsoft.com/office/drawing/2010/slicer',
+    'http://schemas.microsoft.com/office/spreadsheetml/2014/revision',
+    'http://schemas.microsoft.com/office/drawing/2010/main',
+    'http://schemas.openxmlformats.org/schemaLibrary/2006/main',
+    'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'http://schemas.openxmlformats.org/wordprocessingml/main',
+    'http://schemas.microsoft.com/office/spreadsheetml/2017/dynamicarray',
+    'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'http://schemas.microsoft.com/office/spreadsheetml/2018/calcfeatures',
+    'http://schemas.microsoft.com/office/spreadsheetml/2009/9/main',
+    'http://schemas.openxmlformats.org/officeDocument/2006/math',
+    'http://schemas.microsoft.com/office/spreadsheetml/2010/11/ac',
+]
@@ -97,20 +97,31 @@ with open(os.path.join(data_path, "root_attrs.json"), "w") as outfile:
 with open(os.path.join(data_path, "root_elems.json"), "w") as outfile:
     json.dump(global_elem, outfile, indent=4)
 
-with open(os.path.join(parent_path, "schema.py"), "w") as outfile:
-    outfile.write("import json\n\n\n")
-    outfile.write("ALL_DEFINITIONS = json.loads(\"\"\"\n")
-    outfile.write(json.dumps(all_definitions, indent=4))
-    outfile.write("\"\"\")\n")
-    outfile.write("ALL_NAMESPACES_PREFIXES = json.loads(\"\"\"\n")
-    outfile.write(json.dumps(all_namespaces_prefixes, indent=4))
-    outfile.write("\"\"\")\n")
-    outfile.write("ROOT_NAMESPACES = json.loads(\"\"\"\n")
-    outfile.write(json.dumps(root_namespaces, indent=4))
-    outfile.write("\"\"\")\n")
-    outfile.write("ROOT_ATTRS = json.loads(\"\"\"\n")
-    outfile.write(json.dumps(global_attr, indent=4))
-    outfile.write("\"\"\")\n")
-    outfile.write("ROOT_ELEMS = json.loads(\"\"\"\n")
-    outfile.write(json.dumps(global_elem, indent=4))
-    outfile.write("\"\"\")\n")
+def format_table(table):
+    """
+    Python source for a table with one entry per line
+    """
+    if isinstance(table, dict):
+        lines = ["    %r: %r," % item for item in table.items()]
+        return "{\n%s\n}" % "\n".join(lines)
+    lines = ["    %r," % item for item in table]
+    return "[\n%s\n]" % "\n".join(lines)
+
+
+TABLES = (
+    ("ALL_DEFINITIONS", "all_definitions", all_definitions),
+    ("ALL_NAMESPACES_PREFIXES", "all_namespaces_prefixes", all_namespaces_prefixes),
+    ("ROOT_NAMESPACES", "root_namespaces", root_namespaces),
+    ("ROOT_ATTRS", "root_attrs", global_attr),
+    ("ROOT_ELEMS", "root_elems", global_elem),
+)
+
+# One module per table: the bytecode cache keeps them precompiled and
+# openpyxlzip.xml.schema only imports a table when it is first used
+tables_path = os.path.join(parent_path, "schema_tables")
+for name, module, table in TABLES:
+    # round trip through json so that keys match the json files
+    table = json.loads(json.dumps(table))
+    with open(os.path.join(tables_path, module + ".py"), "w") as outfile:
+        outfile.write("# Generated by openpyxlzip/xml/schemas/build_schemas.py\n\n")
+        outfile.write("%s = %s\n" % (name, format_table(table)))
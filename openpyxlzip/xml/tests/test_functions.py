@@ -70,3 +70,18 @@ def test_iterparse(xml_input):
     f = BytesIO(xml_input)
     with pytest.raises(ValueError):
         fromstring(f)
+
+
+@pytest.mark.lxml_required
+@pytest.mark.parametrize("compact_xml, expected",
+                         [
+                             (False, b"<root>\n  <child/>\n</root>\n"),
+                             (True, b"<root><child/></root>"),
+                         ]
+                         )
+def test_tostring_part(compact_xml, expected):
+    from ..functions import tostring_part, Element, SubElement
+    root = Element("root")
+    SubElement(root, "child")
+    xml = tostring_part(root, compact_xml)
+    assert xml == b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n" + expected
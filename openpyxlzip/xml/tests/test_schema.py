@@ -0,0 +1,38 @@
+# Copyright (c) 2010-2020 openpyxlzip
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def test_import_does_not_load_tables():
+    import openpyxlzip
+    root = os.path.dirname(os.path.dirname(openpyxlzip.__file__))
+    code = "import sys, openpyxlzip; print([m for m in sys.modules if 'schema_tables.' in m])"
+    out = subprocess.check_output([sys.executable, "-c", code], cwd=root)
+    assert out.strip() == b"[]"
+
+
+def test_lookup():
+    from .. import schema
+    root = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}workbook"
+    table = schema.get_table("ROOT_ELEMS")
+    assert table[root] == "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_Workbook"
+    assert schema.get_table("ROOT_ELEMS") is table
+
+
+def test_tables():
+    from ..schema import get_table
+    assert get_table("ALL_NAMESPACES_PREFIXES")["r"] == "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+    assert "http://schemas.openxmlformats.org/spreadsheetml/2006/main" in get_table("ROOT_NAMESPACES")
+    assert get_table("ROOT_ATTRS")["chart"] == "{http://www.w3.org/2001/XMLSchema}unsignedInt"
+    workbook = get_table("ALL_DEFINITIONS")["{http://schemas.openxmlformats.org/spreadsheetml/2006/main}CT_Workbook"]
+    assert set(workbook) == {"attributes", "element_order"}
+
+
+def test_unknown_table():
+    from ..schema import get_table
+    with pytest.raises(KeyError):
+        get_table("NO_SUCH_TABLE")